@@ -14,6 +14,12 @@ import pygame
 
 from . import __version__
 from .config import Settings, load_settings
+from .core.scheduler import FrameScheduler
+from .core.standby import Standby
+from .display.change import FrameChangeDetector
+from .perf.profiler import FrameProfiler
+from .perf.trace import Tracer, set_tracer, span
+from .render.color import ColorPipeline
 
 os.environ["SDL_VIDEO_CENTERED"] = "1"
 
@@ -34,31 +40,121 @@ def _build_parser() -> argparse.ArgumentParser:
     parser.add_argument("--version", action="version", version=f"%(prog)s {__version__}")
     parser.add_argument(
         "--backend",
-        choices=["emulator", "hardware"],
+        choices=["emulator", "native", "hardware", "null", "record", "ddp"],
         default="emulator",
-        help="Display backend (default: emulator)",
+        help="Display backend (default: emulator; null discards, record writes a frame ring)",
     )
     parser.add_argument(
         "--test-pattern",
         action="store_true",
         help="Draw labelled colour bars per segment to verify wiring",
     )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Enable the per-stage frame profiler (logs rolling percentiles)",
+    )
+    parser.add_argument(
+        "--trace",
+        type=Path,
+        default=None,
+        metavar="PATH",
+        help="Record a Chrome/Perfetto trace of the first --trace-seconds to PATH",
+    )
+    parser.add_argument(
+        "--trace-seconds",
+        type=float,
+        default=None,
+        help="Length of the trace window in seconds (default: tracing.duration)",
+    )
     parser.add_argument(
         "--config-dir",
         type=Path,
         default=None,
         help="Directory containing settings files (default: cwd)",
     )
-    return parser
+    parser.add_argument(
+        "--bench-scene",
+        type=Path,
+        default=None,
+        metavar="SCENE",
+        help="Run SCENE unthrottled against a null display and print a stage breakdown",
+    )
+    parser.add_argument(
+        "--bench-frames",
+        type=int,
+        default=900,
+        help="Frames to run in --bench-scene mode (default: 900)",
+    )
+    parser.add_argument(
+        "--bench-ha-interval",
+        type=int,
+        default=30,
+        help="Frames between synthetic HA entity changes in --bench-scene mode",
+    )
+    parser.add_argument(
+        "--bench-notify",
+        action="store_true",
+        help="Keep a synthetic notification banner on screen in --bench-scene mode",
+    )
+    subparsers = parser.add_subparsers(dest="command")
+    bench = subparsers.add_parser(
+        "bench",
+        help="Benchmark procedural effects headlessly",
+        description="Run procedural effects headlessly and report per-frame cost",
+    )
+    from .perf.bench import add_arguments as add_bench_arguments
 
+    add_bench_arguments(bench)
+    return parser
 
-def _create_display(settings, backend: str):
-    from .display.emulator import EmulatorDisplay
-    from .display.hardware import HardwareDisplay
 
+def _create_display(settings, backend: str, mirrors: list | None = None):
     if backend == "hardware":
-        return HardwareDisplay(settings)
-    return EmulatorDisplay(settings)
+        from .display.hardware import HardwareDisplay
+
+        display = HardwareDisplay(settings)
+    elif backend == "native":
+        from .display.native import NativeDisplay
+
+        display = NativeDisplay(settings)
+    elif backend == "null":
+        from .display.null import NullDisplay
+
+        display = NullDisplay(settings)
+    elif backend == "record":
+        from .display.record import RecordDisplay
+
+        display = RecordDisplay(settings)
+    elif backend == "ddp":
+        from .display.ddp import DdpDisplay
+
+        display = DdpDisplay(settings)
+    else:
+        from .display.emulator import EmulatorDisplay
+
+        display = EmulatorDisplay(settings)
+    pipeline = settings.display.pipeline
+    if pipeline is None:
+        pipeline = backend == "hardware"
+    if pipeline:
+        from .display.pipeline import PipelinedDisplay
+
+        display = PipelinedDisplay(display, mode=settings.display.pipeline_mode)
+    mirrors = list(mirrors or [])
+    if settings.ddp.enabled and backend != "ddp":
+        from .display.ddp import DdpDisplay
+
+        mirrors.append(DdpDisplay(settings))
+    if settings.shm.enabled:
+        from .display.shm import SharedMemoryDisplay
+
+        mirrors.append(SharedMemoryDisplay(settings))
+    if mirrors:
+        from .display.fanout import FanoutDisplay
+
+        display = FanoutDisplay([display, *mirrors])
+    return display
 
 
 def _draw_test_pattern(surface: pygame.Surface, settings) -> None:
@@ -84,6 +180,20 @@ def _start_ha(settings: Settings, entity_ids: list[str]):
     return svc
 
 
+def _create_tracer(settings: Settings, args) -> Tracer | None:
+    trace_cfg = settings.tracing
+    if not (trace_cfg.enabled or args.trace):
+        return None
+    tracer = Tracer(
+        path=args.trace or trace_cfg.path,
+        duration=args.trace_seconds if args.trace_seconds is not None else trace_cfg.duration,
+        max_events=trace_cfg.max_events,
+    )
+    set_tracer(tracer)
+    tracer.start()
+    return tracer
+
+
 class DisplayState:
     def __init__(
         self,
@@ -99,8 +209,11 @@ class DisplayState:
         self.widgets = widgets
         self.brightness = brightness
         self.master_on: bool = True
-        self.master_level: float = 1.0
         self.notification: dict | None = None
+        self.profile_capture: Any = None
+        self.standby: Any = None
+        self.preview: Any = None
+        self.retired: list = []
 
 
 def _build_scene(settings: Settings):
@@ -125,6 +238,7 @@ def _build_scene(settings: Settings):
     brightness = BrightnessManager(
         background=BrightnessConfig(default=settings.brightness.background.default),
         foreground=BrightnessConfig(default=settings.brightness.foreground.default),
+        master=BrightnessConfig(default=settings.brightness.master.default),
     )
     entity_ids = collect_entity_ids(scene)
     state = DisplayState(scene, palettes, background, widgets, brightness)
@@ -136,6 +250,71 @@ def _build_scene(settings: Settings):
     return state, entity_ids
 
 
+def _render_frame(
+    screen: pygame.Surface,
+    state: DisplayState,
+    ha_service: Any,
+    dt: float,
+    profiler: FrameProfiler,
+) -> tuple | None:
+    screen.fill((0, 0, 0))
+    if not state.master_on:
+        return ("off",)
+
+    profiler.stage("brightness")
+    state.brightness.update(dt)
+
+    profiler.stage("background_update")
+    state.background.update(dt)
+    static = state.background.static
+    profiler.stage("background_render")
+    state.background.render(screen)
+
+    bg_level = state.brightness.background_level
+    if bg_level < 1.0:
+        profiler.stage("dim")
+        level = int(255 * bg_level)
+        screen.fill((level, level, level), special_flags=pygame.BLEND_RGB_MULT)
+
+    profiler.stage("widgets_update")
+    if ha_service:
+        from .widgets.tile_grid import TileGridWidget
+
+        for widget in state.widgets:
+            if isinstance(widget, TileGridWidget):
+                widget.set_state(ha_service.snapshot)
+
+    fg_level = state.brightness.foreground_level
+    redrawn = False
+    for widget in state.widgets:
+        profiler.stage("widgets_update")
+        widget.update(dt)
+        profiler.stage("widgets_render")
+        with span(type(widget).__name__, "widget"):
+            widget.render(screen, brightness=fg_level)
+        redrawn = redrawn or widget.redrawn
+
+    if not static or redrawn:
+        return None
+    visible = tuple(widget.visible for widget in state.widgets)
+    return (id(state.background), bg_level, fg_level, state.brightness.master_level, visible)
+
+
+def _close_retired(state: DisplayState) -> None:
+    while state.retired:
+        state.retired.pop().close()
+
+
+def _quit_requested() -> bool:
+    quit_requested = False
+    for event in pygame.event.get():
+        if event.type == pygame.QUIT:
+            quit_requested = True
+        elif event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
+            quit_requested = True
+    return quit_requested
+
+
 async def run_loop(
     screen: pygame.Surface,
     display: Any,
@@ -145,63 +324,102 @@ async def run_loop(
     settings: Settings,
     test_pattern: bool,
     stop_event: asyncio.Event,
+    profiler: FrameProfiler | None = None,
+    max_frames: int | None = None,
+    throttle: bool = True,
 ) -> None:
-    w = settings.display.canvas.width
-    h = settings.display.canvas.height
-    fps = settings.general.fps
-    frame_time = 1.0 / fps
+    general = settings.general
+    frame_time = 1.0 / general.fps
+    scheduler = FrameScheduler(
+        general.fps,
+        policy=general.frame_policy,
+        max_dt=general.max_frame_dt,
+    )
+    changes = FrameChangeDetector() if settings.display.skip_unchanged else None
+    color = ColorPipeline.from_settings(settings)
+    standby: Standby | None = None
+    if settings.standby.enabled and not test_pattern:
+        standby = Standby(settings.standby.interval, clear=settings.standby.clear)
+        standby.bind()
+        state.standby = standby
     running = True
+    frames = 0
+    if profiler is None:
+        profiler = FrameProfiler(enabled=False)
 
     while running and not stop_event.is_set():
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                running = False
-            elif event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
-                running = False
+        if state.profile_capture is not None:
+            state.profile_capture.tick()
+        if standby is not None and not state.master_on:
+            if not standby.active:
+                standby.enter()
+                screen.fill((0, 0, 0))
+                if changes is None or changes.changed(screen):
+                    display.present(screen)
+                if standby.clear:
+                    display.clear()
+            elif display.wants_frame:
+                display.present(screen)
+            else:
+                display.idle()
+            _close_retired(state)
+            running = not _quit_requested()
+            profiler.idle()
+            await standby.wait()
+            continue
+        if standby is not None and standby.active:
+            standby.leave()
+            scheduler.reset()
+            if changes is not None:
+                changes.reset()
+
+        dt = scheduler.begin_frame() if throttle else frame_time
+        profiler.begin_frame()
+        profiler.stage("events")
+        if _quit_requested():
+            running = False
 
         if mqtt_service:
+            profiler.stage("commands")
             await mqtt_service.drain_commands(state)
 
-        frame_start = time.monotonic()
-
         if test_pattern:
             _draw_test_pattern(screen, settings)
-        elif not state.master_on:
-            screen.fill((0, 0, 0))
+            clean_key = ("test_pattern",)
         else:
-            screen.fill((0, 0, 0))
-
-            state.brightness.update(frame_time)
-
-            state.background.update(frame_time)
-            state.background.render(screen)
-
-            bg_level = state.brightness.background_level
-            if bg_level < 1.0:
-                overlay = pygame.Surface((w, h), pygame.SRCALPHA)
-                overlay.fill((0, 0, 0, int(255 * (1.0 - bg_level))))
-                screen.blit(overlay, (0, 0))
-
-            if ha_service:
-                from .widgets.tile_grid import TileGridWidget
-
-                for widget in state.widgets:
-                    if isinstance(widget, TileGridWidget):
-                        widget.set_state(ha_service.snapshot)
-
-            fg_level = state.brightness.foreground_level
-            for widget in state.widgets:
-                widget.update(frame_time)
-                widget.render(screen, brightness=fg_level)
-
-        display.present(screen)
-
-        elapsed = time.monotonic() - frame_start
-        sleep_time = max(0, frame_time - elapsed)
-        if sleep_time > 0:
-            await asyncio.sleep(sleep_time)
+            clean_key = _render_frame(screen, state, ha_service, dt, profiler)
+            profiler.stage("color")
+            color.set_brightness(state.brightness.master_level, display)
+            color.apply(screen)
+
+        profiler.stage("diff")
+        if changes is None or changes.changed(screen, clean_key) or display.wants_frame:
+            profiler.stage("present")
+            display.present(screen)
         else:
+            display.idle()
+        _close_retired(state)
+        profiler.end_frame(state.background.active_name if state.master_on else "off")
+
+        frames += 1
+        if max_frames is not None and frames >= max_frames:
+            break
+        if not throttle:
             await asyncio.sleep(0)
+            continue
+
+        await asyncio.sleep(scheduler.end_frame())
+
+    scheduler.log_summary()
+    if changes is not None:
+        changes.log_summary()
+    if standby is not None:
+        if standby.active:
+            standby.leave()
+        if standby.entered:
+            logger.info(
+                "Standby: entered %d times, %.1fs total", standby.entered, standby.total_time
+            )
 
 
 async def async_main(args) -> None:
@@ -214,19 +432,30 @@ async def async_main(args) -> None:
 
     logger.info("wideboy v%s starting (backend=%s)", __version__, args.backend)
 
+    if args.backend in ("null", "record", "ddp"):
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
     pygame.init()
     pygame.mixer.quit()
 
     w = settings.display.canvas.width
     h = settings.display.canvas.height
-    screen = pygame.display.set_mode((w, h), pygame.SRCALPHA)
-    pygame.display.set_caption(f"wideboy v{__version__}")
+    if args.backend == "native":
+        screen = pygame.Surface((w, h), pygame.SRCALPHA)
+    else:
+        screen = pygame.display.set_mode((w, h), pygame.SRCALPHA)
+
+    preview = None
+    if settings.preview.enabled:
+        from .display.preview import PreviewDisplay
 
-    display = _create_display(settings, args.backend)
+        preview = PreviewDisplay(settings)
+    display = _create_display(settings, args.backend, [preview] if preview else None)
     display.start()
+    pygame.display.set_caption(f"wideboy v{__version__}")
 
     state, entity_ids = _build_scene(settings)
 
+    state.preview = preview
     ha_service = _start_ha(settings, entity_ids)
 
     mqtt_service = None
@@ -235,6 +464,44 @@ async def async_main(args) -> None:
 
         mqtt_service = MqttHassService(settings.mqtt, state, settings)
         await mqtt_service.connect()
+        if preview is not None:
+            preview.on_snapshot = mqtt_service.publish_snapshot_result
+
+    from .perf.capture import ProfileCapture
+
+    state.profile_capture = ProfileCapture(
+        directory=settings.profiling.capture_dir,
+        max_duration=settings.profiling.capture_max_duration,
+        top=settings.profiling.capture_top,
+        on_complete=mqtt_service.publish_profile_result if mqtt_service else None,
+        on_status=mqtt_service.publish_profile_status if mqtt_service else None,
+    )
+
+    tracer = _create_tracer(settings, args)
+    prof_cfg = settings.profiling
+    profiler = FrameProfiler(
+        enabled=prof_cfg.enabled or args.profile,
+        window=prof_cfg.window,
+        effect_window=prof_cfg.effect_window,
+        report_interval=prof_cfg.report_interval,
+        tracer=tracer,
+    )
+    if profiler.enabled:
+        logger.info("Frame profiler enabled (report every %.0fs)", prof_cfg.report_interval)
+
+    watchdog = None
+    if settings.watchdog.enabled:
+        from .perf.watchdog import FrameWatchdog
+
+        wd_cfg = settings.watchdog
+        watchdog = FrameWatchdog(
+            profiler,
+            state,
+            threshold=wd_cfg.threshold,
+            dump_dir=wd_cfg.dump_dir,
+            min_interval=wd_cfg.min_interval,
+        )
+        watchdog.start()
 
     stop_event = asyncio.Event()
 
@@ -242,6 +509,8 @@ async def async_main(args) -> None:
         if not stop_event.is_set():
             logger.info("Stop signal received, initiating shutdown")
             stop_event.set()
+            if state.standby is not None:
+                state.standby.wake()
 
     loop = asyncio.get_running_loop()
     for sig in (signal.SIGTERM, signal.SIGINT):
@@ -258,6 +527,7 @@ async def async_main(args) -> None:
             settings,
             args.test_pattern,
             stop_event,
+            profiler,
         )
     )
     mqtt_task: asyncio.Task | None = None
@@ -267,6 +537,9 @@ async def async_main(args) -> None:
     try:
         await main_task
     finally:
+        if watchdog is not None:
+            watchdog.stop()
+        state.profile_capture.stop()
         if mqtt_task is not None:
             mqtt_task.cancel()
             with contextlib.suppress(asyncio.CancelledError):
@@ -275,6 +548,17 @@ async def async_main(args) -> None:
             await mqtt_service.disconnect()
         if ha_service:
             ha_service.stop()
+        if profiler.enabled:
+            profiler.log_report()
+        if tracer is not None:
+            tracer.write()
+            set_tracer(None)
+        with contextlib.suppress(Exception):
+            state.retired.append(state.background)
+            _close_retired(state)
+        from .backgrounds.network import stop_receivers
+
+        stop_receivers()
         with contextlib.suppress(Exception):
             display.stop()
         with contextlib.suppress(Exception):
@@ -282,9 +566,88 @@ async def async_main(args) -> None:
         logger.info("Shutdown complete")
 
 
+async def bench_scene(args) -> None:
+    from .display.null import NullDisplay
+    from .perf.synthetic import SyntheticHomeAssistant, SyntheticNotifier
+
+    settings = load_settings(base_dir=args.config_dir)
+    _setup_logging(settings.general.log_level)
+    settings.scenes.file = str(args.bench_scene)
+
+    from .backgrounds.procedural._registry import set_extra_tags
+
+    set_extra_tags(settings.effect_tags)
+
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    pygame.init()
+    pygame.mixer.quit()
+
+    w = settings.display.canvas.width
+    h = settings.display.canvas.height
+    screen = pygame.display.set_mode((w, h), pygame.SRCALPHA)
+    display = NullDisplay(settings)
+    display.start()
+
+    state, entity_ids = _build_scene(settings)
+    ha_service = SyntheticHomeAssistant(entity_ids, change_interval=args.bench_ha_interval)
+    notifier = SyntheticNotifier() if args.bench_notify else None
+    tracer = _create_tracer(settings, args)
+    profiler = FrameProfiler(window=args.bench_frames, report_interval=0, tracer=tracer)
+
+    logger.info(
+        "Benchmarking scene %s: %d frames, %d entities, notifications %s",
+        args.bench_scene,
+        args.bench_frames,
+        len(entity_ids),
+        "on" if notifier else "off",
+    )
+    start = time.perf_counter()
+    try:
+        await run_loop(
+            screen,
+            display,
+            state,
+            ha_service,
+            notifier,
+            settings,
+            False,
+            asyncio.Event(),
+            profiler,
+            max_frames=args.bench_frames,
+            throttle=False,
+        )
+    finally:
+        elapsed = time.perf_counter() - start
+        if tracer is not None:
+            tracer.write()
+            set_tracer(None)
+        pygame.quit()
+
+    stages = profiler.summary()["stages"]
+    total = stages.get("total", {}).get("mean", 0.0)
+    print(f"{'stage':<20}{'mean':>8}{'share':>8}{'p95':>8}{'max':>8}  (ms)")
+    for name, s in stages.items():
+        share = s["mean"] / total * 100 if total else 0.0
+        print(f"{name:<20}{s['mean']:>8.2f}{share:>7.1f}%{s['p95']:>8.2f}{s['max']:>8.2f}")
+    fps = profiler.frames / elapsed if elapsed > 0 else 0.0
+    budget = 1000.0 / settings.general.fps
+    print(
+        f"{profiler.frames} frames in {elapsed:.2f}s: {fps:.1f} fps achieved "
+        f"({total:.2f} ms/frame mean, {budget:.1f} ms budget at {settings.general.fps} fps), "
+        f"{display.frames} presented"
+    )
+
+
 def main() -> None:
     parser = _build_parser()
     args = parser.parse_args()
+    if args.command == "bench":
+        from .perf.bench import run as run_bench
+
+        raise SystemExit(run_bench(args))
+    if args.bench_scene is not None:
+        asyncio.run(bench_scene(args))
+        return
     asyncio.run(async_main(args))
 
 
@@ -10,8 +10,19 @@ class Background(abc.ABC):
     def __init__(self, settings: dict[str, Any] | None = None) -> None:
         self.settings = settings or {}
 
+    @property
+    def active_name(self) -> str:
+        return type(self).__name__
+
+    @property
+    def static(self) -> bool:
+        return False
+
     def update(self, dt: float) -> None:
         pass
 
+    def close(self) -> None:
+        pass
+
     @abc.abstractmethod
     def render(self, surface: pygame.Surface) -> None: ...
@@ -96,6 +96,18 @@ class CompositeBackground(Background):
     def locked(self) -> bool:
         return self._locked
 
+    @property
+    def active_name(self) -> str:
+        if not self._backgrounds:
+            return ""
+        return self._backgrounds[self._current_index].active_name
+
+    @property
+    def static(self) -> bool:
+        if not self._backgrounds or self._prev_index is not None:
+            return False
+        return self._backgrounds[self._current_index].static
+
     def update(self, dt: float) -> None:
         if not self._backgrounds:
             return
@@ -158,3 +170,7 @@ class CompositeBackground(Background):
         else:
             self._prev_index = None
             self._backgrounds[self._current_index].render(surface)
+
+    def close(self) -> None:
+        for bg in self._backgrounds:
+            bg.close()
@@ -25,6 +25,10 @@ class ImageBackground(Background):
         except Exception:
             logger.exception("Failed to load background image: %s", path)
 
+    @property
+    def static(self) -> bool:
+        return True
+
     def render(self, surface: pygame.Surface) -> None:
         if self._image is not None:
             scaled = pygame.transform.smoothscale(self._image, surface.get_size())
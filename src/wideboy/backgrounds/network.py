@@ -0,0 +1,303 @@
+from __future__ import annotations
+
+import logging
+import socket
+import threading
+import time
+from collections import deque
+from typing import Any
+
+import numpy as np
+import pygame
+
+from .base import Background
+
+logger = logging.getLogger(__name__)
+
+PROTOCOLS = ("sacn", "ddp")
+DEFAULT_PORTS = {"sacn": 5568, "ddp": 4048}
+ACN_IDENTIFIER = b"ASC-E1.17\x00\x00\x00"
+SACN_DATA_OFFSET = 126
+SACN_TERMINATED = 0x40
+DDP_HEADER_SIZE = 10
+DDP_PUSH = 0x01
+
+
+class FrameReceiver:
+    def __init__(
+        self,
+        size: tuple[int, int],
+        protocol: str = "sacn",
+        host: str = "0.0.0.0",
+        port: int | None = None,
+        universe: int = 1,
+        pixels_per_universe: int = 170,
+        buffers: int = 4,
+    ) -> None:
+        if protocol not in PROTOCOLS:
+            raise ValueError(f"Unknown protocol '{protocol}' (expected one of {PROTOCOLS})")
+        w, h = size
+        self.size = size
+        self.protocol = protocol
+        self.universe = universe
+        self.universe_bytes = pixels_per_universe * 3
+        self.universes = -(-w * h * 3 // self.universe_bytes)
+        self._frame_bytes = w * h * 3
+        self._assembly = np.zeros(self.universes * self.universe_bytes, dtype=np.uint8)
+        self._seen = np.zeros(self.universes, dtype=bool)
+        self._sequences = np.full(self.universes, -1, dtype=np.int16)
+        self._packet = bytearray(65536)
+        self._view = memoryview(self._packet)
+        self._free = deque(np.zeros((h, w, 3), dtype=np.uint8) for _ in range(max(2, buffers)))
+        self._ready: deque[tuple[float, np.ndarray]] = deque()
+        self._lock = threading.Lock()
+        self._running = False
+        self._thread: threading.Thread | None = None
+        self._sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self._sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self._sock.bind((host, DEFAULT_PORTS[protocol] if port is None else port))
+        self._sock.settimeout(0.25)
+        self.address = self._sock.getsockname()
+        self.terminated = False
+        self.packets = 0
+        self.bytes = 0
+        self.frames = 0
+        self.incomplete = 0
+        self.overruns = 0
+        self.late = 0
+        self.errors = 0
+        self.sequence_errors = 0
+
+    def start(self) -> None:
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name="frame-receiver", daemon=True)
+        self._thread.start()
+        logger.info("Listening for %s frames on %s:%d", self.protocol, *self.address)
+
+    def _run(self) -> None:
+        handle = self._handle_sacn if self.protocol == "sacn" else self._handle_ddp
+        while self._running:
+            try:
+                n = self._sock.recv_into(self._packet)
+            except TimeoutError:
+                continue
+            except OSError:
+                return
+            self.packets += 1
+            self.bytes += n
+            try:
+                handle(n)
+            except Exception:
+                self.errors += 1
+                logger.debug("Malformed %s packet", self.protocol, exc_info=True)
+
+    def _handle_sacn(self, n: int) -> None:
+        p = self._packet
+        if n <= SACN_DATA_OFFSET or p[4:16] != ACN_IDENTIFIER or p[125] != 0:
+            self.errors += 1
+            return
+        index = int.from_bytes(p[113:115], "big") - self.universe
+        if not 0 <= index < self.universes:
+            return
+        if p[112] & SACN_TERMINATED:
+            self.terminated = True
+            return
+        self.terminated = False
+        sequence = p[111]
+        last = int(self._sequences[index])
+        if last >= 0 and sequence != (last + 1) & 0xFF:
+            self.sequence_errors += 1
+        self._sequences[index] = sequence
+        if self._seen[index]:
+            self.incomplete += 1
+            self._complete()
+        count = min(
+            int.from_bytes(p[123:125], "big") - 1, self.universe_bytes, n - SACN_DATA_OFFSET
+        )
+        start = index * self.universe_bytes
+        self._assembly[start : start + count] = self._view[
+            SACN_DATA_OFFSET : SACN_DATA_OFFSET + count
+        ]
+        self._seen[index] = True
+        if self._seen.all():
+            self._complete()
+
+    def _handle_ddp(self, n: int) -> None:
+        p = self._packet
+        if n < DDP_HEADER_SIZE or p[0] & 0xC0 != 0x40:
+            self.errors += 1
+            return
+        offset = int.from_bytes(p[4:8], "big")
+        length = min(int.from_bytes(p[8:10], "big"), n - DDP_HEADER_SIZE)
+        length = max(0, min(length, self._frame_bytes - offset))
+        end = DDP_HEADER_SIZE + length
+        self._assembly[offset : offset + length] = self._view[DDP_HEADER_SIZE:end]
+        if p[0] & DDP_PUSH:
+            self._complete()
+
+    def _complete(self) -> None:
+        self._seen[:] = False
+        with self._lock:
+            if self._free:
+                slot = self._free.popleft()
+            else:
+                _, slot = self._ready.popleft()
+                self.overruns += 1
+            np.copyto(slot.reshape(-1), self._assembly[: self._frame_bytes])
+            self._ready.append((time.monotonic(), slot))
+        self.frames += 1
+
+    def take(self, out: np.ndarray, delay: float = 0.0) -> bool:
+        due = time.monotonic() - delay
+        with self._lock:
+            slot = None
+            while self._ready and self._ready[0][0] <= due:
+                if slot is not None:
+                    self._free.append(slot)
+                    self.late += 1
+                _, slot = self._ready.popleft()
+            if slot is None:
+                return False
+            np.copyto(out, slot)
+            self._free.append(slot)
+        return True
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "packets": self.packets,
+            "bytes": self.bytes,
+            "frames": self.frames,
+            "incomplete": self.incomplete,
+            "overruns": self.overruns,
+            "late": self.late,
+            "errors": self.errors,
+            "sequence_errors": self.sequence_errors,
+        }
+
+    def stop(self) -> None:
+        self._running = False
+        if self._thread is None:
+            self._sock.close()
+            return
+        self._thread.join(timeout=1)
+        self._thread = None
+        self._sock.close()
+        logger.info(
+            "%s input on %s:%d: %d frames, %d packets, %.1f MiB, %d incomplete, "
+            "%d overruns, %d late, %d errors, %d sequence errors",
+            self.protocol,
+            *self.address,
+            self.frames,
+            self.packets,
+            self.bytes / (1024 * 1024),
+            self.incomplete,
+            self.overruns,
+            self.late,
+            self.errors,
+            self.sequence_errors,
+        )
+
+
+_receivers: dict[tuple, FrameReceiver] = {}
+_users: dict[tuple, int] = {}
+_lock = threading.Lock()
+
+
+def get_receiver(size: tuple[int, int], **kwargs: Any) -> FrameReceiver:
+    key = (size, *sorted(kwargs.items()))
+    with _lock:
+        receiver = _receivers.get(key)
+        if receiver is None or receiver._thread is None:
+            receiver = FrameReceiver(size, **kwargs)
+            receiver.start()
+            _receivers[key] = receiver
+            _users[key] = 0
+        _users[key] += 1
+    return receiver
+
+
+def release_receiver(receiver: FrameReceiver) -> None:
+    with _lock:
+        for key, shared in _receivers.items():
+            if shared is receiver:
+                _users[key] -= 1
+                if _users[key] > 0:
+                    return
+                del _receivers[key], _users[key]
+                break
+    receiver.stop()
+
+
+def stop_receivers() -> None:
+    with _lock:
+        receivers = list(_receivers.values())
+        _receivers.clear()
+        _users.clear()
+    for receiver in receivers:
+        receiver.stop()
+
+
+class NetworkBackground(Background):
+    def __init__(self, settings: dict[str, Any] | None = None) -> None:
+        super().__init__(settings)
+        s = self.settings
+        self._options = {
+            "protocol": s.get("protocol", "sacn"),
+            "host": s.get("host", "0.0.0.0"),
+            "port": s.get("port"),
+            "universe": s.get("universe", 1),
+            "pixels_per_universe": s.get("pixels_per_universe", 170),
+            "buffers": s.get("buffers", 4),
+        }
+        self._delay = s.get("jitter_ms", 20) / 1000.0
+        self.receiver: FrameReceiver | None = None
+        self._frame: np.ndarray | None = None
+        self._surface: pygame.Surface | None = None
+        self._received = False
+        self._failed = False
+        self._closed = False
+
+    @property
+    def active_name(self) -> str:
+        return f"network ({self._options['protocol']})"
+
+    def _open(self, size: tuple[int, int]) -> None:
+        try:
+            receiver = get_receiver(size, **self._options)
+        except OSError:
+            logger.exception("Failed to open %s listener", self._options["protocol"])
+            self._failed = True
+            return
+        w, h = size
+        self._frame = np.zeros((h, w, 3), dtype=np.uint8)
+        self._surface = pygame.image.frombuffer(self._frame, size, "RGB")
+        self.receiver = receiver
+        if self._closed:
+            self.close()
+
+    def update(self, dt: float) -> None:
+        receiver = self.receiver
+        if receiver is not None and receiver.take(self._frame, self._delay):
+            self._received = True
+
+    def render(self, surface: pygame.Surface) -> None:
+        receiver = self.receiver
+        if receiver is None:
+            if self._failed or self._closed:
+                return
+            self._open(surface.get_size())
+            receiver = self.receiver
+            if receiver is None:
+                return
+        if self._received and not receiver.terminated:
+            surface.blit(self._surface, (0, 0))
+
+    def stats(self) -> dict[str, int]:
+        receiver = self.receiver
+        return receiver.stats() if receiver is not None else {}
+
+    def close(self) -> None:
+        self._closed = True
+        receiver, self.receiver = self.receiver, None
+        if receiver is not None:
+            release_receiver(receiver)
@@ -1,4 +1,4 @@
-from ._base import Effect
+from ._base import Effect, Scratch
 from ._registry import (
     EFFECTS,
     ProceduralBackground,
@@ -12,6 +12,7 @@ __all__ = [
     "EFFECTS",
     "Effect",
     "ProceduralBackground",
+    "Scratch",
     "get_all_tags",
     "get_effect_metadata",
     "get_effect_tags",
@@ -3,12 +3,67 @@ from __future__ import annotations
 import numpy as np
 
 from ...render.palette import Palette
+from ._utils import LEVELS, palette_array, palette_lut
+
+
+class Scratch:
+    def __init__(self) -> None:
+        self._buffers: dict[tuple, np.ndarray] = {}
+
+    def get(self, name: str, shape: tuple[int, ...], dtype=np.float32) -> np.ndarray:
+        key = (name, shape, np.dtype(dtype))
+        buf = self._buffers.get(key)
+        if buf is None:
+            buf = self._buffers[key] = np.empty(shape, dtype=dtype)
+        return buf
+
+    @property
+    def nbytes(self) -> int:
+        return sum(buf.nbytes for buf in self._buffers.values())
+
+    def clear(self) -> None:
+        self._buffers.clear()
 
 
 class Effect:
     name: str = ""
     default_palette: str = "neon"
     tags: tuple[str, ...] = ()
+    levels: int = LEVELS
+
+    @property
+    def indexed(self) -> bool:
+        return type(self).render_index is not Effect.render_index
+
+    @property
+    def index_dtype(self) -> type[np.unsignedinteger]:
+        return np.uint8 if self.levels <= 256 else np.uint16
+
+    @property
+    def renders_into(self) -> bool:
+        return self.indexed or type(self).render_into is not Effect.render_into
 
     def __call__(self, t: float, w: int, h: int, palette: Palette) -> np.ndarray:
+        if not self.renders_into:
+            raise NotImplementedError
+        out = np.empty((h, w, 3), dtype=np.uint8)
+        self.render_into(out, t, palette, Scratch())
+        return out
+
+    def render_into(self, out: np.ndarray, t: float, palette: Palette, scratch: Scratch) -> None:
+        h, w = out.shape[:2]
+        if self.indexed:
+            self.render_lut(out, t, palette_lut(palette_array(palette), self.levels), scratch)
+            return
+        np.copyto(out, self(t, w, h, palette))
+
+    def render_lut(self, out: np.ndarray, t: float, lut: np.ndarray, scratch: Scratch) -> None:
+        shape = out.shape[:2]
+        index = scratch.get("index", shape, self.index_dtype)
+        positions = scratch.get("index_positions", shape, np.intp)
+        self.render_index(index, t, scratch)
+        np.copyto(positions, index)
+        np.take(lut, positions, axis=0, out=out, mode="clip")
+
+    def render_index(self, out: np.ndarray, t: float, scratch: Scratch) -> None:
         raise NotImplementedError
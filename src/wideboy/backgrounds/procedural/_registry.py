@@ -3,11 +3,14 @@ from __future__ import annotations
 import logging
 from typing import Any
 
+import numpy as np
 import pygame
 
-from ...render.palette import Palette
+from ...perf.trace import span
+from ...render.palette import Palette, ResolvedPalette
 from ..base import Background
-from ._base import Effect
+from ._base import Effect, Scratch
+from ._utils import palette_array, palette_lut
 from .airwolf import airwolf
 from .asteroids import asteroids
 from .aurora import aurora
@@ -41,6 +44,8 @@ from .waves import waves
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_PALETTE = ResolvedPalette(Palette())
+
 EFFECTS = {
     plasma.name: plasma,
     polyhedrons.name: polyhedrons,
@@ -125,6 +130,15 @@ class ProceduralBackground(Background):
         self._speed = float(s.get("speed", 1.0))
         self._time = 0.0
         self._resolver = s.get("_palette_resolver")
+        self._small: pygame.Surface | None = None
+        self._out: np.ndarray | None = None
+        self._scratch = Scratch()
+        self._lut: np.ndarray | None = None
+        self._lut_key: tuple[int, int] | None = None
+
+    @property
+    def active_name(self) -> str:
+        return self._effect_name
 
     def update(self, dt: float) -> None:
         self._time += dt * self._speed
@@ -135,6 +149,7 @@ class ProceduralBackground(Background):
         if name in EFFECTS:
             self._effect_name = name
             self._time = 0.0
+            self._scratch.clear()
             logger.info("Effect changed: %s", name)
 
     def set_speed(self, speed: float) -> None:
@@ -152,16 +167,47 @@ class ProceduralBackground(Background):
 
     _SCALE_EFFECTS = {"aurora", "mandelbrot"}
 
+    def buffers(self, w: int, h: int) -> tuple[np.ndarray, Scratch]:
+        out = self._out
+        if out is None or out.shape != (h, w, 3):
+            out = self._out = np.zeros((h, w, 3), dtype=np.uint8)
+            self._scratch.clear()
+        return out, self._scratch
+
+    def _palette_lut(self, palette: ResolvedPalette, levels: int) -> np.ndarray:
+        key = (palette.version, levels)
+        if self._lut is None or key != self._lut_key:
+            self._lut = palette_lut(palette_array(palette), levels)
+            self._lut_key = key
+        return self._lut
+
+    def _pixels(self, fn: Effect, w: int, h: int, palette: ResolvedPalette) -> np.ndarray:
+        with span(self._effect_name, "effect"):
+            if not fn.renders_into:
+                return fn(self._time, w, h, palette)
+            out, scratch = self.buffers(w, h)
+            if fn.indexed:
+                fn.render_lut(out, self._time, self._palette_lut(palette, fn.levels), scratch)
+            else:
+                fn.render_into(out, self._time, palette, scratch)
+            return out
+
+    def _small_surface(self, w: int, h: int, surface: pygame.Surface) -> pygame.Surface:
+        small = self._small
+        if small is None or small.get_size() != (w, h) or small.get_masks() != surface.get_masks():
+            small = self._small = pygame.Surface((w, h), 0, surface)
+        return small
+
     def render(self, surface: pygame.Surface) -> None:
         w, h = surface.get_size()
         fn = EFFECTS.get(self._effect_name, plasma)
-        palette = self._resolver.palette if self._resolver else Palette()
+        palette = ResolvedPalette.of(self._resolver.palette if self._resolver else DEFAULT_PALETTE)
         if self._effect_name in self._SCALE_EFFECTS:
             rw, rh = max(1, w // 2), max(1, h // 2)
-            pixels = fn(self._time, rw, rh, palette)
-            small = pygame.surfarray.make_surface(pixels.transpose(1, 0, 2))
-            surf = pygame.transform.scale(small, (w, h))
+            pixels = self._pixels(fn, rw, rh, palette)
+            small = self._small_surface(rw, rh, surface)
+            pygame.surfarray.blit_array(small, pixels.transpose(1, 0, 2))
+            pygame.transform.scale(small, (w, h), surface)
         else:
-            pixels = fn(self._time, w, h, palette)
-            surf = pygame.surfarray.make_surface(pixels.transpose(1, 0, 2))
-        surface.blit(surf, (0, 0))
+            pixels = self._pixels(fn, w, h, palette)
+            pygame.surfarray.blit_array(surface, pixels.transpose(1, 0, 2))
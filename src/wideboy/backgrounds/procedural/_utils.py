@@ -1,11 +1,77 @@
 from __future__ import annotations
 
+from collections import OrderedDict
+from collections.abc import Callable
+
 import numpy as np
 
-from ...render.palette import Palette
+from ...render.palette import Palette, ResolvedPalette
+
+LEVELS = 1024
+
+
+class FieldCache:
+    def __init__(self, max_bytes: int = 16 * 1024 * 1024) -> None:
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self._fields: OrderedDict[tuple, np.ndarray] = OrderedDict()
+
+    def get(self, key: tuple, build: Callable[[], np.ndarray]) -> np.ndarray:
+        field = self._fields.get(key)
+        if field is not None:
+            self._fields.move_to_end(key)
+            return field
+        field = np.ascontiguousarray(build(), dtype=np.float32)
+        field.flags.writeable = False
+        self._fields[key] = field
+        self.nbytes += field.nbytes
+        while self.nbytes > self.max_bytes and len(self._fields) > 1:
+            _, evicted = self._fields.popitem(last=False)
+            self.nbytes -= evicted.nbytes
+        return field
+
+    def __len__(self) -> int:
+        return len(self._fields)
+
+    def clear(self) -> None:
+        self._fields.clear()
+        self.nbytes = 0
+
+
+FIELDS = FieldCache()
+
+
+def grid_x(w: int) -> np.ndarray:
+    return FIELDS.get(("x", w), lambda: np.arange(w))
+
+
+def grid_y(h: int) -> np.ndarray:
+    return FIELDS.get(("y", h), lambda: np.arange(h)[:, np.newaxis])
+
+
+def unit_x(w: int) -> np.ndarray:
+    return FIELDS.get(("unit_x", w), lambda: np.linspace(-1.0, 1.0, w))
+
+
+def unit_y(h: int) -> np.ndarray:
+    return FIELDS.get(("unit_y", h), lambda: np.linspace(-1.0, 1.0, h)[:, np.newaxis])
+
+
+def linear_field(w: int, h: int, fx: float, fy: float) -> np.ndarray:
+    return FIELDS.get(("linear", w, h, fx, fy), lambda: grid_x(w) * fx + grid_y(h) * fy)
+
+
+def radius_field(w: int, h: int, cx: float = 0.0, cy: float = 0.0) -> np.ndarray:
+    return FIELDS.get(("radius", w, h, cx, cy), lambda: np.hypot(grid_x(w) - cx, grid_y(h) - cy))
+
+
+def angle_field(w: int, h: int, cx: float = 0.0, cy: float = 0.0) -> np.ndarray:
+    return FIELDS.get(("angle", w, h, cx, cy), lambda: np.arctan2(grid_y(h) - cy, grid_x(w) - cx))
 
 
 def palette_array(p: Palette) -> np.ndarray:
+    if isinstance(p, ResolvedPalette):
+        return p.colors
     return np.array(
         [p.primary, p.secondary, p.accent, p.highlight, p.dim],
         dtype=np.float32,
@@ -21,6 +87,17 @@ def sample_palette(colors: np.ndarray, t: np.ndarray) -> np.ndarray:
     return colors[lo] * (1 - frac) + colors[hi] * frac
 
 
+def palette_lut(colors: np.ndarray, levels: int = LEVELS) -> np.ndarray:
+    return sample_palette(colors, np.linspace(0.0, 1.0, levels, dtype=np.float32)).astype(np.uint8)
+
+
+def index_into(v: np.ndarray, out: np.ndarray, levels: int = LEVELS) -> None:
+    np.clip(v, 0.0, 1.0, out=v)
+    v *= levels - 1
+    v += 0.5
+    np.copyto(out, v, casting="unsafe")
+
+
 def draw_line(
     frame: np.ndarray, x0: int, y0: int, x1: int, y1: int, color: np.ndarray, w: int, h: int
 ) -> None:
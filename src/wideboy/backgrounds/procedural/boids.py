@@ -5,7 +5,7 @@ import math
 import numpy as np
 
 from ...render.palette import Palette
-from ._base import Effect
+from ._base import Effect, Scratch
 
 
 class _BoidsEffect(Effect):
@@ -44,7 +44,8 @@ class _BoidsEffect(Effect):
         self._vy = np.sin(angles) * speeds
         self._w, self._h = w, h
 
-    def __call__(self, t: float, w: int, h: int, palette: Palette) -> np.ndarray:
+    def render_into(self, out: np.ndarray, t: float, palette: Palette, scratch: Scratch) -> None:
+        h, w = out.shape[:2]
         if self._px is None or self._w != w or self._h != h:
             self._init(w, h)
 
@@ -131,8 +132,8 @@ class _BoidsEffect(Effect):
             np.array(palette.highlight, dtype=np.float32),
         ]
 
-        frame = np.zeros((h, w, 3), dtype=np.float32)
-        frame[:, :] = dim
+        frame = out
+        frame[:, :] = np.clip(dim, 0, 255)
 
         for i in range(n):
             bx = int(self._px[i])
@@ -178,7 +179,5 @@ class _BoidsEffect(Effect):
                     if 0 <= gx < w and 0 <= gy < h:
                         frame[gy, gx] = np.maximum(frame[gy, gx], glow)
 
-        return np.clip(frame, 0, 255).astype(np.uint8)
-
 
 boids = _BoidsEffect()
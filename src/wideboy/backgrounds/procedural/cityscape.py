@@ -3,7 +3,7 @@ from __future__ import annotations
 import numpy as np
 
 from ...render.palette import Palette
-from ._base import Effect
+from ._base import Effect, Scratch
 
 
 class _CityScapeEffect(Effect):
@@ -101,66 +101,48 @@ class _CityScapeEffect(Effect):
         self._w, self._h = w, h
         self._strips = []
         for layer in self._LAYERS:
-            self._strips.append(self._gen_strip(layer, w, h))
+            body, outline, outline_rgb, windows = self._gen_strip(layer, w, h)
+            self._strips.append(
+                (
+                    body.astype(bool)[..., np.newaxis],
+                    outline.astype(bool)[..., np.newaxis],
+                    outline_rgb,
+                    windows.astype(bool)[..., np.newaxis],
+                )
+            )
 
-    def __call__(self, t: float, w: int, h: int, palette: Palette) -> np.ndarray:
+    def render_into(self, out: np.ndarray, t: float, palette: Palette, scratch: Scratch) -> None:
+        h, w = out.shape[:2]
         if self._w != w or self._h != h:
             self._init(w, h)
 
         dim = np.array(palette.dim, dtype=np.float32)
-        frame = np.zeros((h, w, 3), dtype=np.float32)
+        frame = scratch.get("frame", (h, w, 3))
         frame[:, :] = dim
-
-        pal_colors = [
-            np.array(palette.primary, dtype=np.float32),
-            np.array(palette.secondary, dtype=np.float32),
-            np.array(palette.accent, dtype=np.float32),
-            np.array(palette.highlight, dtype=np.float32),
-        ]
+        highlight = np.array(palette.highlight, dtype=np.float32)
 
         for li, layer in enumerate(self._LAYERS):
             body_m, outline_m, outline_rgb_m, win_m = self._strips[li]
             strip_w = body_m.shape[1]
             offset = int(t * layer["speed"]) % strip_w
-
-            if offset + w <= strip_w:
-                vb = body_m[:, offset : offset + w]
-                vo = outline_m[:, offset : offset + w]
-                voc = outline_rgb_m[:, offset : offset + w]
-                vw = win_m[:, offset : offset + w]
-            else:
-                r = offset + w - strip_w
-                vb = np.concatenate(
-                    [body_m[:, offset:], body_m[:, :r]],
-                    axis=1,
-                )
-                vo = np.concatenate(
-                    [outline_m[:, offset:], outline_m[:, :r]],
-                    axis=1,
-                )
-                voc = np.concatenate(
-                    [outline_rgb_m[:, offset:], outline_rgb_m[:, :r]],
-                    axis=1,
-                )
-                vw = np.concatenate(
-                    [win_m[:, offset:], win_m[:, :r]],
-                    axis=1,
-                )
+            first = min(w, strip_w - offset)
+            spans = [(slice(0, first), slice(offset, offset + first))]
+            if first < w:
+                spans.append((slice(first, w), slice(0, w - first)))
 
             b = layer["bright"]
             fill_color = dim * (0.15 + 0.1 * b)
-            body_f = vb[:, :, np.newaxis].astype(np.float32)
-            frame = frame * (1 - body_f) + fill_color * body_f
-
-            ol_f = vo[:, :, np.newaxis].astype(np.float32)
-            frame = frame * (1 - ol_f) + voc * ol_f
-
-            win_color = pal_colors[3] * 0.9 + dim * 0.1
-            win_f = vw[:, :, np.newaxis].astype(np.float32)
+            win_color = highlight * 0.9 + dim * 0.1
             flicker = 0.7 + 0.3 * np.sin(t * 2.0 + li * 1.5)
-            frame = frame * (1 - win_f * flicker) + win_color * win_f * flicker
-
-        return np.clip(frame, 0, 255).astype(np.uint8)
+            for dst, src in spans:
+                view = frame[:, dst]
+                np.copyto(view, fill_color, where=body_m[:, src])
+                np.copyto(view, outline_rgb_m[:, src], where=outline_m[:, src])
+                np.multiply(view, 1 - flicker, out=view, where=win_m[:, src])
+                np.add(view, win_color * flicker, out=view, where=win_m[:, src])
+
+        np.clip(frame, 0, 255, out=frame)
+        np.copyto(out, frame, casting="unsafe")
 
 
 cityscape = _CityScapeEffect()
@@ -2,9 +2,8 @@ from __future__ import annotations
 
 import numpy as np
 
-from ...render.palette import Palette
-from ._base import Effect
-from ._utils import palette_array, sample_palette
+from ._base import Effect, Scratch
+from ._utils import grid_x, index_into
 
 
 class _GradientEffect(Effect):
@@ -12,17 +11,16 @@ class _GradientEffect(Effect):
     default_palette = "ocean"
     tags = ("abstract", "calm")
 
-    def __call__(self, t: float, w: int, h: int, palette: Palette) -> np.ndarray:
-        colors = palette_array(palette)
-        xs = np.arange(w, dtype=np.float32)
+    def render_index(self, out: np.ndarray, t: float, scratch: Scratch) -> None:
+        h, w = out.shape
+        xs = grid_x(w)
         period = w * 2
         offset = (t * 50) % period
         shifted = (xs + offset) % period
         pos = np.where(shifted < w, shifted / w, (period - shifted) / w)
-        rgb = sample_palette(colors, pos)
-        row = rgb[:, np.newaxis, :]
-        broadcast = np.broadcast_to(row, (w, h, 3))
-        return broadcast.transpose(1, 0, 2).copy().astype(np.uint8)
+        row = scratch.get("gradient_row", (w,), out.dtype)
+        index_into(pos, row, self.levels)
+        out[:] = row
 
 
 gradient_scroll = _GradientEffect()
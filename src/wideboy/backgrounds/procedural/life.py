@@ -3,7 +3,7 @@ from __future__ import annotations
 import numpy as np
 
 from ...render.palette import Palette
-from ._base import Effect
+from ._base import Effect, Scratch
 from ._utils import palette_array, sample_palette
 
 _GLIDER = [(0, 1), (1, 2), (2, 0), (2, 1), (2, 2)]
@@ -52,6 +52,8 @@ class _LifeEffect(Effect):
         self._generation = 0
         self._last_alive = -1
         self._stagnant = 0
+        self._base: np.ndarray | None = None
+        self._base_key: tuple | None = None
 
     def _init(self, w: int, h: int) -> None:
         self._gw = w // self._CELL
@@ -127,7 +129,8 @@ class _LifeEffect(Effect):
         ):
             self._reseed()
 
-    def __call__(self, t: float, w: int, h: int, palette: Palette) -> np.ndarray:
+    def render_into(self, out: np.ndarray, t: float, palette: Palette, scratch: Scratch) -> None:
+        h, w = out.shape[:2]
         if self._grid is None or self._gw != w // self._CELL or self._gh != h // self._CELL:
             self._init(w, h)
 
@@ -143,24 +146,35 @@ class _LifeEffect(Effect):
             [colors[0], colors[2], colors[1], colors[3]],
             dtype=np.float32,
         )
-        gx = np.linspace(0.0, 1.0, gw, dtype=np.float32)
-        gy = np.linspace(0.0, 1.0, gh, dtype=np.float32)[:, None]
-        pos = (gx + gy) * 0.5
-        base = sample_palette(ramp, pos)
+        key = (gw, gh, ramp.tobytes())
+        if key != self._base_key:
+            gx = np.linspace(0.0, 1.0, gw, dtype=np.float32)
+            gy = np.linspace(0.0, 1.0, gh, dtype=np.float32)[:, None]
+            pos = (gx + gy) * 0.5
+            self._base = sample_palette(ramp, pos).astype(np.float32)
+            self._base_key = key
 
         age = self._age
-        vitality = np.clip(1.0 - age / self._MAX_AGE, 0.55, 1.0)[..., None]
-        birth = np.clip(1.0 - age / 2.5, 0.0, 1.0)[..., None]
-        highlight = colors[3]
-        alive_rgb = base * vitality + highlight * birth * 0.18
-
-        bg = (colors[4] * 0.12)[None, None, :]
-        cell_rgb = np.where(self._grid[..., None], alive_rgb, bg)
-
-        big = np.kron(cell_rgb, np.ones((cell, cell, 1), dtype=np.float32))
-        frame = np.full((h, w, 3), colors[4] * 0.15, dtype=np.float32)
-        frame[: gh * cell, : gw * cell] = big
-        return np.clip(frame, 0, 255).astype(np.uint8)
+        vitality = scratch.get("life_vitality", (gh, gw))
+        birth = scratch.get("life_birth", (gh, gw))
+        glow = scratch.get("life_glow", (gh, gw, 3))
+        cell_rgb = scratch.get("life_cells", (gh, gw, 3))
+        np.multiply(age, -1.0 / self._MAX_AGE, out=vitality)
+        vitality += 1.0
+        np.clip(vitality, 0.55, 1.0, out=vitality)
+        np.multiply(age, -1.0 / 2.5, out=birth)
+        birth += 1.0
+        np.clip(birth, 0.0, 1.0, out=birth)
+        np.multiply(self._base, vitality[..., None], out=cell_rgb)
+        np.multiply(birth[..., None], colors[3] * 0.18, out=glow)
+        cell_rgb += glow
+        np.copyto(cell_rgb, colors[4] * 0.12, where=~self._grid[..., None])
+        np.clip(cell_rgb, 0, 255, out=cell_rgb)
+
+        out[:] = np.clip(colors[4] * 0.15, 0, 255)
+        for dy in range(cell):
+            for dx in range(cell):
+                out[dy : gh * cell : cell, dx : gw * cell : cell] = cell_rgb
 
 
 life = _LifeEffect()
@@ -4,9 +4,8 @@ from typing import Any
 
 import numpy as np
 
-from ...render.palette import Palette
-from ._base import Effect
-from ._utils import palette_array, sample_palette
+from ._base import Effect, Scratch
+from ._utils import index_into, unit_x, unit_y
 
 
 class _MandelbrotEffect(Effect):
@@ -17,7 +16,8 @@ class _MandelbrotEffect(Effect):
     def __init__(self) -> None:
         self._cache: dict[str, Any] = {}
 
-    def __call__(self, t: float, w: int, h: int, palette: Palette) -> np.ndarray:
+    def render_index(self, out: np.ndarray, t: float, scratch: Scratch) -> None:
+        h, w = out.shape
         cx, cy = -0.745, 0.186
         cycle = 30.0
         max_zoom_exp = 4.0
@@ -32,21 +32,20 @@ class _MandelbrotEffect(Effect):
         dt = abs(t - cached_t)
 
         if (
-            cache.get("frame") is not None
-            and cache.get("shape") == (h, w)
-            and cache.get("palette_id") == id(palette)
+            cache.get("index") is not None
+            and cache["index"].shape == out.shape
+            and cache["index"].dtype == out.dtype
             and dt < (0.3 if zoom > 16 else 0.05)
         ):
-            return cache["frame"]
+            np.copyto(out, cache["index"])
+            return
 
         aspect = w / h
         half_h = 1.5 / zoom
         half_w = half_h * aspect
-        x = np.linspace(cx - half_w, cx + half_w, w, dtype=np.float32)
-        y = np.linspace(cy - half_h, cy + half_h, h, dtype=np.float32)
-        X, Y = np.meshgrid(x, y)
-
-        C = (X + 1j * Y).astype(np.complex64)
+        C = np.empty((h, w), dtype=np.complex64)
+        C.real = unit_x(w) * np.float32(half_w) + np.float32(cx)
+        C.imag = unit_y(h) * np.float32(half_h) + np.float32(cy)
 
         Z = np.zeros_like(C)
         M = np.full(C.shape, max_iter, dtype=np.float32)
@@ -60,18 +59,11 @@ class _MandelbrotEffect(Effect):
             M[escaped] = i + 1.0 - np.log2(np.log2(np.abs(Z[escaped]) + 1e-10))
             active &= ~escaped
 
-        colors = palette_array(palette)
-        interior = M >= max_iter
-        norm = M / max_iter
-        rgb = sample_palette(colors, norm)
-        rgb[interior] = colors[4]
-        frame = np.clip(rgb, 0, 255).astype(np.uint8)
+        M /= max_iter
+        index_into(M, out, self.levels)
 
-        cache["frame"] = frame
-        cache["shape"] = (h, w)
-        cache["palette_id"] = id(palette)
+        cache["index"] = out.copy()
         cache["t"] = t
-        return frame
 
 
 mandelbrot = _MandelbrotEffect()
@@ -2,9 +2,8 @@ from __future__ import annotations
 
 import numpy as np
 
-from ...render.palette import Palette
-from ._base import Effect
-from ._utils import palette_array, sample_palette
+from ._base import Effect, Scratch
+from ._utils import grid_x, grid_y, index_into, linear_field, radius_field
 
 
 class _PlasmaEffect(Effect):
@@ -12,19 +11,23 @@ class _PlasmaEffect(Effect):
     default_palette = "neon"
     tags = ("abstract", "calm")
 
-    def __call__(self, t: float, w: int, h: int, palette: Palette) -> np.ndarray:
-        colors = palette_array(palette)
-        xs = np.arange(w, dtype=np.float32)
-        ys = np.arange(h, dtype=np.float32)[:, np.newaxis]
-        v = (
-            np.sin(xs / 32.0 + t)
-            + np.sin(ys / 24.0 + t * 0.7)
-            + np.sin((xs + ys) / 40.0 + t * 0.5)
-            + np.sin(np.sqrt(xs**2 + ys**2) / 30.0 + t * 1.3)
-        )
-        v = (v + 4) / 8.0
-        rgb = sample_palette(colors, v)
-        return rgb.astype(np.uint8)
+    def render_index(self, out: np.ndarray, t: float, scratch: Scratch) -> None:
+        h, w = out.shape
+        xs = grid_x(w)
+        ys = grid_y(h)
+        v = scratch.get("plasma_v", (h, w))
+        tmp = scratch.get("plasma_tmp", (h, w))
+        np.divide(radius_field(w, h), 30.0, out=v)
+        v += t * 1.3
+        np.sin(v, out=v)
+        np.add(linear_field(w, h, 1 / 40.0, 1 / 40.0), t * 0.5, out=tmp)
+        np.sin(tmp, out=tmp)
+        v += tmp
+        v += np.sin(xs / 32.0 + t)
+        v += np.sin(ys / 24.0 + t * 0.7)
+        v += 4
+        v /= 8.0
+        index_into(v, out, self.levels)
 
 
 plasma = _PlasmaEffect()
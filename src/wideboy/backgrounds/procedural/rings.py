@@ -3,7 +3,8 @@ from __future__ import annotations
 import numpy as np
 
 from ...render.palette import Palette
-from ._base import Effect
+from ._base import Effect, Scratch
+from ._utils import radius_field
 
 
 class _RingsEffect(Effect):
@@ -13,13 +14,16 @@ class _RingsEffect(Effect):
 
     _N_RINGS = 6
 
-    def __call__(self, t: float, w: int, h: int, palette: Palette) -> np.ndarray:
+    def render_into(self, out: np.ndarray, t: float, palette: Palette, scratch: Scratch) -> None:
+        h, w = out.shape[:2]
         pri = np.array(palette.primary, dtype=np.float32)
         sec = np.array(palette.secondary, dtype=np.float32)
         acc = np.array(palette.accent, dtype=np.float32)
         ring_colors = [pri, sec, acc, pri, sec, acc][: self._N_RINGS]
 
-        frame = np.zeros((h, w, 3), dtype=np.float32)
+        frame = scratch.get("frame", (h, w, 3))
+        blend = scratch.get("blend", (h, w, 3))
+        dist = scratch.get("rings_dist", (h, w))
         frame[:, :] = np.array(palette.dim, dtype=np.float32)
         centers = [
             (w // 4, h // 2),
@@ -31,8 +35,6 @@ class _RingsEffect(Effect):
         ][: self._N_RINGS]
         max_radius = h * 1.5
         ring_width = h / 4.0
-        ys = np.arange(h, dtype=np.float32)[:, np.newaxis]
-        xs = np.arange(w, dtype=np.float32)
 
         for i, (cx, cy) in enumerate(centers):
             speed = 0.15 + i * 0.05
@@ -40,14 +42,16 @@ class _RingsEffect(Effect):
             radius = (phase / 5.0) * max_radius
             if radius < 2:
                 continue
-            dist = np.sqrt((xs - cx) ** 2 + (ys - cy) ** 2)
-            ring = np.exp(-((dist - radius) ** 2) / (2 * ring_width**2))
-            fade = max(0, 1.0 - phase / 5.0)
-            intensity = (ring * fade)[..., np.newaxis]
-            color = ring_colors[i]
-            frame = frame * (1 - intensity) + color[np.newaxis, np.newaxis, :] * intensity
-
-        return frame.astype(np.uint8)
+            np.subtract(radius_field(w, h, cx, cy), radius, out=dist)
+            np.square(dist, out=dist)
+            dist *= -1.0 / (2 * ring_width**2)
+            np.exp(dist, out=dist)
+            dist *= max(0, 1.0 - phase / 5.0)
+            np.subtract(ring_colors[i], frame, out=blend)
+            blend *= dist[..., np.newaxis]
+            frame += blend
+
+        np.copyto(out, frame, casting="unsafe")
 
 
 rings = _RingsEffect()
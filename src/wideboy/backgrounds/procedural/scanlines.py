@@ -4,7 +4,7 @@ import numpy as np
 
 from ...render.palette import Palette
 from ._base import Effect
-from ._utils import palette_array, sample_palette
+from ._utils import grid_x, grid_y, palette_array, sample_palette
 
 
 class _ScanlinesEffect(Effect):
@@ -14,8 +14,8 @@ class _ScanlinesEffect(Effect):
 
     def __call__(self, t: float, w: int, h: int, palette: Palette) -> np.ndarray:
         colors = palette_array(palette)
-        xs = np.arange(w, dtype=np.float32)
-        ys = np.arange(h, dtype=np.float32)[:, np.newaxis]
+        xs = grid_x(w)
+        ys = grid_y(h)
         base = np.sin(xs / 50.0 + t * 0.8) * 0.3 + 0.5
         scan = np.sin(ys * np.pi + t * 3) * 0.15 + 0.75
         v = np.clip(base * scan, 0.0, 1.0)
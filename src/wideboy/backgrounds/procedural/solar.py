@@ -5,7 +5,7 @@ import math
 import numpy as np
 
 from ...render.palette import Palette
-from ._base import Effect
+from ._base import Effect, Scratch
 
 _PLANETS = [
     ("Mercury", 0.39, 0.241, 2.0, (170, 170, 170), 0.3),
@@ -117,14 +117,15 @@ class _SolarEffect(Effect):
         mask = dist <= core_r
         frame[y0:y1, x0:x1] = np.where(mask[..., np.newaxis], _SUN_CORE, frame[y0:y1, x0:x1])
 
-    def __call__(self, t: float, w: int, h: int, palette: Palette) -> np.ndarray:
+    def render_into(self, out: np.ndarray, t: float, palette: Palette, scratch: Scratch) -> None:
+        h, w = out.shape[:2]
         if self._stars_x is None or self._w != w or self._h != h:
             self._init(w, h)
 
         dim = np.array(palette.dim, dtype=np.float32)
         hi = np.array(palette.highlight, dtype=np.float32)
 
-        frame = np.zeros((h, w, 3), dtype=np.float32)
+        frame = scratch.get("frame", (h, w, 3))
         frame[:] = dim
 
         cx, cy = w / 2, h / 2
@@ -170,7 +171,8 @@ class _SolarEffect(Effect):
             else:
                 self._draw_disc(frame, px, py, r, color, w, h)
 
-        return np.clip(frame, 0, 255).astype(np.uint8)
+        np.clip(frame, 0, 255, out=frame)
+        np.copyto(out, frame, casting="unsafe")
 
 
 solar = _SolarEffect()
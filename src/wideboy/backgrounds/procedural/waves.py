@@ -2,9 +2,8 @@ from __future__ import annotations
 
 import numpy as np
 
-from ...render.palette import Palette
-from ._base import Effect
-from ._utils import palette_array, sample_palette
+from ._base import Effect, Scratch
+from ._utils import index_into, linear_field
 
 
 class _WavesEffect(Effect):
@@ -12,14 +11,14 @@ class _WavesEffect(Effect):
     default_palette = "forest"
     tags = ("abstract", "calm")
 
-    def __call__(self, t: float, w: int, h: int, palette: Palette) -> np.ndarray:
-        colors = palette_array(palette)
-        xs = np.arange(w, dtype=np.float32)
-        ys = np.arange(h, dtype=np.float32)
-        wave = np.sin(xs[np.newaxis, :] / 20.0 + t + ys[:, np.newaxis] * 0.3)
-        v = (wave + 1) / 2
-        rgb = sample_palette(colors, v)
-        return rgb.astype(np.uint8)
+    def render_index(self, out: np.ndarray, t: float, scratch: Scratch) -> None:
+        h, w = out.shape
+        v = scratch.get("waves_v", (h, w))
+        np.add(linear_field(w, h, 1 / 20.0, 0.3), t, out=v)
+        np.sin(v, out=v)
+        v += 1
+        v /= 2
+        index_into(v, out, self.levels)
 
 
 waves = _WavesEffect()
@@ -13,6 +13,8 @@ logger = logging.getLogger(__name__)
 class GeneralConfig(BaseModel):
     log_level: str = "info"
     fps: int = 30
+    frame_policy: str = "skip"
+    max_frame_dt: float = 0.25
 
 
 class CanvasConfig(BaseModel):
@@ -43,8 +45,17 @@ class DriverConfig(BaseModel):
     no_drop_privs: bool = True
 
 
+class PanelConfig(BaseModel):
+    x: int = 0
+    y: int = 0
+    rotate: int = 0
+    mirror: bool = False
+
+
 class RemapConfig(BaseModel):
     output_order: list[int] = Field(default_factory=lambda: [0, 1, 2])
+    serpentine: bool = False
+    chains: list[list[PanelConfig]] = Field(default_factory=list)
 
 
 class MatrixConfig(BaseModel):
@@ -53,9 +64,18 @@ class MatrixConfig(BaseModel):
     remap: RemapConfig = Field(default_factory=RemapConfig)
 
 
+class NativeConfig(BaseModel):
+    scale: int = 2
+    dot_size: float = 0.85
+
+
 class DisplayConfig(BaseModel):
     canvas: CanvasConfig = Field(default_factory=CanvasConfig)
     matrix: MatrixConfig = Field(default_factory=MatrixConfig)
+    native: NativeConfig = Field(default_factory=NativeConfig)
+    pipeline: bool | None = None
+    pipeline_mode: str = "mailbox"
+    skip_unchanged: bool = True
 
 
 class HomeAssistantConfig(BaseModel):
@@ -81,6 +101,14 @@ class BrightnessScheduleConfig(BaseModel):
 class BrightnessConfig(BaseModel):
     background: BrightnessScheduleConfig = Field(default_factory=BrightnessScheduleConfig)
     foreground: BrightnessScheduleConfig = Field(default_factory=BrightnessScheduleConfig)
+    master: BrightnessScheduleConfig = Field(default_factory=BrightnessScheduleConfig)
+
+
+class ColorConfig(BaseModel):
+    gamma: float = 1.0
+    cie: bool = False
+    white_balance: list[list[float]] = Field(default_factory=list)
+    hardware_brightness: bool = False
 
 
 class MqttConfig(BaseModel):
@@ -94,6 +122,66 @@ class MqttConfig(BaseModel):
     device_name: str = "Wideboy LED Display"
 
 
+class ProfilingConfig(BaseModel):
+    enabled: bool = False
+    window: int = 900
+    effect_window: int = 300
+    report_interval: float = 60.0
+    capture_dir: str = "profiles"
+    capture_max_duration: float = 300.0
+    capture_top: int = 15
+
+
+class TracingConfig(BaseModel):
+    enabled: bool = False
+    path: str = "traces/wideboy-trace.json"
+    duration: float = 30.0
+    max_events: int = 500_000
+
+
+class WatchdogConfig(BaseModel):
+    enabled: bool = True
+    threshold: float = 2.0
+    dump_dir: str = "stalls"
+    min_interval: float = 300.0
+
+
+class RecordConfig(BaseModel):
+    path: str = "recordings/frames.ring"
+    slots: int = 900
+
+
+class DdpConfig(BaseModel):
+    enabled: bool = False
+    host: str = "127.0.0.1"
+    port: int = 4048
+    fps: float = 30.0
+    keyframe_interval: float = 1.0
+    changed_only: bool = True
+    destination: int = 1
+
+
+class ShmConfig(BaseModel):
+    enabled: bool = False
+    name: str = "wideboy"
+
+
+class PreviewConfig(BaseModel):
+    enabled: bool = False
+    host: str = "0.0.0.0"
+    port: int | None = 8889
+    fps: float = 5.0
+    scale: float = 1.0
+    quality: int = 80
+    snapshot_dir: str = "snapshots"
+
+
+class StandbyConfig(BaseModel):
+    enabled: bool = True
+    interval: float = 1.0
+    clear: bool = False
+
+
 class Settings(BaseSettings):
     model_config = SettingsConfigDict(
         env_prefix="WIDEBOY_",
@@ -107,6 +195,15 @@ class Settings(BaseSettings):
     scenes: ScenesConfig = Field(default_factory=ScenesConfig)
     paths: PathsConfig = Field(default_factory=PathsConfig)
     brightness: BrightnessConfig = Field(default_factory=BrightnessConfig)
+    color: ColorConfig = Field(default_factory=ColorConfig)
+    profiling: ProfilingConfig = Field(default_factory=ProfilingConfig)
+    tracing: TracingConfig = Field(default_factory=TracingConfig)
+    watchdog: WatchdogConfig = Field(default_factory=WatchdogConfig)
+    standby: StandbyConfig = Field(default_factory=StandbyConfig)
+    record: RecordConfig = Field(default_factory=RecordConfig)
+    ddp: DdpConfig = Field(default_factory=DdpConfig)
+    shm: ShmConfig = Field(default_factory=ShmConfig)
+    preview: PreviewConfig = Field(default_factory=PreviewConfig)
     effect_tags: dict[str, list[str]] = Field(default_factory=dict)
 
 
@@ -7,9 +7,10 @@ from ..backgrounds.base import Background
 from ..backgrounds.composite import CompositeBackground
 from ..backgrounds.gif import GifBackground
 from ..backgrounds.image import ImageBackground
+from ..backgrounds.network import NetworkBackground
 from ..backgrounds.slideshow import SlideshowBackground
 from ..core.scene import SceneDef
-from ..render.palette import Palette, PaletteClock
+from ..render.palette import Palette, PaletteClock, ResolvedPalette
 from ..widgets.clock import ClockWidget
 from ..widgets.tile_grid import Tile, TileGridWidget
 
@@ -21,6 +22,7 @@ def _get_background_types() -> dict[str, type[Background]]:
         "image": ImageBackground,
         "slideshow": SlideshowBackground,
         "gif": GifBackground,
+        "network": NetworkBackground,
     }
     try:
         from ..backgrounds.procedural import ProceduralBackground
@@ -105,7 +107,7 @@ class _SharedClockResolver:
         return self._base_name
 
     @property
-    def palette(self) -> Palette:
+    def palette(self) -> ResolvedPalette:
         return self._clock.resolve(self._base_name)
 
 
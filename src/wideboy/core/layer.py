@@ -17,6 +17,7 @@ class Layer(abc.ABC):
         self.visible = visible
         self._cached_surface: pygame.Surface | None = None
         self._dirty = True
+        self.redrawn = False
 
     def mark_dirty(self) -> None:
         self._dirty = True
@@ -31,9 +32,11 @@ class Layer(abc.ABC):
         return None
 
     def render(self, target: pygame.Surface, brightness: float = 1.0) -> None:
+        self.redrawn = False
         if not self.visible:
             return
         if self._dirty or self._cached_surface is None:
+            self.redrawn = True
             size = self._surface_size() or target.get_size()
             if self._cached_surface is None or self._cached_surface.get_size() != size:
                 self._cached_surface = pygame.Surface(size, pygame.SRCALPHA)
@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import logging
+import time
+from collections.abc import Callable
+
+from ..perf.profiler import RollingStats
+
+logger = logging.getLogger(__name__)
+
+POLICIES = ("catch_up", "skip", "stretch")
+
+
+class FrameScheduler:
+    def __init__(
+        self,
+        fps: float,
+        policy: str = "skip",
+        max_dt: float = 0.25,
+        max_catch_up: int = 5,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if policy not in POLICIES:
+            raise ValueError(f"Unknown frame policy '{policy}' (expected one of {POLICIES})")
+        self.frame_time = 1.0 / fps
+        self.policy = policy
+        self.max_dt = max_dt
+        self.max_catch_up = max_catch_up
+        self._clock = clock
+        self._deadline: float | None = None
+        self._last_begin: float | None = None
+        self.frames = 0
+        self.late_frames = 0
+        self.skipped = 0
+        self.jitter = RollingStats(300)
+
+    def reset(self) -> None:
+        self._deadline = None
+        self._last_begin = None
+
+    def begin_frame(self) -> float:
+        now = self._clock()
+        if self._last_begin is None:
+            self._deadline = now
+            self._last_begin = now
+            return self.frame_time
+        if self._deadline is not None:
+            self.jitter.add(abs(now - self._deadline))
+        dt = min(now - self._last_begin, self.max_dt)
+        self._last_begin = now
+        return dt
+
+    def end_frame(self) -> float:
+        now = self._clock()
+        self.frames += 1
+        deadline = self._deadline + self.frame_time
+        if now <= deadline:
+            self._deadline = deadline
+            return deadline - now
+
+        self.late_frames += 1
+        behind = int((now - deadline) / self.frame_time)
+        if self.policy == "stretch":
+            self._deadline = now
+        elif self.policy == "skip" or behind >= self.max_catch_up:
+            self.skipped += behind + 1
+            self._deadline = deadline + (behind + 1) * self.frame_time
+            return self._deadline - now
+        else:
+            self._deadline = deadline
+        return 0.0
+
+    def summary(self) -> dict[str, float]:
+        jitter = self.jitter.summary()
+        return {
+            "frames": self.frames,
+            "late": self.late_frames,
+            "skipped": self.skipped,
+            "jitter_p50_ms": jitter["p50"],
+            "jitter_p95_ms": jitter["p95"],
+            "jitter_max_ms": jitter["max"],
+        }
+
+    def log_summary(self) -> None:
+        if not self.frames:
+            return
+        s = self.summary()
+        logger.info(
+            "Frame scheduler (%s): %d frames, %d late (%.1f%%), %d slots skipped, "
+            "jitter p50 %.2fms p95 %.2fms max %.2fms",
+            self.policy,
+            s["frames"],
+            s["late"],
+            100.0 * s["late"] / s["frames"],
+            s["skipped"],
+            s["jitter_p50_ms"],
+            s["jitter_p95_ms"],
+            s["jitter_max_ms"],
+        )
@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+
+logger = logging.getLogger(__name__)
+
+
+class Standby:
+    def __init__(self, interval: float = 1.0, clear: bool = False) -> None:
+        self.interval = interval
+        self.clear = clear
+        self.active = False
+        self.entered = 0
+        self.total_time = 0.0
+        self._since = 0.0
+        self._event: asyncio.Event | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    def bind(self, loop: asyncio.AbstractEventLoop | None = None) -> None:
+        self._loop = loop or asyncio.get_running_loop()
+        self._event = asyncio.Event()
+
+    def enter(self) -> None:
+        self.active = True
+        self.entered += 1
+        self._since = time.monotonic()
+        logger.info("Display off, entering standby (%.1fs tick)", self.interval)
+
+    def leave(self) -> None:
+        self.active = False
+        elapsed = time.monotonic() - self._since
+        self.total_time += elapsed
+        logger.info("Display on, leaving standby after %.1fs", elapsed)
+
+    def wake(self) -> None:
+        if self._loop is None or self._event is None:
+            return
+        try:
+            self._loop.call_soon_threadsafe(self._event.set)
+        except RuntimeError:
+            pass
+
+    async def wait(self) -> None:
+        if self._event is None:
+            await asyncio.sleep(self.interval)
+            return
+        try:
+            await asyncio.wait_for(self._event.wait(), self.interval)
+        except TimeoutError:
+            pass
+        self._event.clear()
@@ -15,6 +15,19 @@ class Display(abc.ABC):
     @abc.abstractmethod
     def present(self, surface: pygame.Surface) -> None: ...
 
+    def idle(self) -> None:
+        pass
+
+    @property
+    def wants_frame(self) -> bool:
+        return False
+
+    def clear(self) -> None:
+        pass
+
+    def set_brightness(self, level: float) -> bool:
+        return False
+
     def stop(self) -> None:
         pass
 
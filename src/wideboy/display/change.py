@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import logging
+from collections.abc import Hashable
+
+import numpy as np
+import pygame
+
+logger = logging.getLogger(__name__)
+
+
+class FrameChangeDetector:
+    def __init__(self) -> None:
+        self._previous: np.ndarray | None = None
+        self._clean_key: Hashable | None = None
+        self.presented = 0
+        self.skipped = 0
+        self.hinted = 0
+
+    def changed(self, surface: pygame.Surface, clean_key: Hashable | None = None) -> bool:
+        if (
+            clean_key is not None
+            and clean_key == self._clean_key
+            and self._previous is not None
+            and self._previous.shape == surface.get_size()
+        ):
+            self.skipped += 1
+            self.hinted += 1
+            return False
+        self._clean_key = clean_key
+
+        proxy = surface.get_view("2")
+        current = np.asarray(proxy)
+        if self._previous is not None and self._previous.shape == current.shape:
+            if np.array_equal(current, self._previous):
+                del current, proxy
+                self.skipped += 1
+                return False
+            np.copyto(self._previous, current)
+        else:
+            self._previous = current.copy()
+        del current, proxy
+        self.presented += 1
+        return True
+
+    def reset(self) -> None:
+        self._previous = None
+        self._clean_key = None
+
+    def summary(self) -> dict[str, int]:
+        return {"presented": self.presented, "skipped": self.skipped, "hinted": self.hinted}
+
+    def log_summary(self) -> None:
+        total = self.presented + self.skipped
+        if not total:
+            return
+        logger.info(
+            "Unchanged frames: %d of %d skipped (%.1f%%, %d without comparing)",
+            self.skipped,
+            total,
+            100.0 * self.skipped / total,
+            self.hinted,
+        )
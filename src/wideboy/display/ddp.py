@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+import logging
+import socket
+import threading
+import time
+
+import numpy as np
+import pygame
+
+from .base import Display
+
+logger = logging.getLogger(__name__)
+
+HEADER_SIZE = 10
+MAX_PAYLOAD = 1440
+FLAG_VERSION = 0x40
+FLAG_PUSH = 0x01
+TYPE_RGB24 = 0x0B
+
+
+class DdpDisplay(Display):
+    def __init__(self, settings) -> None:
+        self.settings = settings
+        cfg = settings.ddp
+        self.address = (cfg.host, cfg.port)
+        self.min_interval = 1.0 / cfg.fps if cfg.fps > 0 else 0.0
+        self.keyframe_interval = cfg.keyframe_interval
+        self.changed_only = cfg.changed_only
+        self.destination = cfg.destination
+        self._sock: socket.socket | None = None
+        self._cond = threading.Condition()
+        self._thread: threading.Thread | None = None
+        self._running = False
+        self._size: tuple[int, int] | None = None
+        self._rgb: np.ndarray | None = None
+        self._sent: np.ndarray | None = None
+        self._diff: np.ndarray | None = None
+        self._packets: np.ndarray | None = None
+        self._lengths: list[int] = []
+        self._views: list[memoryview] = []
+        self._sequence = 0
+        self._last_keyframe = 0.0
+        self._pending = False
+        self._submitted_at = 0.0
+        self.frames = 0
+        self.packets = 0
+        self.bytes = 0
+        self.rate_limited = 0
+        self.latest_latency = 0.0
+
+    def start(self) -> None:
+        self._sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name="ddp-sender", daemon=True)
+        self._thread.start()
+        logger.info("DDP output to %s:%d", *self.address)
+
+    def _allocate(self, size: tuple[int, int]) -> None:
+        w, h = size
+        length = w * h * 3
+        n = -(-length // MAX_PAYLOAD)
+        self._size = size
+        self._rgb = np.zeros(n * MAX_PAYLOAD, dtype=np.uint8)
+        self._sent = np.zeros((n, MAX_PAYLOAD), dtype=np.uint8)
+        self._diff = np.zeros((n, MAX_PAYLOAD), dtype=bool)
+        self._packets = np.zeros((n, HEADER_SIZE + MAX_PAYLOAD), dtype=np.uint8)
+        self._lengths = [min(MAX_PAYLOAD, length - i * MAX_PAYLOAD) for i in range(n)]
+        for i, chunk in enumerate(self._lengths):
+            header = self._packets[i, :HEADER_SIZE]
+            header[0] = FLAG_VERSION
+            header[2] = TYPE_RGB24
+            header[3] = self.destination
+            header[4:8] = np.frombuffer((i * MAX_PAYLOAD).to_bytes(4, "big"), dtype=np.uint8)
+            header[8:10] = np.frombuffer(chunk.to_bytes(2, "big"), dtype=np.uint8)
+        self._views = [
+            memoryview(self._packets[i, : HEADER_SIZE + c]) for i, c in enumerate(self._lengths)
+        ]
+        self._sequence = 0
+        self._last_keyframe = 0.0
+
+    def present(self, surface: pygame.Surface) -> None:
+        if self._thread is None:
+            return
+        w, h = surface.get_size()
+        with self._cond:
+            if self._size != (w, h):
+                self._allocate((w, h))
+            pixels = pygame.surfarray.pixels3d(surface)
+            np.copyto(self._rgb[: w * h * 3].reshape(h, w, 3), pixels.transpose(1, 0, 2))
+            del pixels
+            if self._pending:
+                self.rate_limited += 1
+            self._pending = True
+            self._submitted_at = time.perf_counter()
+            self._cond.notify_all()
+
+    def _run(self) -> None:
+        last_send = 0.0
+        while True:
+            with self._cond:
+                while not self._pending and self._running:
+                    self._cond.wait(self.keyframe_interval or None)
+                    if self._rgb is not None and self._keyframe_due():
+                        break
+                if not self._running:
+                    return
+            wait = last_send + self.min_interval - time.perf_counter()
+            if wait > 0:
+                time.sleep(wait)
+            with self._cond:
+                if self._rgb is None:
+                    continue
+                submitted = self._submitted_at
+                self._pending = False
+                send = self._prepare()
+            if send:
+                self._send(send)
+                self.latest_latency = time.perf_counter() - submitted
+            last_send = time.perf_counter()
+
+    def _keyframe_due(self) -> bool:
+        return (
+            self.keyframe_interval > 0
+            and time.monotonic() - self._last_keyframe >= self.keyframe_interval
+        )
+
+    def _prepare(self) -> list[memoryview]:
+        current = self._rgb.reshape(self._sent.shape)
+        if self.changed_only and not self._keyframe_due():
+            np.not_equal(current, self._sent, out=self._diff)
+            send = np.flatnonzero(self._diff.any(axis=1)).tolist()
+        else:
+            send = list(range(len(self._lengths)))
+            self._last_keyframe = time.monotonic()
+        if not send:
+            return []
+        self._sequence = self._sequence % 15 + 1
+        for i in send:
+            np.copyto(self._packets[i, HEADER_SIZE:], current[i])
+            np.copyto(self._sent[i], current[i])
+            self._packets[i, 0] = FLAG_VERSION
+            self._packets[i, 1] = self._sequence
+        self._packets[send[-1], 0] = FLAG_VERSION | FLAG_PUSH
+        return [self._views[i] for i in send]
+
+    def _send(self, views: list[memoryview]) -> None:
+        for view in views:
+            try:
+                self.bytes += self._sock.sendto(view, self.address)
+            except OSError:
+                logger.warning("DDP send to %s:%d failed", *self.address, exc_info=True)
+                return
+            self.packets += 1
+        self.frames += 1
+
+    def stop(self) -> None:
+        with self._cond:
+            self._running = False
+            self._cond.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout=2)
+            self._thread = None
+        if self._sock is not None:
+            self._sock.close()
+            self._sock = None
+        logger.info(
+            "DDP output: %d frames, %d packets, %.1f MiB, %d frames coalesced by the fps limit",
+            self.frames,
+            self.packets,
+            self.bytes / (1024 * 1024),
+            self.rate_limited,
+        )
@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+import pygame
+
+from .base import Display
+
+
+class FanoutDisplay(Display):
+    def __init__(self, displays: list[Display]) -> None:
+        self.displays = displays
+
+    def start(self) -> None:
+        for display in self.displays:
+            display.start()
+
+    def present(self, surface: pygame.Surface) -> None:
+        for display in self.displays:
+            display.present(surface)
+
+    def set_brightness(self, level: float) -> bool:
+        return self.displays[0].set_brightness(level)
+
+    def idle(self) -> None:
+        for display in self.displays:
+            display.idle()
+
+    @property
+    def wants_frame(self) -> bool:
+        return any(display.wants_frame for display in self.displays)
+
+    def clear(self) -> None:
+        for display in self.displays:
+            display.clear()
+
+    def stop(self) -> None:
+        for display in self.displays:
+            display.stop()
@@ -1,20 +1,36 @@
 from __future__ import annotations
 
 import logging
+import sys
 
 import pygame
 
 from .base import Display
-from .remap import remap_logical_to_physical
+from .remap import layout_from_settings
 
 logger = logging.getLogger(__name__)
 
 
+def _raw_mode(shifts: tuple[int, ...]) -> str:
+    order = ["X"] * 4
+    for channel, shift in zip("RGB", shifts[:3]):
+        order[shift // 8] = channel
+    if sys.byteorder == "big":
+        order.reverse()
+    return "".join(order)
+
+
 class HardwareDisplay(Display):
     def __init__(self, settings) -> None:
         self.settings = settings
         self.matrix = None
         self.buffer = None
+        self._layout = None
+        self._format: tuple | None = None
+        self._raw_mode = "BGRX"
+        self._physical = None
+        self._image = None
+        self.swaps = 0
 
     def start(self) -> None:
         try:
@@ -60,21 +76,49 @@ class HardwareDisplay(Display):
             d.parallel,
         )
 
+    def _allocate(self, surface: pygame.Surface) -> None:
+        import numpy as np
+        from PIL import Image
+
+        if surface.get_bytesize() != 4:
+            raise ValueError("HardwareDisplay needs a 32-bit surface")
+        if self._layout is None or self._layout.canvas_size != surface.get_size():
+            self._layout = layout_from_settings(self.settings)
+        rows, cols = self._layout.shape
+        self._format = (surface.get_size(), surface.get_pitch(), surface.get_shifts())
+        self._raw_mode = _raw_mode(surface.get_shifts())
+        self._physical = np.zeros(rows * cols, dtype=np.uint32)
+        self._image = Image.new("RGB", (cols, rows))
+        logger.info("Physical frame buffer allocated (%dx%d)", cols, rows)
+
     def present(self, surface: pygame.Surface) -> None:
         if self.matrix is None:
             return
+        if self._format != (surface.get_size(), surface.get_pitch(), surface.get_shifts()):
+            self._allocate(surface)
+
         import numpy as np
 
-        pixels = pygame.surfarray.pixels3d(surface)
-        logical = np.transpose(pixels, (1, 0, 2))
-        order = self.settings.display.matrix.remap.output_order
-        physical = remap_logical_to_physical(logical, order)
+        proxy = surface.get_buffer()
+        src = np.frombuffer(proxy, dtype=np.uint32)
+        self._layout.remap(src, self._physical, surface.get_pitch() // 4)
+        del src, proxy
 
-        from PIL import Image
+        self._image.frombytes(self._physical, "raw", self._raw_mode)
+        self.buffer.SetImage(self._image)
+        self.buffer = self.matrix.SwapOnVSync(self.buffer)
+        self.swaps += 1
+
+    def set_brightness(self, level: float) -> bool:
+        if self.matrix is None:
+            return False
+        driver = self.settings.display.matrix.driver
+        self.matrix.brightness = max(0, min(100, round(driver.brightness * level)))
+        return True
 
-        image = Image.frombytes("RGB", (physical.shape[1], physical.shape[0]), physical.tobytes())
-        self.buffer.SetImage(image)
-        self.matrix.SwapOnVSync(self.buffer)
+    def clear(self) -> None:
+        if self.matrix is not None:
+            self.matrix.Clear()
 
     def stop(self) -> None:
         if self.matrix is not None:
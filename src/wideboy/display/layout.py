@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy as np
+
+ROTATIONS = (0, 90, 180, 270)
+
+
+@dataclass(frozen=True)
+class Panel:
+    x: int
+    y: int
+    rotate: int = 0
+    mirror: bool = False
+
+
+def segment_layout(width: int, height: int, output_order: list[int]) -> PanelLayout:
+    seg_w = width // len(output_order)
+    chains = [[Panel(src * seg_w, 0)] for src in output_order]
+    return PanelLayout(chains, (seg_w, height), (width, height))
+
+
+def grid_layout(
+    width: int,
+    height: int,
+    panel_size: tuple[int, int],
+    chain: int,
+    parallel: int,
+    output_order: list[int] | None = None,
+    serpentine: bool = False,
+) -> PanelLayout:
+    pw, ph = panel_size
+    columns, rows = width // pw, height // ph
+    if columns * rows != chain * parallel:
+        raise ValueError(
+            f"{columns}x{rows} panel grid does not match {parallel} chains of {chain} panels"
+        )
+    panels = []
+    for row in range(rows):
+        flipped = serpentine and row % 2 == 1
+        cols = range(columns - 1, -1, -1) if flipped else range(columns)
+        panels.extend(Panel(col * pw, row * ph, rotate=180 if flipped else 0) for col in cols)
+    groups = [panels[i * chain : (i + 1) * chain] for i in range(parallel)]
+    if output_order and len(output_order) == parallel:
+        groups = [groups[src] for src in output_order]
+    return PanelLayout(groups, panel_size, (width, height), chain_length=chain)
+
+
+class PanelLayout:
+    def __init__(
+        self,
+        chains: list[list[Panel]],
+        panel_size: tuple[int, int],
+        canvas_size: tuple[int, int],
+        chain_length: int | None = None,
+    ) -> None:
+        self.chains = chains
+        self.panel_size = panel_size
+        self.canvas_size = canvas_size
+        self.chain_length = chain_length or max((len(c) for c in chains), default=0)
+        self._validate()
+        pw, ph = panel_size
+        self.shape = (ph * len(chains), pw * self.chain_length)
+        self._indices: dict[int, np.ndarray] = {}
+        self._blank: np.ndarray | None = None
+
+    def _validate(self) -> None:
+        pw, ph = self.panel_size
+        width, height = self.canvas_size
+        for j, chain in enumerate(self.chains):
+            if len(chain) > self.chain_length:
+                raise ValueError(f"Chain {j} has {len(chain)} panels (max {self.chain_length})")
+            for panel in chain:
+                if panel.rotate not in ROTATIONS:
+                    raise ValueError(f"Panel rotation must be one of {ROTATIONS}: {panel}")
+                fw, fh = (ph, pw) if panel.rotate in (90, 270) else (pw, ph)
+                if panel.x < 0 or panel.y < 0 or panel.x + fw > width or panel.y + fh > height:
+                    raise ValueError(f"Panel outside the {width}x{height} canvas: {panel}")
+
+    def index(self, stride: int | None = None) -> np.ndarray:
+        if stride is None:
+            stride = self.canvas_size[0]
+        cached = self._indices.get(stride)
+        if cached is not None:
+            return cached
+        pw, ph = self.panel_size
+        index = np.zeros(self.shape, dtype=np.intp)
+        valid = np.zeros(self.shape, dtype=bool)
+        pr, pc = np.mgrid[0:ph, 0:pw]
+        for j, chain in enumerate(self.chains):
+            for i, panel in enumerate(chain):
+                c = pw - 1 - pc if panel.mirror else pc
+                if panel.rotate == 0:
+                    lx, ly = c, pr
+                elif panel.rotate == 90:
+                    lx, ly = ph - 1 - pr, c
+                elif panel.rotate == 180:
+                    lx, ly = pw - 1 - c, ph - 1 - pr
+                else:
+                    lx, ly = pr, pw - 1 - c
+                block = (slice(j * ph, (j + 1) * ph), slice(i * pw, (i + 1) * pw))
+                index[block] = (panel.y + ly) * stride + panel.x + lx
+                valid[block] = True
+        self._blank = None if valid.all() else ~valid.ravel()
+        cached = self._indices[stride] = index.ravel()
+        return cached
+
+    def remap(self, src: np.ndarray, out: np.ndarray, stride: int | None = None) -> np.ndarray:
+        index = self.index(stride)
+        np.take(src, index, axis=0, out=out, mode="clip")
+        if self._blank is not None:
+            blank = self._blank if out.ndim == 1 else self._blank[:, None]
+            np.copyto(out, 0, where=blank)
+        return out
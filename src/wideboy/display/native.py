@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import logging
+
+import numpy as np
+import pygame
+
+from .base import Display
+
+logger = logging.getLogger(__name__)
+
+
+def led_mask(size: tuple[int, int], scale: int, dot_size: float) -> pygame.Surface | None:
+    if scale < 2 or dot_size >= 1.0:
+        return None
+    centre = (scale - 1) / 2.0
+    yy, xx = np.mgrid[0:scale, 0:scale]
+    distance = np.hypot(xx - centre, yy - centre) / (scale / 2.0)
+    cell = np.clip((dot_size - distance) / 0.15 + 0.5, 0.0, 1.0)
+    if cell.min() >= 1.0:
+        return None
+    w, h = size
+    tiled = np.tile((cell.T * 255).astype(np.uint8), (w, h))
+    mask = pygame.Surface((w * scale, h * scale), 0, 32)
+    pygame.surfarray.blit_array(mask, np.repeat(tiled[:, :, None], 3, axis=2))
+    return mask
+
+
+class NativeDisplay(Display):
+    def __init__(self, settings) -> None:
+        self.settings = settings
+        cfg = settings.display.native
+        self.scale = max(1, cfg.scale)
+        self.dot_size = cfg.dot_size
+        self.window: pygame.Surface | None = None
+        self._mask: pygame.Surface | None = None
+        self._scaled: pygame.Surface | None = None
+
+    def start(self) -> None:
+        canvas = self.settings.display.canvas
+        size = (canvas.width * self.scale, canvas.height * self.scale)
+        self.window = pygame.display.set_mode(size)
+        if self.scale > 1 and self.window.get_bitsize() != 32:
+            self._scaled = pygame.Surface(size, pygame.SRCALPHA)
+        self._mask = led_mask((canvas.width, canvas.height), self.scale, self.dot_size)
+        logger.info(
+            "Native emulator started (%dx%d at %dx, %s)",
+            canvas.width,
+            canvas.height,
+            self.scale,
+            "LED dots" if self._mask is not None else "square pixels",
+        )
+
+    def present(self, surface: pygame.Surface) -> None:
+        if self.window is None:
+            return
+        if self.scale == 1:
+            self.window.blit(surface, (0, 0))
+        elif self._scaled is not None:
+            pygame.transform.scale(surface, self._scaled.get_size(), self._scaled)
+            self.window.blit(self._scaled, (0, 0))
+        else:
+            pygame.transform.scale(surface, self.window.get_size(), self.window)
+        if self._mask is not None:
+            self.window.blit(self._mask, (0, 0), special_flags=pygame.BLEND_RGB_MULT)
+        pygame.display.flip()
@@ -0,0 +1,21 @@
+from __future__ import annotations
+
+import logging
+
+import pygame
+
+from .base import Display
+
+logger = logging.getLogger(__name__)
+
+
+class NullDisplay(Display):
+    def __init__(self, settings=None) -> None:
+        self.settings = settings
+        self.frames = 0
+
+    def start(self) -> None:
+        logger.info("Null display started (frames are discarded)")
+
+    def present(self, surface: pygame.Surface) -> None:
+        self.frames += 1
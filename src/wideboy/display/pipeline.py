@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections import deque
+
+import numpy as np
+import pygame
+
+from .base import Display
+
+logger = logging.getLogger(__name__)
+
+MODES = ("mailbox", "queue")
+
+
+class PipelinedDisplay(Display):
+    def __init__(self, inner: Display, buffers: int = 2, mode: str = "queue") -> None:
+        if mode not in MODES:
+            raise ValueError(f"Unknown pipeline mode '{mode}' (expected one of {MODES})")
+        self.inner = inner
+        self.mode = mode
+        self._n_buffers = max(3 if mode == "mailbox" else 2, buffers)
+        self._free: list[pygame.Surface] = []
+        self._pending: deque[pygame.Surface] = deque()
+        self._size: tuple[int, int] | None = None
+        self._cond = threading.Condition()
+        self._thread: threading.Thread | None = None
+        self._running = False
+        self._presenting = False
+        self.frames = 0
+        self.submitted = 0
+        self.busy = 0
+        self.dropped = 0
+        self.waits = 0
+        self.wait_time = 0.0
+        self.present_time = 0.0
+
+    def start(self) -> None:
+        self.inner.start()
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name="display-present", daemon=True)
+        self._thread.start()
+        logger.info("Pipelined present enabled (%s, %d buffers)", self.mode, self._n_buffers)
+
+    def _allocate(self, size: tuple[int, int]) -> None:
+        self._size = size
+        self._free = [pygame.Surface(size, 0, 32) for _ in range(self._n_buffers)]
+
+    def _acquire(self) -> pygame.Surface | None:
+        with self._cond:
+            if not self._free:
+                self.waits += 1
+                start = time.perf_counter()
+                while not self._free and self._running:
+                    self._cond.wait()
+                self.wait_time += time.perf_counter() - start
+            if not self._running:
+                return None
+            return self._free.pop()
+
+    def _drain(self) -> None:
+        with self._cond:
+            while (self._pending or self._presenting) and self._running:
+                self._cond.wait()
+
+    def present(self, surface: pygame.Surface) -> None:
+        if self._thread is None:
+            self.inner.present(surface)
+            return
+        if self._size != surface.get_size():
+            self._drain()
+            self._allocate(surface.get_size())
+        buf = self._acquire()
+        if buf is None:
+            return
+        dst = pygame.surfarray.pixels3d(buf)
+        src = pygame.surfarray.pixels3d(surface)
+        np.copyto(dst, src)
+        del dst, src
+        with self._cond:
+            self.submitted += 1
+            if self._presenting or self._pending:
+                self.busy += 1
+            if self.mode == "mailbox" and self._pending:
+                self._free.append(self._pending.popleft())
+                self.dropped += 1
+            self._pending.append(buf)
+            self._cond.notify_all()
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._pending and self._running:
+                    self._cond.wait()
+                if not self._pending:
+                    return
+                buf = self._pending.popleft()
+                self._presenting = True
+            start = time.perf_counter()
+            try:
+                self.inner.present(buf)
+            except Exception:
+                logger.exception("Display present failed")
+            self.present_time += time.perf_counter() - start
+            with self._cond:
+                self._presenting = False
+                self._free.append(buf)
+                self.frames += 1
+                self._cond.notify_all()
+
+    def set_brightness(self, level: float) -> bool:
+        return self.inner.set_brightness(level)
+
+    def idle(self) -> None:
+        self.inner.idle()
+
+    @property
+    def wants_frame(self) -> bool:
+        return self.inner.wants_frame
+
+    def clear(self) -> None:
+        self._drain()
+        self.inner.clear()
+
+    def summary(self) -> dict[str, float]:
+        return {
+            "frames": self.frames,
+            "submitted": self.submitted,
+            "busy": self.busy,
+            "dropped": self.dropped,
+            "waits": self.waits,
+            "wait_ms": self.wait_time * 1000.0,
+            "present_ms": self.present_time * 1000.0 / self.frames if self.frames else 0.0,
+        }
+
+    def stop(self) -> None:
+        with self._cond:
+            self._running = False
+            self._cond.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout=2)
+            self._thread = None
+        if self.frames:
+            s = self.summary()
+            logger.info(
+                "Pipelined present (%s): %d of %d frames shown, output busy for %d (%.1f%%), "
+                "%d dropped, %d back-pressure waits (%.2fms total), %.2fms mean present",
+                self.mode,
+                s["frames"],
+                s["submitted"],
+                s["busy"],
+                100.0 * s["busy"] / max(1, s["submitted"]),
+                s["dropped"],
+                s["waits"],
+                s["wait_ms"],
+                s["present_ms"],
+            )
+        self.inner.stop()
@@ -0,0 +1,270 @@
+from __future__ import annotations
+
+import io
+import logging
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import Future
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pygame
+from PIL import Image
+
+from .base import Display
+
+logger = logging.getLogger(__name__)
+
+BOUNDARY = "wideboyframe"
+INDEX = (
+    b"<!doctype html><title>wideboy</title>"
+    b'<body style="margin:0;background:#000">'
+    b'<img src="/stream.mjpg" style="width:100%;image-rendering:pixelated">'
+)
+
+
+class PreviewDisplay(Display):
+    def __init__(
+        self,
+        settings,
+        on_snapshot: Callable[[dict[str, Any]], None] | None = None,
+    ) -> None:
+        cfg = settings.preview
+        self.settings = settings
+        self.host = cfg.host
+        self.port = cfg.port
+        self.interval = 1.0 / cfg.fps if cfg.fps > 0 else 0.0
+        self.scale = cfg.scale
+        self.quality = cfg.quality
+        self.snapshot_dir = Path(cfg.snapshot_dir)
+        self.on_snapshot = on_snapshot
+        self._cond = threading.Condition()
+        self._frame: np.ndarray | None = None
+        self._version = 0
+        self._jobs: list[tuple[str, Future]] = []
+        self._clients = 0
+        self._missed = False
+        self._jpeg = b""
+        self._jpeg_version = -1
+        self._running = False
+        self._thread: threading.Thread | None = None
+        self._server: ThreadingHTTPServer | None = None
+        self.encoded = 0
+        self.encode_time = 0.0
+
+    def start(self) -> None:
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name="preview-encoder", daemon=True)
+        self._thread.start()
+        if self.port is None:
+            return
+        self._server = ThreadingHTTPServer((self.host, self.port), _handler(self))
+        self._server.daemon_threads = True
+        threading.Thread(
+            target=self._server.serve_forever,
+            kwargs={"poll_interval": 0.1},
+            name="preview-http",
+            daemon=True,
+        ).start()
+        logger.info("Preview at http://%s:%d/", *self._server.server_address[:2])
+
+    @property
+    def address(self) -> tuple[str, int] | None:
+        return self._server.server_address[:2] if self._server is not None else None
+
+    @property
+    def wants_frame(self) -> bool:
+        return self._missed and bool(self._clients or self._jobs)
+
+    def present(self, surface: pygame.Surface) -> None:
+        w, h = surface.get_size()
+        with self._cond:
+            if not self._clients and not self._jobs:
+                self._missed = True
+                return
+            if self._frame is None or self._frame.shape[:2] != (h, w):
+                self._frame = np.zeros((h, w, 3), dtype=np.uint8)
+            pixels = pygame.surfarray.pixels3d(surface)
+            np.copyto(self._frame, pixels.transpose(1, 0, 2))
+            del pixels
+            self._missed = False
+            self._version += 1
+            self._cond.notify_all()
+
+    def snapshot(self, name: str = "") -> Future:
+        stem = name.strip() or datetime.now().strftime("%Y%m%d-%H%M%S")
+        return self.request(f"snapshot:{Path(stem).name}")
+
+    def request(self, kind: str) -> Future:
+        future: Future = Future()
+        with self._cond:
+            self._jobs.append((kind, future))
+            self._cond.notify_all()
+        return future
+
+    def _image(self) -> Image.Image:
+        with self._cond:
+            image = Image.fromarray(self._frame.copy())
+        if self.scale != 1:
+            size = (
+                max(1, round(image.width * self.scale)),
+                max(1, round(image.height * self.scale)),
+            )
+            image = image.resize(size, Image.NEAREST)
+        return image
+
+    def _encode(self, image: Image.Image, fmt: str) -> bytes:
+        start = time.perf_counter()
+        buf = io.BytesIO()
+        if fmt == "JPEG":
+            image.save(buf, "JPEG", quality=self.quality)
+        else:
+            image.save(buf, "PNG")
+        self.encoded += 1
+        self.encode_time += time.perf_counter() - start
+        return buf.getvalue()
+
+    def _run(self) -> None:
+        last = 0.0
+        while True:
+            with self._cond:
+                while self._running and not self._jobs_due() and not self._stream_due():
+                    self._cond.wait(self.interval or None)
+                if not self._running:
+                    break
+                jobs: list[tuple[str, Future]] = []
+                if self._jobs_due():
+                    jobs, self._jobs = self._jobs, []
+                version = self._version
+                has_frame = self._frame is not None
+            for kind, future in jobs:
+                if not has_frame:
+                    future.set_exception(RuntimeError("No frame presented yet"))
+                    continue
+                try:
+                    future.set_result(self._job(kind))
+                except Exception as exc:
+                    logger.exception("Preview %s failed", kind)
+                    future.set_exception(exc)
+            wait = last + self.interval - time.perf_counter()
+            if has_frame and self._clients and version != self._jpeg_version and wait <= 0:
+                jpeg = self._encode(self._image(), "JPEG")
+                with self._cond:
+                    self._jpeg, self._jpeg_version = jpeg, version
+                    self._cond.notify_all()
+                last = time.perf_counter()
+            elif wait > 0 and not jobs:
+                time.sleep(wait)
+        for _, future in self._jobs:
+            future.cancel()
+
+    def _jobs_due(self) -> bool:
+        return bool(self._jobs) and not self._missed
+
+    def _stream_due(self) -> bool:
+        return (
+            bool(self._clients) and self._frame is not None and self._version != self._jpeg_version
+        )
+
+    def _job(self, kind: str) -> Any:
+        if kind == "png":
+            return self._encode(self._image(), "PNG")
+        if kind == "jpeg":
+            return self._encode(self._image(), "JPEG")
+        name = kind.partition(":")[2]
+        self.snapshot_dir.mkdir(parents=True, exist_ok=True)
+        path = self.snapshot_dir / f"{name}.png"
+        path.write_bytes(self._encode(self._image(), "PNG"))
+        result = {"path": str(path), "timestamp": time.time()}
+        logger.info("Saved snapshot %s", path)
+        if self.on_snapshot is not None:
+            self.on_snapshot(result)
+        return result
+
+    def frames(self):
+        with self._cond:
+            self._clients += 1
+            self._cond.notify_all()
+        try:
+            seen = -1
+            while True:
+                with self._cond:
+                    while self._running and self._jpeg_version == seen:
+                        self._cond.wait(1.0)
+                    if not self._running:
+                        return
+                    seen, jpeg = self._jpeg_version, self._jpeg
+                yield jpeg
+        finally:
+            with self._cond:
+                self._clients -= 1
+
+    def stop(self) -> None:
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+        with self._cond:
+            self._running = False
+            self._cond.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout=2)
+            self._thread = None
+        if self.encoded:
+            logger.info(
+                "Preview: %d frames encoded, %.2fms mean",
+                self.encoded,
+                self.encode_time * 1000.0 / self.encoded,
+            )
+
+
+def _handler(preview: PreviewDisplay) -> type[BaseHTTPRequestHandler]:
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, format: str, *args: Any) -> None:
+            logger.debug("Preview %s - %s", self.address_string(), format % args)
+
+        def do_GET(self) -> None:
+            path = self.path.split("?", 1)[0]
+            if path == "/":
+                self._send(200, "text/html", INDEX)
+            elif path in ("/frame.png", "/frame.jpg"):
+                try:
+                    body = preview.request("png" if path.endswith("png") else "jpeg").result(5)
+                except Exception:
+                    self._send(503, "text/plain", b"No frame available\n")
+                    return
+                self._send(200, "image/png" if path.endswith("png") else "image/jpeg", body)
+            elif path == "/stream.mjpg":
+                self._stream()
+            else:
+                self._send(404, "text/plain", b"Not found\n")
+
+        def _send(self, status: int, content_type: str, body: bytes) -> None:
+            self.send_response(status)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+            self.send_header("Cache-Control", "no-store")
+            self.end_headers()
+            self.wfile.write(body)
+
+        def _stream(self) -> None:
+            self.send_response(200)
+            self.send_header("Content-Type", f"multipart/x-mixed-replace; boundary={BOUNDARY}")
+            self.send_header("Cache-Control", "no-store")
+            self.end_headers()
+            try:
+                for jpeg in preview.frames():
+                    self.wfile.write(
+                        f"--{BOUNDARY}\r\nContent-Type: image/jpeg\r\n"
+                        f"Content-Length: {len(jpeg)}\r\n\r\n".encode()
+                    )
+                    self.wfile.write(jpeg)
+                    self.wfile.write(b"\r\n")
+            except (BrokenPipeError, ConnectionResetError):
+                pass
+
+    return Handler
@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import logging
+import time
+from collections.abc import Iterator
+from pathlib import Path
+
+import numpy as np
+import pygame
+
+from .base import Display
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"WBRING01"
+HEADER_SIZE = 64
+HEADER = np.dtype(
+    [
+        ("magic", "S8"),
+        ("version", "<u4"),
+        ("width", "<u4"),
+        ("height", "<u4"),
+        ("slots", "<u4"),
+        ("count", "<u8"),
+    ]
+)
+
+
+def slot_dtype(width: int, height: int) -> np.dtype:
+    return np.dtype([("frame", "<u8"), ("timestamp", "<f8"), ("pixels", "u1", (height, width, 3))])
+
+
+class FrameRing:
+    def __init__(self, path: str | Path, header: np.memmap, slots: np.memmap) -> None:
+        self.path = Path(path)
+        self._header = header
+        self._slots = slots
+
+    @classmethod
+    def create(cls, path: str | Path, width: int, height: int, slots: int) -> FrameRing:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        dtype = slot_dtype(width, height)
+        with open(path, "wb") as f:
+            f.truncate(HEADER_SIZE + dtype.itemsize * slots)
+        header = np.memmap(path, dtype=HEADER, mode="r+", shape=(1,))
+        header[0] = (MAGIC, 1, width, height, slots, 0)
+        ring = np.memmap(path, dtype=dtype, mode="r+", offset=HEADER_SIZE, shape=(slots,))
+        return cls(path, header, ring)
+
+    @classmethod
+    def open(cls, path: str | Path) -> FrameRing:
+        header = np.memmap(path, dtype=HEADER, mode="r", shape=(1,))
+        if header[0]["magic"] != MAGIC:
+            raise ValueError(f"Not a wideboy frame ring: {path}")
+        width, height, slots = (int(header[0][k]) for k in ("width", "height", "slots"))
+        ring = np.memmap(
+            path, dtype=slot_dtype(width, height), mode="r", offset=HEADER_SIZE, shape=(slots,)
+        )
+        return cls(path, header, ring)
+
+    @property
+    def size(self) -> tuple[int, int]:
+        return int(self._header[0]["width"]), int(self._header[0]["height"])
+
+    @property
+    def capacity(self) -> int:
+        return len(self._slots)
+
+    @property
+    def count(self) -> int:
+        return int(self._header[0]["count"])
+
+    def write(self, surface: pygame.Surface, timestamp: float) -> None:
+        count = self.count
+        slot = self._slots[count % len(self._slots)]
+        pixels = pygame.surfarray.pixels3d(surface)
+        np.copyto(slot["pixels"], pixels.transpose(1, 0, 2))
+        del pixels
+        slot["frame"] = count
+        slot["timestamp"] = timestamp
+        self._header[0]["count"] = count + 1
+
+    def frames(self) -> Iterator[tuple[int, float, np.ndarray]]:
+        count = self.count
+        for n in range(max(0, count - len(self._slots)), count):
+            slot = self._slots[n % len(self._slots)]
+            yield int(slot["frame"]), float(slot["timestamp"]), slot["pixels"]
+
+    def flush(self) -> None:
+        self._slots.flush()
+        self._header.flush()
+
+
+class RecordDisplay(Display):
+    def __init__(self, settings) -> None:
+        self.settings = settings
+        self.ring: FrameRing | None = None
+
+    def start(self) -> None:
+        cfg = self.settings.record
+        canvas = self.settings.display.canvas
+        self.ring = FrameRing.create(cfg.path, canvas.width, canvas.height, cfg.slots)
+        logger.info(
+            "Recording frames to %s (%d slot ring, %.1f MiB)",
+            cfg.path,
+            cfg.slots,
+            self.ring.path.stat().st_size / (1024 * 1024),
+        )
+
+    def present(self, surface: pygame.Surface) -> None:
+        if self.ring is None:
+            return
+        self.ring.write(surface, time.time())
+
+    def stop(self) -> None:
+        if self.ring is None:
+            return
+        self.ring.flush()
+        logger.info("Recorded %d frames to %s", self.ring.count, self.ring.path)
@@ -1,16 +1,42 @@
 from __future__ import annotations
 
+import numpy as np
 import pygame
 
+from .layout import Panel, PanelLayout, grid_layout, segment_layout
+
 
 def remap_logical_to_physical(frame, output_order: list[int]):
     h, w, c = frame.shape
-    n_parallel = len(output_order)
-    seg_w = w // n_parallel
-    segs = frame.reshape(h, n_parallel, seg_w, c)
-    ordered = segs[:, output_order]
-    physical = ordered.transpose(1, 0, 2, 3).reshape(h * n_parallel, seg_w, c)
-    return physical
+    layout = segment_layout(w, h, output_order)
+    rows, cols = layout.shape
+    out = np.empty((rows * cols, c), dtype=frame.dtype)
+    layout.remap(np.ascontiguousarray(frame).reshape(-1, c), out)
+    return out.reshape(rows, cols, c)
+
+
+def layout_from_settings(settings) -> PanelLayout:
+    width = settings.display.canvas.width
+    height = settings.display.canvas.height
+    matrix = settings.display.matrix
+    driver = matrix.driver
+    remap = matrix.remap
+    if remap.chains:
+        chains = [[Panel(**panel.model_dump()) for panel in chain] for chain in remap.chains]
+        return PanelLayout(
+            chains, (driver.cols, driver.rows), (width, height), chain_length=driver.chain
+        )
+    if remap.serpentine or height > driver.rows:
+        return grid_layout(
+            width,
+            height,
+            (driver.cols, driver.rows),
+            driver.chain,
+            driver.parallel,
+            output_order=remap.output_order,
+            serpentine=remap.serpentine,
+        )
+    return segment_layout(width, height, remap.output_order)
 
 
 def draw_test_pattern(surface: pygame.Surface, output_order: list[int]) -> None:
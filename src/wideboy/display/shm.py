@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+import logging
+import time
+from multiprocessing import shared_memory
+
+import numpy as np
+import pygame
+
+from .base import Display
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"WBSHM001"
+VERSION = 2
+HEADER_SIZE = 64
+HEADER = np.dtype(
+    [
+        ("magic", "S8"),
+        ("version", "<u4"),
+        ("width", "<u4"),
+        ("height", "<u4"),
+        ("channels", "<u4"),
+        ("sequence", "<u8"),
+        ("frame", "<u8"),
+        ("timestamp", "<f8"),
+        ("heartbeat", "<f8"),
+    ]
+)
+
+
+def _attach(name: str) -> shared_memory.SharedMemory:
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        from multiprocessing import resource_tracker
+
+        shm = shared_memory.SharedMemory(name=name)
+        resource_tracker.unregister(shm._name, "shared_memory")
+        return shm
+
+
+class SharedFrame:
+    def __init__(self, shm: shared_memory.SharedMemory, owner: bool) -> None:
+        self.shm = shm
+        self.owner = owner
+        self._header = np.ndarray((1,), dtype=HEADER, buffer=shm.buf)
+        width, height = int(self._header[0]["width"]), int(self._header[0]["height"])
+        self.pixels = np.ndarray(
+            (height, width, 3), dtype=np.uint8, buffer=shm.buf, offset=HEADER_SIZE
+        )
+
+    @classmethod
+    def create(cls, name: str, width: int, height: int) -> SharedFrame:
+        size = HEADER_SIZE + width * height * 3
+        try:
+            shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+        except FileExistsError:
+            logger.warning("Replacing stale shared frame segment '%s'", name)
+            stale = _attach(name)
+            stale.close()
+            stale.unlink()
+            shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+        header = np.ndarray((1,), dtype=HEADER, buffer=shm.buf)
+        header[0] = (MAGIC, VERSION, width, height, 3, 0, 0, 0.0, 0.0)
+        del header
+        return cls(shm, owner=True)
+
+    @classmethod
+    def open(cls, name: str) -> SharedFrame:
+        shm = _attach(name)
+        if bytes(shm.buf[:8]) != MAGIC:
+            shm.close()
+            raise ValueError(f"Not a wideboy shared frame: {name}")
+        return cls(shm, owner=False)
+
+    @property
+    def size(self) -> tuple[int, int]:
+        return int(self._header[0]["width"]), int(self._header[0]["height"])
+
+    @property
+    def sequence(self) -> int:
+        return int(self._header[0]["sequence"])
+
+    @property
+    def heartbeat(self) -> float:
+        return float(self._header[0]["heartbeat"])
+
+    def beat(self, timestamp: float) -> None:
+        self._header[0]["heartbeat"] = timestamp
+
+    def write(self, surface: pygame.Surface, timestamp: float) -> None:
+        header = self._header[0]
+        sequence = int(header["sequence"])
+        header["sequence"] = sequence + 1
+        pixels = pygame.surfarray.pixels3d(surface)
+        np.copyto(self.pixels, pixels.transpose(1, 0, 2))
+        del pixels
+        header["frame"] = header["frame"] + 1
+        header["timestamp"] = timestamp
+        header["heartbeat"] = timestamp
+        header["sequence"] = sequence + 2
+
+    def read(
+        self, out: np.ndarray | None = None, timeout: float = 1.0
+    ) -> tuple[int, float, np.ndarray]:
+        if out is None:
+            out = np.empty_like(self.pixels)
+        header = self._header[0]
+        deadline = time.monotonic() + timeout
+        while True:
+            before = int(header["sequence"])
+            if not before & 1:
+                np.copyto(out, self.pixels)
+                frame, timestamp = int(header["frame"]), float(header["timestamp"])
+                if int(header["sequence"]) == before:
+                    return frame, timestamp, out
+            if time.monotonic() > deadline:
+                raise TimeoutError("Shared frame writer did not finish a frame in time")
+            time.sleep(0)
+
+    def close(self) -> None:
+        del self._header, self.pixels
+        self.shm.close()
+        if self.owner:
+            self.shm.unlink()
+
+
+class SharedMemoryDisplay(Display):
+    def __init__(self, settings) -> None:
+        self.settings = settings
+        self.frame: SharedFrame | None = None
+
+    def start(self) -> None:
+        canvas = self.settings.display.canvas
+        name = self.settings.shm.name
+        self.frame = SharedFrame.create(name, canvas.width, canvas.height)
+        logger.info("Publishing frames to shared memory '%s'", name)
+
+    def present(self, surface: pygame.Surface) -> None:
+        if self.frame is None:
+            return
+        self.frame.write(surface, time.time())
+
+    def idle(self) -> None:
+        if self.frame is None:
+            return
+        self.frame.beat(time.time())
+
+    def stop(self) -> None:
+        if self.frame is None:
+            return
+        self.frame.close()
+        self.frame = None
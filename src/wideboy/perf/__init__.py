@@ -0,0 +1,4 @@
+from .profiler import FrameProfiler, RollingStats
+from .trace import Tracer, get_tracer, set_tracer, span
+
+__all__ = ["FrameProfiler", "RollingStats", "Tracer", "get_tracer", "set_tracer", "span"]
@@ -0,0 +1,294 @@
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import os
+import platform
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any
+
+from .profiler import RollingStats
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BUDGET_MS = 1000.0 / 30
+DEFAULT_TOLERANCE = 0.15
+_COMPARE_KEYS = ("mean", "p95")
+
+
+def parse_size(value: str) -> tuple[int, int]:
+    try:
+        w, h = value.lower().split("x")
+        size = (int(w), int(h))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid size '{value}' (expected WxH)") from None
+    if size[0] <= 0 or size[1] <= 0:
+        raise argparse.ArgumentTypeError(f"invalid size '{value}' (must be positive)")
+    return size
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--effect",
+        action="append",
+        default=[],
+        help="Effect to benchmark (repeatable, default: all)",
+    )
+    parser.add_argument(
+        "--tags",
+        nargs="+",
+        default=None,
+        help="Only benchmark effects matching any of these tags",
+    )
+    parser.add_argument(
+        "--size",
+        action="append",
+        type=parse_size,
+        default=[],
+        help="Canvas size WxH (repeatable, default: settings canvas size)",
+    )
+    parser.add_argument("--frames", type=int, default=300, help="Timed frames per run")
+    parser.add_argument("--warmup", type=int, default=30, help="Untimed frames per run")
+    parser.add_argument(
+        "--memory-frames",
+        type=int,
+        default=30,
+        help="Frames traced with tracemalloc for peak and per-frame memory (0 to skip)",
+    )
+    parser.add_argument(
+        "--budget-ms",
+        type=float,
+        default=DEFAULT_BUDGET_MS,
+        help="Frame budget for the over-budget count (default: 33.3)",
+    )
+    parser.add_argument("--output", type=Path, default=None, help="Write results JSON here")
+    parser.add_argument(
+        "--baseline",
+        type=Path,
+        default=None,
+        help="Compare against a previous results JSON and fail on regressions",
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=DEFAULT_TOLERANCE,
+        help="Allowed fractional slowdown vs baseline (default: 0.15)",
+    )
+
+
+def _select_effects(names: list[str], tags: list[str] | None) -> list[str]:
+    from ..backgrounds.procedural import EFFECTS, get_effects_by_tags
+
+    unknown = [n for n in names if n not in EFFECTS]
+    if unknown:
+        raise SystemExit(
+            f"unknown effect(s) {', '.join(unknown)} (available: {', '.join(sorted(EFFECTS))})"
+        )
+    selected = set(get_effects_by_tags(tags)) if tags else set(EFFECTS)
+    if names:
+        selected &= set(names)
+    return sorted(selected)
+
+
+def _make_background(name: str, palettes: dict) -> Any:
+    from ..backgrounds.procedural import EFFECTS, ProceduralBackground
+    from ..render.palette import PaletteConfig, PaletteResolver
+
+    resolver = PaletteResolver(palettes, PaletteConfig(default=EFFECTS[name].default_palette))
+    return ProceduralBackground({"effect": name, "_palette_resolver": resolver})
+
+
+def bench_effect(
+    name: str,
+    size: tuple[int, int],
+    palettes: dict,
+    frames: int = 300,
+    warmup: int = 30,
+    memory_frames: int = 30,
+    budget_ms: float = DEFAULT_BUDGET_MS,
+    fps: int = 30,
+) -> dict[str, Any]:
+    import pygame
+
+    surface = pygame.Surface(size)
+    bg = _make_background(name, palettes)
+    dt = 1.0 / fps
+
+    for _ in range(warmup):
+        bg.update(dt)
+        bg.render(surface)
+
+    stats = RollingStats(frames)
+    over_budget = 0
+    budget = budget_ms / 1000.0
+    for _ in range(frames):
+        start = time.perf_counter()
+        bg.update(dt)
+        bg.render(surface)
+        elapsed = time.perf_counter() - start
+        stats.add(elapsed)
+        if elapsed > budget:
+            over_budget += 1
+
+    peak_kib = None
+    alloc_kib = None
+    if memory_frames > 0:
+        tracemalloc.start()
+        try:
+            allocated = 0
+            peak = 0
+            for _ in range(memory_frames):
+                tracemalloc.reset_peak()
+                before, _ = tracemalloc.get_traced_memory()
+                bg.update(dt)
+                bg.render(surface)
+                frame_peak = tracemalloc.get_traced_memory()[1]
+                allocated += frame_peak - before
+                peak = max(peak, frame_peak)
+        finally:
+            tracemalloc.stop()
+        peak_kib = round(peak / 1024.0, 1)
+        alloc_kib = round(allocated / memory_frames / 1024.0, 1)
+
+    s = stats.summary()
+    return {
+        "effect": name,
+        "size": f"{size[0]}x{size[1]}",
+        "frames": frames,
+        "mean_ms": round(s["mean"], 3),
+        "p95_ms": round(s["p95"], 3),
+        "max_ms": round(s["max"], 3),
+        "over_budget": over_budget,
+        "peak_kib": peak_kib,
+        "alloc_kib": alloc_kib,
+    }
+
+
+def run_benchmarks(
+    names: list[str],
+    sizes: list[tuple[int, int]],
+    palettes: dict,
+    frames: int = 300,
+    warmup: int = 30,
+    memory_frames: int = 30,
+    budget_ms: float = DEFAULT_BUDGET_MS,
+) -> dict[str, Any]:
+    import numpy as np
+    import pygame
+
+    results: dict[str, dict[str, Any]] = {}
+    for size in sizes:
+        for name in names:
+            result = bench_effect(
+                name,
+                size,
+                palettes,
+                frames=frames,
+                warmup=warmup,
+                memory_frames=memory_frames,
+                budget_ms=budget_ms,
+            )
+            key = f"{name}@{result['size']}"
+            results[key] = result
+            print(_format_row(key, result), flush=True)
+
+    return {
+        "meta": {
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "machine": platform.machine(),
+            "node": platform.node(),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "pygame": pygame.version.ver,
+            "frames": frames,
+            "warmup": warmup,
+            "budget_ms": round(budget_ms, 3),
+        },
+        "results": results,
+    }
+
+
+def _format_row(key: str, r: dict[str, Any]) -> str:
+    peak = "-" if r["peak_kib"] is None else f"{r['peak_kib']:.0f}"
+    alloc = "-" if r.get("alloc_kib") is None else f"{r['alloc_kib']:.0f}"
+    return (
+        f"{key:<28}{r['mean_ms']:>9.2f}{r['p95_ms']:>9.2f}{r['max_ms']:>9.2f}"
+        f"{r['over_budget']:>7d}{peak:>10}{alloc:>11}"
+    )
+
+
+def compare_results(
+    current: dict[str, Any],
+    baseline: dict[str, Any],
+    tolerance: float = DEFAULT_TOLERANCE,
+) -> list[str]:
+    regressions = []
+    base_results = baseline.get("results", {})
+    for key, result in current.get("results", {}).items():
+        base = base_results.get(key)
+        if base is None:
+            continue
+        for stat in _COMPARE_KEYS:
+            old = base.get(f"{stat}_ms")
+            new = result.get(f"{stat}_ms")
+            if not old or new is None:
+                continue
+            change = (new - old) / old
+            if change > tolerance:
+                regressions.append(
+                    f"{key} {stat}: {old:.2f}ms -> {new:.2f}ms (+{change * 100:.0f}%)"
+                )
+    return regressions
+
+
+def run(args: argparse.Namespace) -> int:
+    from ..backgrounds.procedural._registry import set_extra_tags
+    from ..config import load_settings
+    from ..render.palette import load_palettes
+
+    settings = load_settings(base_dir=args.config_dir)
+    set_extra_tags(settings.effect_tags)
+    names = _select_effects(args.effect, args.tags)
+    if not names:
+        print("No effects matched")
+        return 1
+    sizes = args.size or [(settings.display.canvas.width, settings.display.canvas.height)]
+
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    import pygame
+
+    pygame.init()
+    try:
+        print(
+            f"{'effect@size':<28}{'mean':>9}{'p95':>9}{'max':>9}{'over':>7}"
+            f"{'peak KiB':>10}{'KiB/frame':>11}"
+        )
+        report = run_benchmarks(
+            names,
+            sizes,
+            load_palettes("palettes.yml"),
+            frames=args.frames,
+            warmup=args.warmup,
+            memory_frames=args.memory_frames,
+            budget_ms=args.budget_ms,
+        )
+    finally:
+        pygame.quit()
+
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2) + "\n")
+        print(f"Results written to {args.output}")
+
+    if args.baseline:
+        baseline = json.loads(args.baseline.read_text())
+        regressions = compare_results(report, baseline, args.tolerance)
+        if regressions:
+            print(f"{len(regressions)} regression(s) vs {args.baseline}:")
+            for line in regressions:
+                print(f"  {line}")
+            return 1
+        print(f"No regressions vs {args.baseline} (tolerance {args.tolerance * 100:.0f}%)")
+    return 0
@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import cProfile
+import logging
+import pstats
+import threading
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+def top_functions(stats: pstats.Stats, limit: int = 15) -> list[dict[str, Any]]:
+    rows = []
+    for (filename, line, func), (_, ncalls, tottime, cumtime, _) in stats.stats.items():
+        rows.append(
+            {
+                "function": f"{Path(filename).name}:{line}({func})",
+                "calls": ncalls,
+                "tottime_ms": round(tottime * 1000.0, 2),
+                "cumtime_ms": round(cumtime * 1000.0, 2),
+            }
+        )
+    rows.sort(key=lambda r: r["tottime_ms"], reverse=True)
+    return rows[:limit]
+
+
+class ProfileCapture:
+    def __init__(
+        self,
+        directory: str | Path,
+        max_duration: float = 300.0,
+        top: int = 15,
+        on_complete: Callable[[dict[str, Any]], None] | None = None,
+        on_status: Callable[[str], None] | None = None,
+    ) -> None:
+        self.directory = Path(directory)
+        self.max_duration = max_duration
+        self.top = top
+        self.on_complete = on_complete
+        self.on_status = on_status
+        self._requested: float | None = None
+        self._profile: cProfile.Profile | None = None
+        self._started = 0.0
+        self._deadline = 0.0
+        self._frames = 0
+
+    @property
+    def running(self) -> bool:
+        return self._profile is not None
+
+    @property
+    def status(self) -> str:
+        if self._profile is not None:
+            return "running"
+        if self._requested is not None:
+            return "pending"
+        return "idle"
+
+    def _notify(self) -> None:
+        if self.on_status is None:
+            return
+        try:
+            self.on_status(self.status)
+        except Exception:
+            logger.exception("Profile status callback failed")
+
+    def request(self, duration: float) -> bool:
+        if self._profile is not None or self._requested is not None:
+            logger.warning("Profile capture already in progress, ignoring request")
+            return False
+        self._requested = max(0.1, min(self.max_duration, duration))
+        logger.info("Profile capture requested (%.1fs)", self._requested)
+        self._notify()
+        return True
+
+    def tick(self) -> None:
+        if self._profile is not None:
+            self._frames += 1
+            if time.monotonic() >= self._deadline:
+                self._finish()
+            return
+        duration = self._requested
+        if duration is None:
+            return
+        self._requested = None
+        self._frames = 0
+        self._started = time.monotonic()
+        self._deadline = self._started + duration
+        self._profile = cProfile.Profile()
+        self._profile.enable()
+        self._notify()
+
+    def _finish(self) -> None:
+        profile = self._profile
+        self._profile = None
+        profile.disable()
+        elapsed = time.monotonic() - self._started
+        frames = self._frames
+        threading.Thread(
+            target=self._write,
+            args=(profile, elapsed, frames),
+            name="profile-writer",
+            daemon=True,
+        ).start()
+
+    def _write(self, profile: cProfile.Profile, elapsed: float, frames: int) -> None:
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            path = self.directory / f"profile-{time.strftime('%Y%m%d-%H%M%S')}.pstats"
+            profile.dump_stats(path)
+            result = {
+                "path": str(path),
+                "duration": round(elapsed, 2),
+                "frames": frames,
+                "top": top_functions(pstats.Stats(profile), self.top),
+            }
+        except Exception:
+            logger.exception("Failed to write profile capture")
+            self._notify()
+            return
+        logger.info("Profile capture written: %s (%d frames)", path, frames)
+        if self.on_complete is not None:
+            try:
+                self.on_complete(result)
+            except Exception:
+                logger.exception("Profile capture callback failed")
+        self._notify()
+
+    def stop(self) -> None:
+        pending = self._requested is not None
+        self._requested = None
+        if self._profile is not None:
+            self._finish()
+        elif pending:
+            self._notify()
@@ -0,0 +1,187 @@
+from __future__ import annotations
+
+import logging
+import time
+from typing import Any
+
+import numpy as np
+
+from .trace import Tracer
+
+logger = logging.getLogger(__name__)
+
+STAGES = (
+    "events",
+    "commands",
+    "brightness",
+    "background_update",
+    "background_render",
+    "dim",
+    "widgets_update",
+    "widgets_render",
+    "color",
+    "diff",
+    "present",
+)
+TOTAL = "total"
+
+
+class RollingStats:
+    def __init__(self, window: int) -> None:
+        self._samples = np.zeros(max(1, window), dtype=np.float64)
+        self._index = 0
+        self._count = 0
+
+    def add(self, value: float) -> None:
+        self._samples[self._index] = value
+        self._index = (self._index + 1) % len(self._samples)
+        if self._count < len(self._samples):
+            self._count += 1
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    def summary(self) -> dict[str, float]:
+        if self._count == 0:
+            return {"count": 0, "mean": 0.0, "p50": 0.0, "p95": 0.0, "p99": 0.0, "max": 0.0}
+        window = self._samples[: self._count] * 1000.0
+        p50, p95, p99 = np.percentile(window, (50, 95, 99))
+        return {
+            "count": self._count,
+            "mean": float(window.mean()),
+            "p50": float(p50),
+            "p95": float(p95),
+            "p99": float(p99),
+            "max": float(window.max()),
+        }
+
+
+class FrameProfiler:
+    def __init__(
+        self,
+        enabled: bool = True,
+        window: int = 900,
+        effect_window: int = 300,
+        report_interval: float = 60.0,
+        tracer: Tracer | None = None,
+    ) -> None:
+        self.enabled = enabled
+        self.tracer = tracer
+        self._window = window
+        self._effect_window = effect_window
+        self._report_interval = report_interval
+        self._stages: dict[str, RollingStats] = {}
+        self._effects: dict[str, dict[str, RollingStats]] = {}
+        self._current: dict[str, float] = {}
+        self._stage: str | None = None
+        self._stage_start = 0.0
+        self._frame_start = 0.0
+        self._last_report = time.monotonic()
+        self.frames = 0
+
+    @property
+    def current_stage(self) -> str | None:
+        return self._stage
+
+    def begin_frame(self) -> None:
+        now = time.perf_counter()
+        self._frame_start = now
+        self._stage = None
+        self._stage_start = now
+        self._current.clear()
+
+    def stage(self, name: str) -> None:
+        now = time.perf_counter()
+        if self._stage is not None:
+            if self.enabled:
+                self._current[self._stage] = (
+                    self._current.get(self._stage, 0.0) + now - self._stage_start
+                )
+            if self.tracer is not None and self.tracer.active:
+                self.tracer.complete(
+                    self._stage, "stage", int(self._stage_start * 1e9), int(now * 1e9)
+                )
+        self._stage = name
+        self._stage_start = now
+
+    def idle(self) -> None:
+        self._stage = None
+        self.frames += 1
+
+    def end_frame(self, effect: str = "") -> None:
+        self.stage(TOTAL)
+        self._stage = None
+        self.frames += 1
+        if self.tracer is not None and self.tracer.active:
+            self.tracer.complete(
+                "frame",
+                "frame",
+                int(self._frame_start * 1e9),
+                int(self._stage_start * 1e9),
+                {"effect": effect, "frame": self.frames},
+            )
+        if not self.enabled:
+            return
+        self._current[TOTAL] = self._stage_start - self._frame_start
+        for name, value in self._current.items():
+            self._stats(self._stages, name, self._window).add(value)
+        if effect:
+            per_effect = self._effects.setdefault(effect, {})
+            for name, value in self._current.items():
+                self._stats(per_effect, name, self._effect_window).add(value)
+        if self._report_interval > 0:
+            now = time.monotonic()
+            if now - self._last_report >= self._report_interval:
+                self._last_report = now
+                self.log_report()
+
+    @staticmethod
+    def _stats(table: dict[str, RollingStats], name: str, window: int) -> RollingStats:
+        stats = table.get(name)
+        if stats is None:
+            stats = table[name] = RollingStats(window)
+        return stats
+
+    def summary(self) -> dict[str, Any]:
+        return {
+            "frames": self.frames,
+            "stages": {name: s.summary() for name, s in self._ordered(self._stages)},
+            "effects": {
+                effect: {name: s.summary() for name, s in self._ordered(stages)}
+                for effect, stages in sorted(self._effects.items())
+            },
+        }
+
+    @staticmethod
+    def _ordered(table: dict[str, RollingStats]) -> list[tuple[str, RollingStats]]:
+        order = {name: i for i, name in enumerate((*STAGES, TOTAL))}
+        return sorted(table.items(), key=lambda item: (order.get(item[0], len(order)), item[0]))
+
+    def format_report(self) -> str:
+        lines = [f"{'stage':<20}{'p50':>8}{'p95':>8}{'p99':>8}{'max':>8}  (ms)"]
+        for name, stats in self._ordered(self._stages):
+            s = stats.summary()
+            lines.append(
+                f"{name:<20}{s['p50']:>8.2f}{s['p95']:>8.2f}{s['p99']:>8.2f}{s['max']:>8.2f}"
+            )
+        for effect, stages in sorted(self._effects.items()):
+            total = stages.get(TOTAL)
+            if total is None:
+                continue
+            s = total.summary()
+            lines.append(
+                f"{'fx:' + effect:<20}{s['p50']:>8.2f}{s['p95']:>8.2f}"
+                f"{s['p99']:>8.2f}{s['max']:>8.2f}"
+            )
+        return "\n".join(lines)
+
+    def log_report(self) -> None:
+        if not self._stages:
+            return
+        logger.info("Frame profile (%d frames):\n%s", self.frames, self.format_report())
+
+    def reset(self) -> None:
+        self._stages.clear()
+        self._effects.clear()
+        self.frames = 0
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import random
+import time
+from typing import Any
+
+_NOTIFICATIONS = (
+    "Doorbell rang!",
+    "Washing machine finished",
+    "Front door left open for 5 minutes",
+    "Bin day tomorrow: black and food",
+)
+
+
+class SyntheticHomeAssistant:
+    def __init__(self, entity_ids: list[str], change_interval: int = 30, seed: int = 0) -> None:
+        self.entity_ids = entity_ids
+        self.change_interval = max(1, change_interval)
+        self._rng = random.Random(seed)
+        self._calls = 0
+        self._snapshot: dict[str, dict[str, Any]] = {}
+        self._refresh()
+
+    def _entity_state(self, entity_id: str) -> dict[str, Any]:
+        domain = entity_id.split(".", 1)[0]
+        attributes: dict[str, Any] = {}
+        data: dict[str, Any] = {"entity_id": entity_id}
+        if domain == "binary_sensor":
+            state = self._rng.choice(("on", "off"))
+        elif domain == "input_datetime":
+            ts = time.time() + self._rng.randint(0, 20) * 86400
+            state = time.strftime("%Y-%m-%d", time.localtime(ts))
+            attributes["timestamp"] = ts
+        elif domain == "sensor":
+            state = f"{self._rng.uniform(0.0, 1500.0):.1f}"
+        else:
+            state = "on"
+        data["state"] = state
+        data["attributes"] = attributes
+        return data
+
+    def _refresh(self) -> None:
+        self._snapshot = {eid: self._entity_state(eid) for eid in self.entity_ids}
+
+    @property
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        self._calls += 1
+        if self._calls % self.change_interval == 0:
+            eid = self._rng.choice(self.entity_ids) if self.entity_ids else None
+            if eid:
+                self._snapshot[eid] = self._entity_state(eid)
+        return dict(self._snapshot)
+
+    def stop(self) -> None:
+        pass
+
+
+class SyntheticNotifier:
+    def __init__(self, duration: float = 30.0) -> None:
+        self.duration = duration
+        self._index = 0
+
+    async def drain_commands(self, state: Any) -> None:
+        if state.notification is not None:
+            return
+        now = time.monotonic()
+        state.notification = {
+            "text": _NOTIFICATIONS[self._index % len(_NOTIFICATIONS)],
+            "received_at": now,
+            "expire_time": now + self.duration,
+        }
+        self._index += 1
@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import contextlib
+import json
+import logging
+import os
+import threading
+import time
+from collections import deque
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+_NULL_SPAN = contextlib.nullcontext()
+
+
+class Tracer:
+    def __init__(
+        self,
+        path: str | Path,
+        duration: float = 30.0,
+        max_events: int = 500_000,
+    ) -> None:
+        self.path = Path(path)
+        self.duration = duration
+        self._events: deque[tuple] = deque(maxlen=max_events)
+        self._threads: dict[int, str] = {}
+        self._origin_ns = time.perf_counter_ns()
+        self._deadline_ns: int | None = None
+        self._lock = threading.Lock()
+        self.active = False
+
+    def start(self) -> None:
+        self._origin_ns = time.perf_counter_ns()
+        if self.duration > 0:
+            self._deadline_ns = self._origin_ns + int(self.duration * 1e9)
+        self.active = True
+        logger.info("Tracing to %s for %.0fs", self.path, self.duration)
+
+    def complete(
+        self,
+        name: str,
+        cat: str,
+        start_ns: int,
+        end_ns: int,
+        args: dict[str, Any] | None = None,
+    ) -> None:
+        if not self.active:
+            return
+        tid = threading.get_ident()
+        if tid not in self._threads:
+            self._threads[tid] = threading.current_thread().name
+        self._events.append((name, cat, start_ns, end_ns - start_ns, tid, args))
+        if self._deadline_ns is not None and end_ns >= self._deadline_ns:
+            self.active = False
+            threading.Thread(target=self.write, name="trace-writer", daemon=True).start()
+
+    @contextlib.contextmanager
+    def span(self, name: str, cat: str = "", **args: Any):
+        start = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            self.complete(name, cat, start, time.perf_counter_ns(), args or None)
+
+    def to_dict(self) -> dict[str, Any]:
+        pid = os.getpid()
+        origin = self._origin_ns
+        events: list[dict[str, Any]] = [
+            {"name": "process_name", "ph": "M", "pid": pid, "args": {"name": "wideboy"}}
+        ]
+        for tid, thread_name in list(self._threads.items()):
+            events.append(
+                {
+                    "name": "thread_name",
+                    "ph": "M",
+                    "pid": pid,
+                    "tid": tid,
+                    "args": {"name": thread_name},
+                }
+            )
+        for name, cat, start_ns, dur_ns, tid, args in list(self._events):
+            event: dict[str, Any] = {
+                "name": name,
+                "cat": cat,
+                "ph": "X",
+                "ts": (start_ns - origin) / 1000.0,
+                "dur": dur_ns / 1000.0,
+                "pid": pid,
+                "tid": tid,
+            }
+            if args:
+                event["args"] = args
+            events.append(event)
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def write(self) -> Path | None:
+        with self._lock:
+            if not self._events:
+                return None
+            self.active = False
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                self.path.write_text(json.dumps(self.to_dict()))
+            except OSError:
+                logger.exception("Failed to write trace: %s", self.path)
+                return None
+            logger.info("Trace written: %s (%d events)", self.path, len(self._events))
+            self._events.clear()
+            return self.path
+
+
+_tracer: Tracer | None = None
+
+
+def get_tracer() -> Tracer | None:
+    return _tracer
+
+
+def set_tracer(tracer: Tracer | None) -> None:
+    global _tracer
+    _tracer = tracer
+
+
+def span(name: str, cat: str = "", **args: Any):
+    tracer = _tracer
+    if tracer is None or not tracer.active:
+        return _NULL_SPAN
+    return tracer.span(name, cat, **args)
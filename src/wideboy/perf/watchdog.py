@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import faulthandler
+import logging
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+class FrameWatchdog:
+    def __init__(
+        self,
+        profiler: Any,
+        state: Any,
+        threshold: float = 2.0,
+        dump_dir: str | Path = "stalls",
+        min_interval: float = 300.0,
+    ) -> None:
+        self._profiler = profiler
+        self._state = state
+        self.threshold = threshold
+        self.dump_dir = Path(dump_dir)
+        self.min_interval = min_interval
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._last_frames = 0
+        self._last_progress = time.monotonic()
+        self._last_dump: float | None = None
+        self._stalled = False
+        self.stalls = 0
+
+    def start(self) -> None:
+        self._last_progress = time.monotonic()
+        self._thread = threading.Thread(target=self._run, name="frame-watchdog", daemon=True)
+        self._thread.start()
+        logger.info("Frame watchdog started (threshold %.1fs)", self.threshold)
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=2)
+
+    def _run(self) -> None:
+        interval = max(0.05, self.threshold / 4)
+        while not self._stop.wait(interval):
+            self.check()
+
+    def check(self, now: float | None = None) -> bool:
+        if now is None:
+            now = time.monotonic()
+        frames = self._profiler.frames
+        if frames != self._last_frames:
+            if self._stalled:
+                logger.warning("Frame stall recovered after %.1fs", now - self._last_progress)
+            self._last_frames = frames
+            self._last_progress = now
+            self._stalled = False
+            return False
+        if frames == 0 or self._stalled:
+            return False
+        stalled_for = now - self._last_progress
+        if stalled_for < self.threshold:
+            return False
+        self._stalled = True
+        self.stalls += 1
+        if self._last_dump is not None and now - self._last_dump < self.min_interval:
+            logger.warning(
+                "Frame stall: no frame for %.1fs (stage=%s, effect=%s; dump rate-limited)",
+                stalled_for,
+                self._profiler.current_stage,
+                self._effect_name(),
+            )
+            return True
+        self._last_dump = now
+        self._dump(stalled_for)
+        return True
+
+    def _effect_name(self) -> str:
+        try:
+            return self._state.background.active_name
+        except Exception:
+            return "?"
+
+    def _dump(self, stalled_for: float) -> None:
+        stage = self._profiler.current_stage
+        effect = self._effect_name()
+        header = (
+            f"Frame stall: no frame for {stalled_for:.1f}s "
+            f"(frame={self._profiler.frames + 1}, stage={stage}, effect={effect})"
+        )
+        path = self.dump_dir / f"stall-{time.strftime('%Y%m%d-%H%M%S')}.txt"
+        try:
+            self.dump_dir.mkdir(parents=True, exist_ok=True)
+            with open(path, "w") as f:
+                f.write(header + "\n\n")
+                f.flush()
+                faulthandler.dump_traceback(file=f, all_threads=True)
+            stacks = path.read_text()
+        except OSError:
+            logger.exception("Failed to write stall dump: %s", path)
+            return
+        logger.warning("Stall dump written to %s\n%s", path, stacks)
@@ -16,6 +16,7 @@ class BrightnessManager:
         self,
         background: BrightnessConfig | None = None,
         foreground: BrightnessConfig | None = None,
+        master: BrightnessConfig | None = None,
     ) -> None:
         bg_cfg = background or BrightnessConfig()
         fg_cfg = foreground or BrightnessConfig()
@@ -25,6 +26,7 @@ class BrightnessManager:
         self._fg_target = fg_cfg.default
         self._bg_override: float | None = None
         self._fg_override: float | None = None
+        self._master_level = (master or BrightnessConfig()).default
 
     @property
     def background_level(self) -> float:
@@ -34,6 +36,13 @@ class BrightnessManager:
     def foreground_level(self) -> float:
         return self._fg_level
 
+    @property
+    def master_level(self) -> float:
+        return self._master_level
+
+    def set_master(self, level: float) -> None:
+        self._master_level = max(0.0, min(1.0, level))
+
     def set_background(self, level: float | None) -> None:
         if level is None:
             self._bg_override = None
@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+import logging
+import sys
+from typing import Any
+
+import numpy as np
+import pygame
+
+logger = logging.getLogger(__name__)
+
+
+def cie_lightness(values: np.ndarray) -> np.ndarray:
+    lightness = values * 100.0
+    return np.where(lightness > 8.0, ((lightness + 16.0) / 116.0) ** 3, lightness / 903.3)
+
+
+def _byte_positions(shifts: tuple[int, ...]) -> list[int]:
+    positions = [shift // 8 for shift in shifts[:3]]
+    if sys.byteorder == "big":
+        positions = [3 - p for p in positions]
+    return positions
+
+
+class ColorPipeline:
+    def __init__(
+        self,
+        gamma: float = 1.0,
+        cie: bool = False,
+        white_balance: list[list[float]] | None = None,
+        output_order: list[int] | None = None,
+        hardware_brightness: bool = False,
+    ) -> None:
+        self.gamma = gamma
+        self.cie = cie
+        self.hardware_brightness = hardware_brightness
+        self._white_balance = self._logical_white_balance(white_balance or [], output_order)
+        self.brightness = 1.0
+        self._lut_brightness = 1.0
+        self._lut: np.ndarray | None = None
+        self._mults: list[tuple[int, int, int]] | None = None
+        self._format: tuple | None = None
+        self._offsets: np.ndarray | None = None
+        self._scratch: np.ndarray | None = None
+        self._rects: list[pygame.Rect] = []
+        self.rebuilds = 0
+
+    @classmethod
+    def from_settings(cls, settings: Any) -> ColorPipeline:
+        cfg = settings.color
+        return cls(
+            gamma=cfg.gamma,
+            cie=cfg.cie,
+            white_balance=cfg.white_balance,
+            output_order=settings.display.matrix.remap.output_order,
+            hardware_brightness=cfg.hardware_brightness,
+        )
+
+    @staticmethod
+    def _logical_white_balance(
+        white_balance: list[list[float]], output_order: list[int] | None
+    ) -> list[tuple[float, float, float]]:
+        balance = [tuple(float(v) for v in rgb[:3]) for rgb in white_balance]
+        if output_order and len(output_order) == len(balance):
+            logical = list(balance)
+            for physical, src in enumerate(output_order):
+                logical[src] = balance[physical]
+            balance = logical
+        return balance
+
+    @property
+    def linear(self) -> bool:
+        return self.gamma == 1.0 and not self.cie
+
+    @property
+    def identity(self) -> bool:
+        return (
+            self.linear
+            and self._lut_brightness >= 1.0
+            and all(rgb == (1.0, 1.0, 1.0) for rgb in self._white_balance)
+        )
+
+    def set_brightness(self, level: float, display: Any = None) -> None:
+        level = max(0.0, min(1.0, level))
+        if level == self.brightness and self._mults is not None:
+            return
+        self.brightness = level
+        lut_level = level
+        if self.hardware_brightness and display is not None and display.set_brightness(level):
+            lut_level = 1.0
+        if lut_level != self._lut_brightness or self._mults is None:
+            self._lut_brightness = lut_level
+            self._rebuild()
+
+    def _rebuild(self) -> None:
+        balance = self._white_balance or [(1.0, 1.0, 1.0)]
+        level = self._lut_brightness
+        self._mults = [
+            tuple(min(255, round(255 * level * gain)) for gain in rgb) for rgb in balance
+        ]
+        if self.linear:
+            self._lut = None
+        else:
+            values = np.arange(256, dtype=np.float64) / 255.0 * level
+            curve = cie_lightness(values) if self.cie else values**self.gamma
+            lut = np.empty((len(balance), 4, 256), dtype=np.uint8)
+            for segment, rgb in enumerate(balance):
+                for channel, gain in enumerate(rgb):
+                    lut[segment, channel] = np.clip(np.rint(curve * gain * 255.0), 0, 255)
+                lut[segment, 3] = np.arange(256)
+            self._lut = lut.ravel()
+        self.rebuilds += 1
+
+    def _prepare(self, surface: pygame.Surface) -> None:
+        w, h = surface.get_size()
+        pitch = surface.get_pitch()
+        n = max(1, len(self._white_balance))
+        seg_w = w // n
+        self._rects = [
+            pygame.Rect(i * seg_w, 0, w - i * seg_w if i == n - 1 else seg_w, h) for i in range(n)
+        ]
+        self._format = (surface.get_size(), pitch, surface.get_shifts())
+        if self.linear:
+            self._offsets = self._scratch = None
+            return
+        if surface.get_bytesize() != 4:
+            raise ValueError("ColorPipeline needs a 32-bit surface")
+        channel_at = [3, 3, 3, 3]
+        for channel, position in enumerate(_byte_positions(surface.get_shifts())):
+            channel_at[position] = channel
+        byte = np.arange(pitch, dtype=np.int64)
+        x = np.minimum(byte // 4 // max(1, seg_w), n - 1)
+        row = x * 1024 + np.array(channel_at)[byte % 4] * 256
+        dtype = np.uint16 if n * 1024 <= 65536 else np.uint32
+        self._offsets = np.tile(row, h).astype(dtype)
+        self._scratch = np.empty(pitch * h, dtype=dtype)
+
+    def apply(self, surface: pygame.Surface) -> None:
+        if self._mults is None:
+            self._rebuild()
+        if self.identity:
+            return
+        if self._format != (surface.get_size(), surface.get_pitch(), surface.get_shifts()):
+            self._prepare(surface)
+        if self.linear:
+            for rect, mult in zip(self._rects, self._mults):
+                surface.fill(mult, rect, special_flags=pygame.BLEND_RGB_MULT)
+            return
+        proxy = surface.get_buffer()
+        pixels = np.frombuffer(proxy, dtype=np.uint8)
+        np.add(pixels, self._offsets, out=self._scratch)
+        np.take(self._lut, self._scratch, out=pixels, mode="clip")
+        del pixels, proxy
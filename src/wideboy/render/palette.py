@@ -1,11 +1,14 @@
 from __future__ import annotations
 
+import itertools
 import logging
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from datetime import datetime, time
 from pathlib import Path
 from typing import Any
 
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
 Color = tuple[float, float, float]
@@ -78,6 +81,42 @@ class Palette:
         return _lerp_color(stops[lo], stops[hi], frac)
 
 
+_COLOR_NAMES = tuple(f.name for f in fields(Palette))
+
+_versions = itertools.count(1)
+
+
+def _colors(palette: Palette) -> tuple[Color, ...]:
+    return tuple(getattr(palette, name) for name in _COLOR_NAMES)
+
+
+class ResolvedPalette(Palette):
+    def __init__(self, palette: Palette) -> None:
+        colors = np.array(_colors(palette), dtype=np.float64)
+        for name, color in zip(_COLOR_NAMES, colors.tolist(), strict=True):
+            object.__setattr__(self, name, tuple(color))
+        colors = colors.astype(np.float32)
+        colors_u8 = np.clip(colors, 0, 255).astype(np.uint8)
+        colors.flags.writeable = False
+        colors_u8.flags.writeable = False
+        object.__setattr__(self, "colors", colors)
+        object.__setattr__(self, "colors_u8", colors_u8)
+        object.__setattr__(self, "version", next(_versions))
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __hash__(self) -> int:
+        return hash(self.version)
+
+    @classmethod
+    def of(cls, palette: Palette) -> ResolvedPalette:
+        return palette if isinstance(palette, ResolvedPalette) else cls(palette)
+
+
 def _lerp_color(a: Color, b: Color, t: float) -> Color:
     return (
         a[0] + (b[0] - a[0]) * t,
@@ -188,6 +227,7 @@ class PaletteClock:
         self._rule_target = ""
         self._blend = 0.0
         self._initialized = False
+        self._resolved: dict[str, tuple[tuple[str, float], ResolvedPalette]] = {}
 
     def _target_for_time(self, now: time) -> str:
         for rule in self._config.rules:
@@ -223,8 +263,22 @@ class PaletteClock:
         else:
             self._blend = max(0.0, self._blend - dt / fade)
 
-    def resolve(self, base_name: str) -> Palette:
-        base = self._resolve_by_name(base_name or self._config.default)
+    def resolve(self, base_name: str) -> ResolvedPalette:
+        name = base_name or self._config.default
+        state = (self._rule_target, self._blend)
+        cached = self._resolved.get(name)
+        if cached is not None and cached[0] == state:
+            return cached[1]
+        palette = self._blend_palette(name)
+        if cached is not None and _colors(cached[1]) == _colors(palette):
+            resolved = cached[1]
+        else:
+            resolved = ResolvedPalette(palette)
+        self._resolved[name] = (state, resolved)
+        return resolved
+
+    def _blend_palette(self, name: str) -> Palette:
+        base = self._resolve_by_name(name)
         if self._blend <= 0.0 or not self._rule_target:
             return base
         target = self._resolve_by_name(self._rule_target)
@@ -250,5 +304,5 @@ class PaletteResolver:
         self._clock.update(dt, now)
 
     @property
-    def palette(self) -> Palette:
+    def palette(self) -> ResolvedPalette:
         return self._clock.resolve(self._base_name)
@@ -8,6 +8,8 @@ from typing import Any
 
 import requests
 
+from ..perf.trace import span
+
 logger = logging.getLogger(__name__)
 
 
@@ -97,7 +99,8 @@ class HomeAssistantService:
         logger.info("HA WebSocket authenticated")
         self._connected = True
 
-        self._seed_states()
+        with span("ha.seed_states", "ha", entities=len(self.entity_ids)):
+            self._seed_states()
 
         self._subscribed = False
         if self.entity_ids:
@@ -135,8 +138,9 @@ class HomeAssistantService:
                 if not raw:
                     continue
                 last_msg_time = time.monotonic()
-                msg = json.loads(raw)
-                self._handle_ws_message(msg)
+                with span("ha.message", "ha", size=len(raw)):
+                    msg = json.loads(raw)
+                    self._handle_ws_message(msg)
         finally:
             self._connected = False
             ws.close()
@@ -151,7 +155,7 @@ class HomeAssistantService:
                 )
                 if resp.ok:
                     data = resp.json()
-                    with self._lock:
+                    with span("ha.lock", "ha"), self._lock:
                         self._snapshot[eid] = data
                 else:
                     logger.warning("Failed to seed %s: %s", eid, resp.status_code)
@@ -180,7 +184,7 @@ class HomeAssistantService:
                         for entity_id, state_data in result.items():
                             normalized = self._normalize_entity(state_data)
                             normalized["entity_id"] = entity_id
-                            with self._lock:
+                            with span("ha.lock", "ha"), self._lock:
                                 self._snapshot[entity_id] = normalized
                             logger.debug(
                                 "HA entity seeded from subscription: %s = %s",
@@ -205,14 +209,14 @@ class HomeAssistantService:
             for entity_id, state_data in added.items():
                 normalized = self._normalize_entity(state_data)
                 normalized["entity_id"] = entity_id
-                with self._lock:
+                with span("ha.lock", "ha"), self._lock:
                     self._snapshot[entity_id] = normalized
                 logger.debug("HA entity added: %s = %s", entity_id, normalized.get("state"))
             for entity_id, change_data in changed.items():
                 if isinstance(change_data, dict) and "+" in change_data:
                     plus = change_data["+"]
                     normalized = self._normalize_entity(plus)
-                    with self._lock:
+                    with span("ha.lock", "ha"), self._lock:
                         existing = self._snapshot.get(entity_id, {})
                         updated = dict(existing)
                         if "state" in normalized and normalized["state"] is not None:
@@ -248,7 +252,7 @@ class HomeAssistantService:
                     )
                     if resp.ok:
                         data = resp.json()
-                        with self._lock:
+                        with span("ha.lock", "ha"), self._lock:
                             self._snapshot[eid] = data
                 except Exception:
                     pass
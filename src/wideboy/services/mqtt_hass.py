@@ -9,6 +9,7 @@ from typing import Any
 import paho.mqtt.client as mqtt
 
 from ..config import MqttConfig, Settings
+from ..perf.trace import span
 
 logger = logging.getLogger(__name__)
 
@@ -29,13 +30,14 @@ class MqttHassService:
 
         self._current_state: dict[str, Any] = {
             "state": "ON",
-            "brightness": 255,
+            "brightness": round(state.brightness.master_level * 255),
             "fg_brightness": int(state.brightness.foreground_level * 100),
             "scene": Path(settings.scenes.file).stem,
             "effect": self._get_current_effect(),
             "effect_speed": 1.0,
             "tag": self._get_current_tag(),
             "palette": self._get_current_palette(),
+            "profile_status": "idle",
         }
 
     def _get_current_effect(self) -> str:
@@ -152,12 +154,20 @@ class MqttHassService:
                 }
             )
 
-        elif component == "notify":
+        elif component in ("notify", "button"):
             base.update(
                 {
                     "command_topic": "~/set",
                 }
             )
+        elif component == "sensor":
+            base.update(
+                {
+                    "state_topic": "~/state",
+                }
+            )
+            if object_id == "profile_status":
+                base["json_attributes_topic"] = f"{self._base_topic}/profile/result"
 
         return base
 
@@ -174,6 +184,9 @@ class MqttHassService:
             ("select", "tag"),
             ("select", "palette"),
             ("notify", "notify"),
+            ("button", "snapshot"),
+            ("button", "profile"),
+            ("sensor", "profile_status"),
         ]
 
         for component, object_id in entities:
@@ -220,6 +233,8 @@ class MqttHassService:
             payload = self._current_state["tag"]
         elif object_id == "palette":
             payload = self._current_state["palette"]
+        elif object_id == "profile_status":
+            payload = self._current_state["profile_status"]
         else:
             return
 
@@ -234,6 +249,7 @@ class MqttHassService:
             "effect",
             "tag",
             "palette",
+            "profile_status",
         ):
             self._publish_state(object_id)
 
@@ -275,9 +291,13 @@ class MqttHassService:
             payload = msg.payload.decode("utf-8", errors="replace")
             logger.debug("MQTT recv: %s = %s", topic, payload)
             try:
-                self._handle_command(topic, payload)
+                with span("mqtt.command", "mqtt", topic=topic):
+                    self._handle_command(topic, payload)
             except Exception:
                 logger.exception("Error handling MQTT command: %s = %s", topic, payload)
+            standby = getattr(self._state, "standby", None)
+            if standby is not None:
+                standby.wake()
 
         self._client.on_connect = on_connect
         self._client.on_message = on_message
@@ -333,9 +353,8 @@ class MqttHassService:
             if "brightness" in data:
                 b = int(data["brightness"])
                 self._current_state["brightness"] = b
-                self._state.master_level = b / 255.0
-                self._state.brightness.set_background(self._state.master_level)
-                logger.info("Background brightness set to %.2f", self._state.master_level)
+                self._state.brightness.set_master(b / 255.0)
+                logger.info("Master brightness set to %.2f", b / 255.0)
 
             self._publish_state("light")
 
@@ -382,6 +401,12 @@ class MqttHassService:
             self._set_palette(payload)
             self._publish_state("palette")
 
+        elif object_id == "profile":
+            self._request_profile(payload)
+
+        elif object_id == "snapshot":
+            self._request_snapshot(payload)
+
         elif object_id == "notify":
             import time
 
@@ -394,6 +419,49 @@ class MqttHassService:
             }
             logger.info("Notification received: %s", payload[:100])
 
+    def _request_profile(self, payload: str) -> None:
+        capture = getattr(self._state, "profile_capture", None)
+        if capture is None:
+            logger.warning("Profile capture not available")
+            return
+        try:
+            data = json.loads(payload) if payload.strip() not in ("", "PRESS") else {}
+        except json.JSONDecodeError:
+            logger.warning("Invalid profile command: %s", payload)
+            return
+        if isinstance(data, dict):
+            duration = data.get("duration", 10.0)
+        else:
+            duration = data
+        try:
+            duration = float(duration)
+        except (TypeError, ValueError):
+            logger.warning("Invalid profile duration: %s", payload)
+            return
+        capture.request(duration)
+
+    def _request_snapshot(self, payload: str) -> None:
+        preview = getattr(self._state, "preview", None)
+        if preview is None:
+            logger.warning("Snapshots need preview.enabled")
+            return
+        preview.snapshot("" if payload == "PRESS" else payload)
+
+    def publish_snapshot_result(self, result: dict[str, Any]) -> None:
+        if not self._client:
+            return
+        self._client.publish(f"{self._base_topic}/snapshot/result", json.dumps(result))
+
+    def publish_profile_status(self, status: str) -> None:
+        self._current_state["profile_status"] = status
+        self._publish_state("profile_status")
+
+    def publish_profile_result(self, result: dict[str, Any]) -> None:
+        if not self._client:
+            return
+        self._client.publish(f"{self._base_topic}/profile/result", json.dumps(result))
+        logger.info("Published profile result: %s", result.get("path"))
+
     def _set_effect(self, name: str) -> None:
         bg = self._state.background
         if hasattr(bg, "set_effect"):
@@ -440,31 +508,35 @@ class MqttHassService:
                     current.set_speed(speed)
 
     def _reload_scene(self, scene_file: str) -> None:
-        try:
-            from ..core.factory import add_system_overlays, build_background, build_widgets
-            from ..core.scene import load_scene
-            from ..render.palette import load_palettes
-
-            scene = load_scene(scene_file)
-            palettes = load_palettes("palettes.yml")
-            background = build_background(scene, palette_definitions=palettes)
-            widgets = build_widgets(
-                scene,
-                canvas_width=self._settings.display.canvas.width,
-                canvas_height=self._settings.display.canvas.height,
-            )
+        with span("mqtt.reload_scene", "mqtt", scene=scene_file):
+            try:
+                from ..core.factory import add_system_overlays, build_background, build_widgets
+                from ..core.scene import load_scene
+                from ..render.palette import load_palettes
 
-            self._state.scene = scene
-            self._state.palettes = palettes
-            self._state.background = background
-            self._state.widgets = widgets
-            add_system_overlays(
-                self._state,
-                canvas_width=self._settings.display.canvas.width,
-                canvas_height=self._settings.display.canvas.height,
-            )
-            self._settings.scenes.file = scene_file
+                scene = load_scene(scene_file)
+                palettes = load_palettes("palettes.yml")
+                background = build_background(scene, palette_definitions=palettes)
+                widgets = build_widgets(
+                    scene,
+                    canvas_width=self._settings.display.canvas.width,
+                    canvas_height=self._settings.display.canvas.height,
+                )
 
-            logger.info("Scene reloaded: %s", scene_file)
-        except Exception:
-            logger.exception("Failed to reload scene: %s", scene_file)
+                previous = self._state.background
+                self._state.scene = scene
+                self._state.palettes = palettes
+                self._state.background = background
+                self._state.widgets = widgets
+                add_system_overlays(
+                    self._state,
+                    canvas_width=self._settings.display.canvas.width,
+                    canvas_height=self._settings.display.canvas.height,
+                )
+                self._settings.scenes.file = scene_file
+                if previous is not None:
+                    self._state.retired.append(previous)
+
+                logger.info("Scene reloaded: %s", scene_file)
+            except Exception:
+                logger.exception("Failed to reload scene: %s", scene_file)
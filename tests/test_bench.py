@@ -0,0 +1,70 @@
+import argparse
+import os
+
+import pytest
+
+from wideboy.perf.bench import bench_effect, compare_results, parse_size
+
+
+def test_parse_size():
+    assert parse_size("768x64") == (768, 64)
+    assert parse_size("1536X128") == (1536, 128)
+
+
+@pytest.mark.parametrize("value", ["768", "axb", "0x64", "768x-1"])
+def test_parse_size_invalid(value):
+    with pytest.raises(argparse.ArgumentTypeError):
+        parse_size(value)
+
+
+def test_compare_results_flags_regressions():
+    baseline = {"results": {"plasma@768x64": {"mean_ms": 10.0, "p95_ms": 12.0}}}
+    current = {"results": {"plasma@768x64": {"mean_ms": 10.5, "p95_ms": 15.0}}}
+    regressions = compare_results(current, baseline, tolerance=0.15)
+    assert len(regressions) == 1
+    assert "p95" in regressions[0]
+
+
+def test_compare_results_ignores_new_entries():
+    baseline = {"results": {}}
+    current = {"results": {"plasma@768x64": {"mean_ms": 10.0, "p95_ms": 12.0}}}
+    assert compare_results(current, baseline) == []
+
+
+def test_bench_effect_reports_stats():
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    import pygame
+
+    from wideboy.render.palette import load_palettes
+
+    pygame.init()
+    result = bench_effect(
+        "plasma", (64, 16), load_palettes("palettes.yml"), frames=5, warmup=1, memory_frames=2
+    )
+    assert result["size"] == "64x16"
+    assert result["frames"] == 5
+    assert result["mean_ms"] > 0
+    assert result["max_ms"] >= result["p95_ms"]
+    assert result["peak_kib"] > 0
+    assert result["alloc_kib"] >= 0
+
+
+def test_bench_effect_peak_covers_every_traced_frame(monkeypatch):
+    import numpy as np
+
+    from wideboy.perf import bench
+
+    class Spiky:
+        renders = 0
+
+        def update(self, dt):
+            pass
+
+        def render(self, surface):
+            self.renders += 1
+            if self.renders == 2:
+                np.ones(1024 * 1024, dtype=np.uint8).sum()
+
+    monkeypatch.setattr(bench, "_make_background", lambda name, palettes: Spiky())
+    result = bench_effect("plasma", (8, 4), {}, frames=1, warmup=0, memory_frames=3)
+    assert result["peak_kib"] >= 1024
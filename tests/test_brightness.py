@@ -43,3 +43,10 @@ def test_clear_override():
     assert mgr.has_fg_override is True
     mgr.set_foreground(None)
     assert mgr.has_fg_override is False
+
+
+def test_master_level():
+    mgr = BrightnessManager(master=BrightnessConfig(default=0.8))
+    assert mgr.master_level == 0.8
+    mgr.set_master(1.5)
+    assert mgr.master_level == 1.0
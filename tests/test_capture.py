@@ -0,0 +1,71 @@
+import pstats
+import threading
+import time
+
+from wideboy.perf.capture import ProfileCapture
+
+
+def _busy():
+    return sum(i * i for i in range(2000))
+
+
+def test_capture_writes_pstats_and_reports_top(tmp_path):
+    done = threading.Event()
+    results = []
+
+    def on_complete(result):
+        results.append(result)
+        done.set()
+
+    capture = ProfileCapture(tmp_path, top=5, on_complete=on_complete)
+    assert capture.request(0.05) is True
+    capture.tick()
+    assert capture.running
+    deadline = time.monotonic() + 1.0
+    while capture.running and time.monotonic() < deadline:
+        _busy()
+        capture.tick()
+    assert done.wait(2.0)
+
+    result = results[0]
+    assert result["frames"] > 0
+    assert len(result["top"]) <= 5
+    assert any("_busy" in row["function"] or "genexpr" in row["function"] for row in result["top"])
+    pstats.Stats(result["path"])
+
+
+def test_capture_rejects_overlapping_requests(tmp_path):
+    capture = ProfileCapture(tmp_path)
+    assert capture.request(1.0) is True
+    assert capture.request(1.0) is False
+    capture.tick()
+    assert capture.request(1.0) is False
+    capture.stop()
+    assert not capture.running
+
+
+def test_capture_clamps_duration(tmp_path):
+    capture = ProfileCapture(tmp_path, max_duration=2.0)
+    capture.request(600)
+    assert capture._requested == 2.0
+
+
+def test_capture_reports_status_changes(tmp_path):
+    done = threading.Event()
+    statuses = []
+
+    def on_status(status):
+        statuses.append(status)
+        if status == "idle":
+            done.set()
+
+    capture = ProfileCapture(tmp_path, on_status=on_status)
+    assert capture.status == "idle"
+    capture.request(0.1)
+    assert capture.status == "pending"
+    capture.tick()
+    assert capture.status == "running"
+    time.sleep(0.12)
+    capture.tick()
+    assert done.wait(2.0)
+    assert statuses == ["pending", "running", "idle"]
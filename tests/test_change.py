@@ -0,0 +1,91 @@
+import pygame
+
+from wideboy.backgrounds.base import Background
+from wideboy.backgrounds.composite import CompositeBackground
+from wideboy.backgrounds.image import ImageBackground
+from wideboy.core.layer import Layer
+from wideboy.display.change import FrameChangeDetector
+
+
+def _frame(color, size=(8, 4)):
+    surf = pygame.Surface(size, pygame.SRCALPHA)
+    surf.fill(color)
+    return surf
+
+
+def test_identical_frames_are_skipped():
+    changes = FrameChangeDetector()
+    assert changes.changed(_frame((10, 20, 30)))
+    assert not changes.changed(_frame((10, 20, 30)))
+    assert changes.changed(_frame((10, 20, 31)))
+    assert changes.summary() == {"presented": 2, "skipped": 1, "hinted": 0}
+
+
+def test_single_pixel_change_is_detected():
+    changes = FrameChangeDetector()
+    surf = _frame((0, 0, 0), size=(768, 64))
+    assert changes.changed(surf)
+    surf.set_at((767, 63), (1, 0, 0))
+    assert changes.changed(surf)
+    assert not changes.changed(surf)
+
+
+def test_size_change_presents():
+    changes = FrameChangeDetector()
+    assert changes.changed(_frame((0, 0, 0)))
+    assert changes.changed(_frame((0, 0, 0), size=(16, 4)))
+
+
+def test_clean_key_skips_compare_after_first_clean_frame():
+    changes = FrameChangeDetector()
+    assert changes.changed(_frame((1, 1, 1)), None)
+    # The first clean frame is still compared against the last dirty one.
+    assert changes.changed(_frame((2, 2, 2)), ("k",))
+    # Repeated clean frames with the same key are trusted without comparing.
+    assert not changes.changed(_frame((9, 9, 9)), ("k",))
+    assert changes.hinted == 1
+    assert changes.changed(_frame((9, 9, 9)), ("other",))
+    assert not changes.changed(_frame((9, 9, 9)), None)
+
+
+def test_surface_unlocked_after_compare():
+    changes = FrameChangeDetector()
+    surf = _frame((5, 5, 5))
+    changes.changed(surf)
+    changes.changed(surf)
+    assert not surf.get_locked()
+
+
+class CountingLayer(Layer):
+    def __init__(self):
+        super().__init__()
+        self.renders = 0
+
+    def _render(self, surface):
+        self.renders += 1
+
+
+def test_layer_reports_redraw():
+    layer = CountingLayer()
+    target = pygame.Surface((4, 4), pygame.SRCALPHA)
+    layer.render(target)
+    assert layer.redrawn
+    layer.render(target)
+    assert not layer.redrawn
+    layer.mark_dirty()
+    layer.render(target)
+    assert layer.redrawn and layer.renders == 2
+
+
+class Animated(Background):
+    def render(self, surface):
+        pass
+
+
+def test_background_static_hints():
+    assert not Animated().static
+    assert ImageBackground().static
+    composite = CompositeBackground([ImageBackground(), Animated()], [None, None])
+    assert composite.static
+    composite.set_active_index(1)
+    assert not composite.static
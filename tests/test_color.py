@@ -0,0 +1,114 @@
+import pygame
+
+from wideboy.config import Settings
+from wideboy.render.color import ColorPipeline, cie_lightness
+
+
+def _frame(color=(200, 100, 50), size=(12, 2)):
+    surf = pygame.Surface(size, pygame.SRCALPHA)
+    surf.fill(color)
+    return surf
+
+
+def _rgb(surf, x=0, y=0):
+    return tuple(surf.get_at((x, y)))[:3]
+
+
+class BrightDisplay:
+    def __init__(self, handled=True):
+        self.handled = handled
+        self.levels = []
+
+    def set_brightness(self, level):
+        self.levels.append(level)
+        return self.handled
+
+
+def test_identity_leaves_frame_untouched():
+    color = ColorPipeline()
+    surf = _frame()
+    color.set_brightness(1.0)
+    color.apply(surf)
+    assert color.identity
+    assert _rgb(surf) == (200, 100, 50)
+
+
+def test_linear_brightness():
+    color = ColorPipeline()
+    color.set_brightness(0.5)
+    surf = _frame()
+    color.apply(surf)
+    assert _rgb(surf) == (100, 50, 25)
+
+
+def test_gamma_lut():
+    color = ColorPipeline(gamma=2.0)
+    color.set_brightness(1.0)
+    surf = _frame((255, 128, 0))
+    color.apply(surf)
+    assert _rgb(surf) == (255, 64, 0)
+    assert surf.get_at((0, 0)).a == 255
+
+
+def test_cie_curve_is_monotonic_and_bounded():
+    import numpy as np
+
+    values = cie_lightness(np.linspace(0.0, 1.0, 256))
+    assert values[0] == 0.0
+    assert abs(values[-1] - 1.0) < 1e-6
+    assert (np.diff(values) >= 0).all()
+
+
+def test_white_balance_per_output_segment():
+    color = ColorPipeline(
+        white_balance=[[1.0, 1.0, 1.0], [0.5, 1.0, 1.0], [1.0, 1.0, 0.0]],
+        output_order=[2, 0, 1],
+    )
+    color.set_brightness(1.0)
+    surf = _frame((200, 100, 50))
+    color.apply(surf)
+    # physical output 0 shows logical segment 2, output 1 segment 0, output 2 segment 1
+    assert _rgb(surf, 0) == (100, 100, 50)
+    assert _rgb(surf, 4) == (200, 100, 0)
+    assert _rgb(surf, 8) == (200, 100, 50)
+
+    gamma = ColorPipeline(gamma=1.5, white_balance=[[0.5, 1.0, 1.0], [1.0, 1.0, 1.0]])
+    gamma.set_brightness(1.0)
+    surf = _frame((255, 255, 255), size=(4, 1))
+    gamma.apply(surf)
+    assert _rgb(surf, 0) == (128, 255, 255)
+    assert _rgb(surf, 3) == (255, 255, 255)
+
+
+def test_lut_rebuilt_only_on_level_change():
+    color = ColorPipeline(gamma=2.2)
+    surf = _frame()
+    for _ in range(5):
+        color.set_brightness(0.8)
+        color.apply(surf)
+    assert color.rebuilds == 1
+    color.set_brightness(0.6)
+    assert color.rebuilds == 2
+
+
+def test_brightness_offloaded_to_display():
+    display = BrightDisplay()
+    color = ColorPipeline(hardware_brightness=True)
+    color.set_brightness(0.5, display)
+    surf = _frame()
+    color.apply(surf)
+    assert display.levels == [0.5]
+    assert _rgb(surf) == (200, 100, 50)
+
+    fallback = ColorPipeline(hardware_brightness=True)
+    fallback.set_brightness(0.5, BrightDisplay(handled=False))
+    surf = _frame()
+    fallback.apply(surf)
+    assert _rgb(surf) == (100, 50, 25)
+
+
+def test_from_settings():
+    settings = Settings(color={"gamma": 2.2, "white_balance": [[1, 0.9, 0.8]]})
+    color = ColorPipeline.from_settings(settings)
+    assert color.gamma == 2.2
+    assert not color.linear
@@ -0,0 +1,210 @@
+import socket
+import threading
+import time
+
+import numpy as np
+import pygame
+
+from wideboy.config import Settings
+from wideboy.display.ddp import MAX_PAYLOAD, DdpDisplay
+from wideboy.display.fanout import FanoutDisplay
+from wideboy.display.null import NullDisplay
+
+
+class DdpReceiver:
+    def __init__(self, width, height, host="127.0.0.1", port=0):
+        self.width = width
+        self.height = height
+        self.buffer = bytearray(width * height * 3)
+        self._sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self._sock.bind((host, port))
+        self._sock.settimeout(0.1)
+        self.address = self._sock.getsockname()
+        self._stop = threading.Event()
+        self._thread = None
+        self._lock = threading.Lock()
+        self._frame_event = threading.Event()
+        self.frames = []
+        self.packets = 0
+        self.bytes = 0
+        self.errors = 0
+        self.started = 0.0
+
+    def start(self):
+        self.started = time.perf_counter()
+        self._thread = threading.Thread(target=self._run, name="ddp-receiver", daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                packet = self._sock.recv(2048)
+            except TimeoutError:
+                continue
+            except OSError:
+                return
+            self._handle(packet)
+
+    def _handle(self, packet):
+        if len(packet) < 10 or packet[0] & 0xC0 != 0x40:
+            self.errors += 1
+            return
+        offset = int.from_bytes(packet[4:8], "big")
+        length = int.from_bytes(packet[8:10], "big")
+        data = packet[10:]
+        if len(data) != length or offset + length > len(self.buffer):
+            self.errors += 1
+            return
+        self.packets += 1
+        self.bytes += len(packet)
+        self.buffer[offset : offset + length] = data
+        if packet[0] & 0x01:
+            with self._lock:
+                self.frames.append((time.perf_counter(), bytes(self.buffer)))
+            self._frame_event.set()
+
+    def wait_for_frames(self, count, timeout=2.0):
+        deadline = time.perf_counter() + timeout
+        while len(self.frames) < count:
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                return False
+            self._frame_event.wait(remaining)
+            self._frame_event.clear()
+        return True
+
+    def throughput(self):
+        elapsed = max(1e-9, time.perf_counter() - self.started)
+        return {
+            "frames": len(self.frames),
+            "fps": len(self.frames) / elapsed,
+            "mbit_s": self.bytes * 8 / elapsed / 1e6,
+            "errors": self.errors,
+        }
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=1)
+        self._sock.close()
+
+
+def _setup(width=64, height=16, **ddp):
+    receiver = DdpReceiver(width, height)
+    receiver.start()
+    host, port = receiver.address
+    settings = Settings(ddp={"host": host, "port": port, **ddp})
+    display = DdpDisplay(settings)
+    display.start()
+    return receiver, display
+
+
+def _frame(seed, size=(64, 16)):
+    rng = np.random.default_rng(seed)
+    surf = pygame.Surface(size, pygame.SRCALPHA)
+    pygame.surfarray.blit_array(surf, rng.integers(0, 256, (*size, 3), dtype=np.uint8))
+    return surf
+
+
+def _rgb(surf):
+    return pygame.image.tobytes(surf, "RGB")
+
+
+def test_frame_integrity():
+    receiver, display = _setup(fps=0)
+    try:
+        for seed in range(3):
+            surf = _frame(seed)
+            display.present(surf)
+            assert receiver.wait_for_frames(seed + 1)
+            assert receiver.frames[-1][1] == _rgb(surf)
+    finally:
+        display.stop()
+        receiver.stop()
+    assert receiver.errors == 0
+    assert display.latest_latency < 0.5
+    assert receiver.throughput()["frames"] == 3
+
+
+def test_only_changed_packets_sent():
+    receiver, display = _setup(fps=0, keyframe_interval=0)
+    try:
+        surf = _frame(0)
+        display.present(surf)
+        assert receiver.wait_for_frames(1)
+        full = receiver.packets
+        assert full == -(-64 * 16 * 3 // MAX_PAYLOAD)
+        surf.set_at((63, 15), (1, 2, 3))
+        display.present(surf)
+        assert receiver.wait_for_frames(2)
+        assert receiver.packets == full + 1
+        assert receiver.frames[-1][1] == _rgb(surf)
+        display.present(surf)
+    finally:
+        display.stop()
+        receiver.stop()
+    assert display.packets == full + 1
+    assert display.frames == 2
+
+
+def test_keyframe_resends_everything():
+    receiver, display = _setup(fps=0, keyframe_interval=0.05)
+    try:
+        display.present(_frame(0))
+        assert receiver.wait_for_frames(2, timeout=2.0)
+    finally:
+        display.stop()
+        receiver.stop()
+    assert display.packets >= 2 * -(-64 * 16 * 3 // MAX_PAYLOAD)
+
+
+def test_fps_limit_coalesces_frames():
+    receiver, display = _setup(fps=20, keyframe_interval=0)
+    try:
+        start = time.perf_counter()
+        for seed in range(40):
+            last = _frame(seed)
+            display.present(last)
+            time.sleep(0.005)
+        elapsed = time.perf_counter() - start
+        deadline = time.perf_counter() + 1.0
+        while receiver.frames[-1:] and receiver.frames[-1][1] != _rgb(last):
+            assert time.perf_counter() < deadline
+            time.sleep(0.01)
+    finally:
+        display.stop()
+        receiver.stop()
+    assert display.rate_limited > 0
+    assert display.frames <= elapsed * 20 + 2
+    assert receiver.frames[-1][1] == _rgb(last)
+
+
+def test_resize_does_not_disturb_prepared_packets():
+    receiver = DdpReceiver(64, 16)
+    receiver.start()
+    host, port = receiver.address
+    display = DdpDisplay(Settings(ddp={"host": host, "port": port, "keyframe_interval": 0}))
+    display._sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    try:
+        display._allocate((64, 16))
+        display._rgb[:] = 7
+        views = display._prepare()
+        display._allocate((8, 4))
+        display._send(views)
+        assert receiver.wait_for_frames(1)
+    finally:
+        display._sock.close()
+        receiver.stop()
+    assert receiver.frames[-1][1] == bytes([7]) * (64 * 16 * 3)
+    assert receiver.errors == 0
+
+
+def test_ddp_mirrors_other_backends():
+    from wideboy.__main__ import _create_display
+
+    settings = Settings(ddp={"enabled": True})
+    display = _create_display(settings, "null")
+    assert isinstance(display, FanoutDisplay)
+    assert isinstance(display.displays[0], NullDisplay)
+    assert isinstance(display.displays[1], DdpDisplay)
+    assert isinstance(_create_display(Settings(), "ddp"), DdpDisplay)
@@ -1,3 +1,5 @@
+from pathlib import Path
+
 import pytest
 
 from wideboy.backgrounds.procedural import (
@@ -159,3 +161,245 @@ def test_get_effect_metadata_with_extra():
     plasma_meta = next(m for m in meta if m["name"] == "plasma")
     assert "custom" in plasma_meta["tags"]
     assert "abstract" in plasma_meta["tags"]
+
+
+MIGRATED = ["plasma", "rings", "cityscape", "life", "boids", "solar"]
+INDEXED = ["plasma", "aurora", "mandelbrot", "waves", "gradient"]
+
+
+REFERENCE_FRAMES = Path(__file__).parent / "data" / "effects_reference.npz"
+
+
+@pytest.mark.parametrize("name", MIGRATED)
+def test_render_into_matches_reference_frames(name):
+    import numpy as np
+
+    from wideboy.backgrounds.procedural import Scratch
+    from wideboy.render.palette import Palette
+
+    reference = np.load(REFERENCE_FRAMES)
+    effect = type(EFFECTS[name])()
+    assert effect.renders_into
+    out = np.zeros((16, 48, 3), dtype=np.uint8)
+    scratch = Scratch()
+    tolerance = 1 if name in INDEXED else 0
+    for t in (0.0, 0.7, 2.5):
+        effect.render_into(out, t, Palette(), scratch)
+        expected = reference[f"{name}@{t}"]
+        assert np.abs(out.astype(int) - expected).max() <= tolerance
+
+
+def test_legacy_effects_render_into_via_call():
+    import numpy as np
+
+    from wideboy.backgrounds.procedural import Scratch
+    from wideboy.render.palette import Palette
+
+    effect = EFFECTS["scanlines"]
+    assert not effect.renders_into
+    out = np.zeros((8, 16, 3), dtype=np.uint8)
+    effect.render_into(out, 1.0, Palette(), Scratch())
+    assert np.array_equal(out, type(effect)()(1.0, 16, 8, Palette()))
+
+
+def test_scratch_reuses_buffers():
+    import numpy as np
+
+    from wideboy.backgrounds.procedural import Scratch
+
+    scratch = Scratch()
+    a = scratch.get("frame", (4, 8, 3))
+    assert scratch.get("frame", (4, 8, 3)) is a
+    assert scratch.get("frame", (4, 8, 3), np.uint8) is not a
+    assert scratch.get("frame", (2, 8, 3)) is not a
+    assert scratch.nbytes == 4 * 8 * 3 * 4 + 4 * 8 * 3 + 2 * 8 * 3 * 4
+    scratch.clear()
+    assert scratch.nbytes == 0
+
+
+def test_background_reuses_buffers_per_instance():
+    from wideboy.backgrounds.procedural import ProceduralBackground
+
+    bg = ProceduralBackground({"effect": "plasma"})
+    out, scratch = bg.buffers(40, 10)
+    assert out.shape == (10, 40, 3)
+    assert bg.buffers(40, 10)[0] is out
+    assert bg.buffers(40, 10)[1] is scratch
+
+    other = ProceduralBackground({"effect": "plasma"})
+    assert other.buffers(40, 10)[0] is not out
+    assert other.buffers(40, 10)[1] is not scratch
+
+
+def test_background_drops_buffers_on_resize():
+    import pygame
+
+    from wideboy.backgrounds.procedural import ProceduralBackground
+
+    bg = ProceduralBackground({"effect": "plasma"})
+    surface = pygame.Surface((40, 10))
+    bg.render(surface)
+    out, scratch = bg.buffers(40, 10)
+    size = scratch.nbytes
+    assert size > 0
+
+    bg.render(pygame.Surface((20, 6)))
+    resized, same = bg.buffers(20, 6)
+    assert resized is not out
+    assert same is scratch
+    assert 0 < scratch.nbytes < size
+
+
+def _render(name, surface):
+    from wideboy.backgrounds.procedural import ProceduralBackground
+
+    bg = ProceduralBackground({"effect": name})
+    bg.render(surface)
+    return bg
+
+
+@pytest.mark.parametrize("name", ["plasma", "gradient"])
+def test_render_writes_effect_pixels_into_surface(name):
+    import numpy as np
+    import pygame
+
+    from wideboy.render.palette import Palette
+
+    surface = pygame.Surface((48, 16), pygame.SRCALPHA)
+    _render(name, surface)
+    expected = type(EFFECTS[name])()(0.0, 48, 16, Palette())
+    assert np.array_equal(pygame.surfarray.array3d(surface).transpose(1, 0, 2), expected)
+    assert pygame.surfarray.array_alpha(surface).min() == 255
+
+
+def test_render_scaled_effect_reuses_small_surface():
+    import pygame
+
+    surface = pygame.Surface((48, 16), pygame.SRCALPHA)
+    bg = _render("aurora", surface)
+    small = bg._small
+    assert small.get_size() == (24, 8)
+    bg.render(surface)
+    assert bg._small is small
+    assert surface.get_at((47, 15)) == small.get_at((23, 7))
+
+
+@pytest.mark.parametrize("name", INDEXED)
+def test_indexed_effects_render_index_fields(name):
+    import numpy as np
+
+    from wideboy.backgrounds.procedural import Scratch
+
+    effect = type(EFFECTS[name])()
+    assert effect.indexed
+    assert effect.index_dtype == np.uint16
+    index = np.zeros((16, 48), dtype=np.uint16)
+    effect.render_index(index, 1.3, Scratch())
+    assert index.max() < effect.levels
+    assert len(np.unique(index)) > 1
+
+
+def test_palette_lut_spans_palette_stops():
+    import numpy as np
+
+    from wideboy.backgrounds.procedural._utils import palette_array, palette_lut
+    from wideboy.render.palette import Palette
+
+    colors = palette_array(Palette())
+    lut = palette_lut(colors, 256)
+    assert lut.shape == (256, 3)
+    assert lut.dtype == np.uint8
+    assert np.array_equal(lut[0], colors[0].astype(np.uint8))
+    assert np.array_equal(lut[-1], colors[-1].astype(np.uint8))
+
+
+def test_eight_bit_index_for_small_palettes():
+    import numpy as np
+
+    from wideboy.backgrounds.procedural import Scratch
+    from wideboy.render.palette import Palette
+
+    effect = type(EFFECTS["plasma"])()
+    effect.levels = 256
+    assert effect.index_dtype == np.uint8
+    out = np.zeros((16, 48, 3), dtype=np.uint8)
+    scratch = Scratch()
+    effect.render_into(out, 0.5, Palette(), scratch)
+    reference = type(EFFECTS["plasma"])()(0.5, 48, 16, Palette())
+    assert np.abs(out.astype(int) - reference).max() <= 4
+
+
+def test_background_rebuilds_lut_only_when_palette_changes():
+    import pygame
+
+    from wideboy.backgrounds.procedural import ProceduralBackground
+    from wideboy.core.factory import _SharedClockResolver
+    from wideboy.render.palette import Palette, PaletteClock, PaletteConfig
+
+    defs = {"a": Palette(), "b": Palette(primary=(10.0, 20.0, 30.0))}
+    resolver = _SharedClockResolver(PaletteClock(defs, PaletteConfig(default="a")), "a")
+    bg = ProceduralBackground({"effect": "waves", "_palette_resolver": resolver})
+    surface = pygame.Surface((48, 16))
+    bg.render(surface)
+    lut = bg._lut
+    bg.update(0.1)
+    bg.render(surface)
+    assert bg._lut is lut
+    bg.set_palette("b")
+    bg.render(surface)
+    assert bg._lut is not lut
+
+
+def test_mandelbrot_keeps_iterations_across_palette_changes():
+    import numpy as np
+
+    from wideboy.backgrounds.procedural import Scratch
+    from wideboy.render.palette import Palette
+
+    effect = type(EFFECTS["mandelbrot"])()
+    out = np.zeros((16, 48, 3), dtype=np.uint8)
+    scratch = Scratch()
+    effect.render_into(out, 1.0, Palette(), scratch)
+    cached = effect._cache["index"]
+    effect.render_into(out, 1.01, Palette(dim=(0.0, 0.0, 0.0)), scratch)
+    assert effect._cache["index"] is cached
+    assert effect._cache["t"] == 1.0
+
+
+def test_field_cache_shares_read_only_fields():
+    import numpy as np
+
+    from wideboy.backgrounds.procedural._utils import angle_field, grid_x, radius_field
+
+    r = radius_field(12, 5, 3, 2)
+    assert r is radius_field(12, 5, 3, 2)
+    assert r.shape == (5, 12)
+    assert r.dtype == np.float32
+    assert not r.flags.writeable
+    assert r[2, 3] == 0.0
+    assert r[2, 7] == 4.0
+    assert np.allclose(r, np.hypot(np.arange(12) - 3, np.arange(5)[:, None] - 2))
+    a = angle_field(12, 5, 3, 2)
+    assert a[2, 7] == 0.0
+    assert np.isclose(a[4, 3], np.pi / 2)
+    assert grid_x(12).tolist() == list(range(12))
+
+
+def test_field_cache_is_bounded():
+    import numpy as np
+
+    from wideboy.backgrounds.procedural._utils import FieldCache
+
+    cache = FieldCache(max_bytes=3 * 100 * 4)
+    first = cache.get(("a",), lambda: np.zeros(100))
+    cache.get(("b",), lambda: np.zeros(100))
+    cache.get(("c",), lambda: np.zeros(100))
+    assert cache.get(("a",), lambda: np.ones(100)) is first
+    cache.get(("d",), lambda: np.zeros(100))
+    assert len(cache) == 3
+    assert cache.nbytes == 3 * 100 * 4
+    assert cache.get(("b",), lambda: np.ones(100))[0] == 1.0
+    assert cache.get(("a",), lambda: np.ones(100)) is first
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.nbytes == 0
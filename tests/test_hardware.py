@@ -0,0 +1,123 @@
+import tracemalloc
+
+import pygame
+
+from wideboy.config import Settings
+from wideboy.display.hardware import HardwareDisplay
+
+
+class FakeCanvas:
+    def __init__(self, name):
+        self.name = name
+        self.images = []
+
+    def SetImage(self, image):
+        self.images.append(image.getpixel((0, 0)))
+
+
+class FakeMatrix:
+    def __init__(self):
+        self.front = FakeCanvas("front")
+        self.swapped = []
+
+    def Clear(self):
+        self.cleared = True
+
+    def SwapOnVSync(self, canvas):
+        self.swapped.append(canvas.name)
+        previous, self.front = self.front, canvas
+        return previous
+
+
+def _display():
+    display = HardwareDisplay(Settings())
+    display.matrix = FakeMatrix()
+    display.buffer = FakeCanvas("back")
+    return display
+
+
+def _screen(color=(0, 0, 0)):
+    surf = pygame.Surface((768, 64), pygame.SRCALPHA)
+    surf.fill(color)
+    return surf
+
+
+def test_present_remaps_into_physical_layout():
+    display = _display()
+    screen = _screen()
+    screen.fill((255, 0, 0), (0, 0, 256, 64))
+    screen.fill((0, 255, 0), (256, 0, 256, 64))
+    screen.fill((0, 0, 255), (512, 0, 256, 64))
+    display.present(screen)
+    image = display._image
+    assert image.size == (256, 192)
+    assert image.getpixel((0, 0)) == (255, 0, 0)
+    assert image.getpixel((0, 64)) == (0, 255, 0)
+    assert image.getpixel((255, 191)) == (0, 0, 255)
+
+
+def test_swap_uses_returned_canvas():
+    display = _display()
+    display.present(_screen((1, 2, 3)))
+    display.present(_screen((4, 5, 6)))
+    display.present(_screen((7, 8, 9)))
+    assert display.matrix.swapped == ["back", "front", "back"]
+    assert display.buffer.name == "front"
+    assert display.matrix.front.images[-1] == (7, 8, 9)
+
+
+def test_present_reuses_buffers():
+    display = _display()
+    screen = _screen((10, 20, 30))
+    display.present(screen)
+    physical, image = display._physical, display._image
+    for _ in range(5):
+        display.present(screen)
+    assert display._physical is physical
+    assert display._image is image
+
+
+def test_present_steady_state_does_not_allocate_frames():
+    display = _display()
+    display.buffer.SetImage = lambda image: None
+    display.matrix.front.SetImage = lambda image: None
+    screen = _screen((10, 20, 30))
+    for _ in range(3):
+        display.present(screen)
+    tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        for _ in range(20):
+            display.present(screen)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    assert peak < display._physical.nbytes // 4
+
+
+def test_clear_blanks_matrix():
+    display = _display()
+    display.clear()
+    assert display.matrix.cleared
+
+
+def test_present_follows_panel_layout():
+    settings = Settings()
+    settings.display.matrix.remap.output_order = [2, 0, 1]
+    display = HardwareDisplay(settings)
+    display.matrix = FakeMatrix()
+    display.buffer = FakeCanvas("back")
+    screen = _screen()
+    screen.fill((0, 0, 255), (512, 0, 256, 64))
+    screen.set_at((513, 1), (9, 8, 7))
+    display.present(screen)
+    assert display._image.getpixel((0, 0)) == (0, 0, 255)
+    assert display._image.getpixel((1, 1)) == (9, 8, 7)
+    assert display._image.getpixel((0, 64)) == (0, 0, 0)
+
+
+def test_set_brightness_scales_driver_brightness():
+    display = _display()
+    assert display.set_brightness(0.5)
+    assert display.matrix.brightness == 25
+    assert not HardwareDisplay(Settings()).set_brightness(0.5)
@@ -0,0 +1,109 @@
+import numpy as np
+import pytest
+
+from wideboy.config import PanelConfig, Settings
+from wideboy.display.layout import Panel, PanelLayout, grid_layout, segment_layout
+from wideboy.display.remap import layout_from_settings
+
+
+def _canvas(width, height):
+    return np.arange(width * height, dtype=np.uint32)
+
+
+def _apply(layout, src=None):
+    width, height = layout.canvas_size
+    if src is None:
+        src = _canvas(width, height)
+    out = np.empty(layout.shape[0] * layout.shape[1], dtype=src.dtype)
+    return layout.remap(src, out).reshape(layout.shape)
+
+
+def test_segment_layout_matches_reorder():
+    layout = segment_layout(12, 2, [2, 0, 1])
+    assert layout.shape == (6, 4)
+    logical = _canvas(12, 2).reshape(2, 12)
+    physical = _apply(layout)
+    assert (physical[0:2] == logical[:, 8:12]).all()
+    assert (physical[2:4] == logical[:, 0:4]).all()
+    assert (physical[4:6] == logical[:, 4:8]).all()
+
+
+def test_rotations_and_mirror():
+    logical = _canvas(3, 2).reshape(2, 3)
+    cases = {
+        (0, False): logical,
+        (180, False): logical[::-1, ::-1],
+        (0, True): logical[:, ::-1],
+    }
+    for (rotate, mirror), expected in cases.items():
+        layout = PanelLayout([[Panel(0, 0, rotate, mirror)]], (3, 2), (3, 2))
+        assert (_apply(layout) == expected).all(), (rotate, mirror)
+
+    tall = _canvas(2, 3).reshape(3, 2)
+    layout = PanelLayout([[Panel(0, 0, 90)]], (3, 2), (2, 3))
+    assert (_apply(layout) == np.rot90(tall, 1)).all()
+    layout = PanelLayout([[Panel(0, 0, 270)]], (3, 2), (2, 3))
+    assert (_apply(layout) == np.rot90(tall, -1)).all()
+
+
+def test_serpentine_grid():
+    layout = grid_layout(4, 4, (2, 2), chain=4, parallel=1, serpentine=True)
+    assert layout.shape == (2, 8)
+    logical = _canvas(4, 4).reshape(4, 4)
+    physical = _apply(layout)
+    assert (physical[:, 0:2] == logical[0:2, 0:2]).all()
+    assert (physical[:, 2:4] == logical[0:2, 2:4]).all()
+    assert (physical[:, 4:6] == logical[2:4, 2:4][::-1, ::-1]).all()
+    assert (physical[:, 6:8] == logical[2:4, 0:2][::-1, ::-1]).all()
+
+
+def test_grid_mismatch_raises():
+    with pytest.raises(ValueError):
+        grid_layout(6, 2, (2, 2), chain=2, parallel=2)
+
+
+def test_validation():
+    with pytest.raises(ValueError):
+        PanelLayout([[Panel(0, 0, 45)]], (2, 2), (2, 2))
+    with pytest.raises(ValueError):
+        PanelLayout([[Panel(1, 0)]], (2, 2), (2, 2))
+    with pytest.raises(ValueError):
+        PanelLayout([[Panel(0, 0), Panel(0, 0)]], (2, 2), (2, 2), chain_length=1)
+
+
+def test_unused_chain_positions_are_black():
+    layout = PanelLayout([[Panel(0, 0)], [Panel(2, 0), Panel(0, 0)]], (2, 1), (4, 1))
+    physical = _apply(layout, np.array([1, 2, 3, 4], dtype=np.uint32))
+    assert physical.tolist() == [[1, 2, 0, 0], [3, 4, 1, 2]]
+    rgb = np.arange(12, dtype=np.uint8).reshape(4, 3)
+    out = np.empty((8, 3), dtype=np.uint8)
+    layout.remap(rgb, out)
+    assert (out[2:4] == 0).all()
+
+
+def test_padded_stride():
+    layout = segment_layout(4, 2, [1, 0])
+    src = np.array([0, 1, 2, 3, 99, 4, 5, 6, 7, 99], dtype=np.uint32)
+    out = np.empty(8, dtype=np.uint32)
+    layout.remap(src, out, stride=5)
+    assert out.reshape(4, 2).tolist() == [[2, 3], [6, 7], [0, 1], [4, 5]]
+
+
+def test_layout_from_settings():
+    settings = Settings()
+    layout = layout_from_settings(settings)
+    assert layout.shape == (192, 256)
+
+    settings.display.canvas.height = 128
+    settings.display.canvas.width = 256
+    settings.display.matrix.driver.parallel = 2
+    settings.display.matrix.remap.output_order = [0, 1]
+    settings.display.matrix.remap.serpentine = True
+    layout = layout_from_settings(settings)
+    assert layout.shape == (128, 256)
+    assert layout.chains[1][0] == Panel(128, 64, rotate=180)
+
+    settings.display.matrix.remap.chains = [[PanelConfig(rotate=180, mirror=True)]]
+    layout = layout_from_settings(settings)
+    assert layout.chains == [[Panel(0, 0, 180, True)]]
+    assert layout.shape == (64, 256)
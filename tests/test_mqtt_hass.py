@@ -10,8 +10,8 @@ from wideboy.services.mqtt_hass import MqttHassService
 def _make_state(effect_name: str = "plasma") -> MagicMock:
     state = MagicMock()
     state.master_on = True
-    state.master_level = 1.0
     state.brightness = MagicMock()
+    state.brightness.master_level = 1.0
     state.brightness.foreground_level = 0.8
     state.brightness.background_level = 0.8
     state.brightness.has_bg_override = False
@@ -95,7 +95,60 @@ def test_handle_light_on():
     assert svc._current_state["state"] == "ON"
     assert svc._current_state["brightness"] == 128
     assert svc._state.master_on is True
-    assert abs(svc._state.master_level - 128 / 255) < 0.01
+    svc._state.brightness.set_master.assert_called_once_with(128 / 255)
+    svc._state.brightness.set_background.assert_not_called()
+
+
+def _brightness_service(master=1.0):
+    from wideboy.render.brightness import BrightnessConfig, BrightnessManager
+
+    state = _make_state()
+    state.brightness = BrightnessManager(master=BrightnessConfig(default=master))
+    svc = MqttHassService(MqttConfig(device_id="test_display"), state, Settings())
+    svc._client = MagicMock()
+    return svc
+
+
+class _DriverDisplay:
+    def __init__(self):
+        self.levels = []
+
+    def set_brightness(self, level):
+        self.levels.append(level)
+        return True
+
+
+def test_initial_brightness_follows_master_level():
+    svc = _brightness_service(master=0.5)
+    assert svc._current_state["brightness"] == 128
+
+
+def test_light_brightness_rebuilds_color_lut():
+    from wideboy.render.color import ColorPipeline
+
+    svc = _brightness_service()
+    color = ColorPipeline(gamma=2.2)
+    color.set_brightness(svc._state.brightness.master_level)
+    rebuilds = color.rebuilds
+    svc._handle_command("test_display/light/set", json.dumps({"state": "ON", "brightness": 51}))
+    assert svc._state.brightness.master_level == 51 / 255
+    assert svc._state.brightness.background_level == 1.0
+    color.set_brightness(svc._state.brightness.master_level)
+    assert color.rebuilds == rebuilds + 1
+    color.set_brightness(svc._state.brightness.master_level)
+    assert color.rebuilds == rebuilds + 1
+
+
+def test_light_brightness_updates_driver_level():
+    from wideboy.render.color import ColorPipeline
+
+    svc = _brightness_service()
+    color = ColorPipeline(hardware_brightness=True)
+    display = _DriverDisplay()
+    color.set_brightness(svc._state.brightness.master_level, display)
+    svc._handle_command("test_display/light/set", json.dumps({"state": "ON", "brightness": 102}))
+    color.set_brightness(svc._state.brightness.master_level, display)
+    assert display.levels == [1.0, 102 / 255]
 
 
 def test_handle_light_off():
@@ -214,3 +267,81 @@ def test_handle_notify():
     assert svc._state.notification["text"] == "Hello world!"
     assert "received_at" in svc._state.notification
     assert "expire_time" in svc._state.notification
+
+
+def test_handle_profile_duration():
+    svc = _make_service()
+    svc._client = MagicMock()
+    svc._handle_command("test_display/profile/set", "15")
+    svc._state.profile_capture.request.assert_called_once_with(15.0)
+
+
+def test_handle_profile_json():
+    svc = _make_service()
+    svc._client = MagicMock()
+    svc._handle_command("test_display/profile/set", json.dumps({"duration": 5}))
+    svc._state.profile_capture.request.assert_called_once_with(5.0)
+
+
+def test_handle_profile_invalid():
+    svc = _make_service()
+    svc._client = MagicMock()
+    svc._handle_command("test_display/profile/set", "soon")
+    svc._state.profile_capture.request.assert_not_called()
+
+
+def test_publish_profile_result():
+    svc = _make_service()
+    svc._client = MagicMock()
+    svc.publish_profile_result({"path": "profiles/p.pstats", "top": []})
+    args = svc._client.publish.call_args
+    assert args[0][0] == "test_display/profile/result"
+    assert json.loads(args[0][1])["path"] == "profiles/p.pstats"
+
+
+def test_handle_snapshot():
+    svc = _make_service()
+    svc._client = MagicMock()
+    svc._handle_command("test_display/snapshot/set", "PRESS")
+    svc._state.preview.snapshot.assert_called_once_with("")
+
+
+def test_discovery_payload_snapshot_button():
+    svc = _make_service()
+    payload = svc._discovery_payload("button", "snapshot")
+    assert payload["command_topic"] == "~/set"
+    assert "state_topic" not in payload
+
+
+def test_handle_profile_button_press():
+    svc = _make_service()
+    svc._state.profile_capture = MagicMock()
+    svc._handle_command("test_display/profile/set", "PRESS")
+    svc._state.profile_capture.request.assert_called_once_with(10.0)
+
+
+def test_discovery_payload_profile_status_sensor():
+    svc = _make_service()
+    payload = svc._discovery_payload("sensor", "profile_status")
+    assert payload["state_topic"] == "~/state"
+    assert payload["json_attributes_topic"] == "test_display/profile/result"
+    assert "command_topic" not in payload
+
+
+def test_publish_profile_status():
+    svc = _make_service()
+    svc._client = MagicMock()
+    svc.publish_profile_status("running")
+    svc._client.publish.assert_called_once_with(
+        "test_display/profile_status/state", "running", retain=True
+    )
+
+
+def test_reload_scene_retires_previous_background():
+    svc = _make_service()
+    svc._state.retired = []
+    previous = svc._state.background
+    svc._reload_scene("scenes/default.yml")
+    assert svc._state.retired == [previous]
+    previous.close.assert_not_called()
+    assert svc._state.background is not previous
@@ -0,0 +1,54 @@
+import os
+
+import pygame
+
+from wideboy.config import Settings
+from wideboy.display.native import NativeDisplay, led_mask
+
+
+def _start(scale, dot_size=0.85):
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    pygame.init()
+    settings = Settings(
+        display={
+            "canvas": {"width": 8, "height": 4},
+            "native": {"scale": scale, "dot_size": dot_size},
+        }
+    )
+    display = NativeDisplay(settings)
+    display.start()
+    return display
+
+
+def test_led_mask_dots():
+    mask = led_mask((2, 1), 6, 0.7)
+    assert mask.get_size() == (12, 6)
+    assert tuple(mask.get_at((0, 0)))[:3] == (0, 0, 0)
+    assert tuple(mask.get_at((3, 3)))[:3] == (255, 255, 255)
+    assert tuple(mask.get_at((9, 3)))[:3] == (255, 255, 255)
+
+
+def test_led_mask_skipped_when_invisible():
+    assert led_mask((2, 1), 1, 0.7) is None
+    assert led_mask((2, 1), 4, 1.0) is None
+    assert led_mask((2, 1), 2, 0.85) is None
+
+
+def test_present_scales_into_window():
+    display = _start(4)
+    assert display.window.get_size() == (32, 16)
+    frame = pygame.Surface((8, 4), pygame.SRCALPHA)
+    frame.fill((200, 100, 50))
+    frame.set_at((7, 3), (10, 20, 30))
+    display.present(frame)
+    assert tuple(display.window.get_at((1, 1)))[:3] == (200, 100, 50)
+    assert tuple(display.window.get_at((29, 13)))[:3] == (10, 20, 30)
+    assert tuple(display.window.get_at((0, 0)))[:3] == (0, 0, 0)
+
+
+def test_square_pixels_without_mask():
+    display = _start(3, dot_size=1.0)
+    frame = pygame.Surface((8, 4), pygame.SRCALPHA)
+    frame.fill((9, 9, 9))
+    display.present(frame)
+    assert tuple(display.window.get_at((0, 0)))[:3] == (9, 9, 9)
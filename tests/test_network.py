@@ -0,0 +1,243 @@
+import socket
+import time
+
+import numpy as np
+import pygame
+import pytest
+
+from wideboy.backgrounds.composite import CompositeBackground
+from wideboy.backgrounds.network import (
+    FrameReceiver,
+    NetworkBackground,
+    get_receiver,
+    stop_receivers,
+)
+from wideboy.core.factory import _get_background_types
+
+
+def _sacn(universe, data, sequence=0, options=0):
+    packet = bytearray(126)
+    packet[0:2] = (0x0010).to_bytes(2, "big")
+    packet[4:16] = b"ASC-E1.17\x00\x00\x00"
+    packet[18:22] = (4).to_bytes(4, "big")
+    packet[40:44] = (2).to_bytes(4, "big")
+    packet[108] = 100
+    packet[111] = sequence
+    packet[112] = options
+    packet[113:115] = universe.to_bytes(2, "big")
+    packet[117] = 0x02
+    packet[118] = 0xA1
+    packet[121:123] = (1).to_bytes(2, "big")
+    packet[123:125] = (len(data) + 1).to_bytes(2, "big")
+    return bytes(packet) + bytes(data)
+
+
+def _ddp(offset, data, push):
+    header = bytes([0x40 | (0x01 if push else 0), 1, 0x0B, 1])
+    return header + offset.to_bytes(4, "big") + len(data).to_bytes(2, "big") + bytes(data)
+
+
+def _send_sacn(sock, address, frame, pixels_per_universe=170, sequence=0, skip=()):
+    data = frame.reshape(-1)
+    step = pixels_per_universe * 3
+    for i, start in enumerate(range(0, len(data), step)):
+        if i not in skip:
+            sock.sendto(_sacn(1 + i, data[start : start + step], sequence), address)
+
+
+def _wait(receiver, frames, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while receiver.frames < frames:
+        assert time.monotonic() < deadline
+        time.sleep(0.005)
+
+
+@pytest.fixture
+def sender():
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    yield sock
+    sock.close()
+
+
+def _random_frame(seed, size=(40, 10)):
+    w, h = size
+    return np.random.default_rng(seed).integers(0, 256, (h, w, 3), dtype=np.uint8)
+
+
+def test_sacn_reassembles_universes(sender):
+    receiver = FrameReceiver((40, 10), host="127.0.0.1", port=0)
+    receiver.start()
+    try:
+        assert receiver.universes == 3
+        frame = _random_frame(0)
+        _send_sacn(sender, receiver.address, frame)
+        _wait(receiver, 1)
+        out = np.zeros_like(frame)
+        assert receiver.take(out)
+        assert np.array_equal(out, frame)
+        assert not receiver.take(out)
+    finally:
+        receiver.stop()
+    assert receiver.stats()["errors"] == 0
+
+
+def test_sacn_missing_universe_counts_incomplete(sender):
+    receiver = FrameReceiver((40, 10), host="127.0.0.1", port=0)
+    receiver.start()
+    try:
+        _send_sacn(sender, receiver.address, _random_frame(0), sequence=0, skip=(2,))
+        _send_sacn(sender, receiver.address, _random_frame(1), sequence=1)
+        _wait(receiver, 2)
+    finally:
+        receiver.stop()
+    assert receiver.incomplete == 1
+    assert receiver.sequence_errors == 0
+
+
+def test_ddp_frames(sender):
+    receiver = FrameReceiver((40, 10), protocol="ddp", host="127.0.0.1", port=0)
+    receiver.start()
+    try:
+        frame = _random_frame(2).reshape(-1)
+        sender.sendto(_ddp(0, frame[:600], False), receiver.address)
+        sender.sendto(_ddp(600, frame[600:], True), receiver.address)
+        _wait(receiver, 1)
+        out = np.zeros((10, 40, 3), dtype=np.uint8)
+        assert receiver.take(out)
+        assert np.array_equal(out.reshape(-1), frame)
+    finally:
+        receiver.stop()
+
+
+def test_jitter_buffer_holds_back_and_skips_late_frames():
+    receiver = FrameReceiver((4, 2), host="127.0.0.1", port=0, buffers=2)
+    out = np.zeros((2, 4, 3), dtype=np.uint8)
+    try:
+        for value in (1, 2, 3):
+            receiver._assembly[:] = value
+            receiver._complete()
+        assert receiver.overruns == 1
+        assert not receiver.take(out, delay=10.0)
+        assert receiver.take(out)
+        assert out[0, 0, 0] == 3
+        assert receiver.late == 1
+    finally:
+        receiver.stop()
+
+
+def test_network_background_renders_latest_frame(sender):
+    bg = NetworkBackground({"host": "127.0.0.1", "port": 0, "jitter_ms": 0})
+    surface = pygame.Surface((40, 10), pygame.SRCALPHA)
+    bg.render(surface)
+    try:
+        frame = _random_frame(3)
+        _send_sacn(sender, bg.receiver.address, frame)
+        _wait(bg.receiver, 1)
+        bg.update(0.016)
+        bg.render(surface)
+        rendered = pygame.surfarray.array3d(surface).transpose(1, 0, 2)
+        assert np.array_equal(rendered, frame)
+        assert bg.stats()["frames"] == 1
+    finally:
+        bg.close()
+
+
+def test_shared_receiver_stops_after_last_close(caplog):
+    options = {"host": "127.0.0.1", "port": 0}
+    first = NetworkBackground(options)
+    second = NetworkBackground(options)
+    surface = pygame.Surface((40, 10), pygame.SRCALPHA)
+    first.render(surface)
+    second.render(surface)
+    receiver = first.receiver
+    assert second.receiver is receiver
+
+    first.close()
+    assert first.receiver is None
+    assert receiver._thread is not None
+
+    with caplog.at_level("INFO", logger="wideboy.backgrounds.network"):
+        second.close()
+    assert receiver._thread is None
+    assert "sacn input on 127.0.0.1" in caplog.text
+    assert get_receiver((40, 10), **first._options) is not receiver
+    stop_receivers()
+
+
+def test_composite_close_releases_receivers():
+    bg = NetworkBackground({"host": "127.0.0.1", "port": 0})
+    composite = CompositeBackground([bg], [None])
+    composite.render(pygame.Surface((40, 10), pygame.SRCALPHA))
+    receiver = bg.receiver
+    composite.close()
+    assert receiver._thread is None
+
+
+def test_closed_background_does_not_reopen():
+    bg = NetworkBackground({"host": "127.0.0.1", "port": 0})
+    bg.close()
+    bg.update(0.016)
+    bg.render(pygame.Surface((40, 10), pygame.SRCALPHA))
+    assert bg.receiver is None
+    assert bg.stats() == {}
+
+
+def test_scene_reload_reuses_listener_until_new_background_renders():
+    import asyncio
+    import os
+
+    from wideboy.__main__ import DisplayState, run_loop
+    from wideboy.config import Settings
+    from wideboy.display.null import NullDisplay
+    from wideboy.render.brightness import BrightnessManager
+
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    pygame.init()
+    options = {"host": "127.0.0.1", "port": 0}
+    old = NetworkBackground(options)
+    state = DisplayState(None, {}, old, [], BrightnessManager())
+    screen = pygame.Surface((40, 10), pygame.SRCALPHA)
+
+    def run():
+        asyncio.run(
+            run_loop(
+                screen,
+                NullDisplay(),
+                state,
+                None,
+                None,
+                Settings(),
+                False,
+                asyncio.Event(),
+                max_frames=1,
+                throttle=False,
+            )
+        )
+
+    run()
+    receiver = old.receiver
+    new = NetworkBackground(options)
+    state.background = new
+    state.retired.append(old)
+    run()
+    try:
+        assert state.retired == []
+        assert old.receiver is None
+        assert new.receiver is receiver
+        assert receiver._thread is not None
+    finally:
+        new.close()
+    assert receiver._thread is None
+
+
+def test_stop_receivers_stops_all():
+    receivers = [
+        get_receiver((40, 10), host="127.0.0.1", port=0, protocol=protocol)
+        for protocol in ("sacn", "ddp")
+    ]
+    stop_receivers()
+    assert all(receiver._thread is None for receiver in receivers)
+
+
+def test_registered_background_type():
+    assert _get_background_types()["network"] is NetworkBackground
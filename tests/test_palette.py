@@ -6,6 +6,7 @@ from wideboy.render.palette import (
     PaletteConfig,
     PaletteResolver,
     PaletteRule,
+    ResolvedPalette,
     load_palettes,
     parse_palette,
 )
@@ -168,3 +169,48 @@ def test_shared_clock_no_flash_on_effect_change():
 
     assert resolver_neon.palette.primary == (30.0, 30.0, 30.0)
     assert resolver_ocean.palette.primary == (30.0, 30.0, 30.0)
+
+
+def test_resolved_palette_is_immutable_with_arrays():
+    import numpy as np
+    import pytest
+
+    p = ResolvedPalette(Palette(primary=(1, 2, 3), dim=(300, -5, 0)))
+    assert p.primary == (1.0, 2.0, 3.0)
+    assert p.colors.dtype == np.float32
+    assert p.colors.shape == (5, 3)
+    assert p.colors[0].tolist() == [1.0, 2.0, 3.0]
+    assert p.colors_u8[4].tolist() == [255, 0, 0]
+    with pytest.raises(AttributeError):
+        p.primary = (0.0, 0.0, 0.0)
+    with pytest.raises(ValueError):
+        p.colors[0, 0] = 9.0
+    assert ResolvedPalette.of(p) is p
+    assert ResolvedPalette.of(Palette()).version != p.version
+
+
+def test_clock_resolves_once_per_state():
+    a = Palette(primary=(0, 0, 0))
+    b = Palette(primary=(100, 100, 100))
+    config = PaletteConfig(
+        default="a",
+        rules=[PaletteRule(after=time(21, 0), palette="b")],
+        fade_seconds=2.0,
+    )
+    clock = PaletteClock(definitions={"a": a, "b": b}, config=config)
+    clock.update(0.0, datetime(2026, 1, 1, 12, 0))
+    first = clock.resolve("a")
+    assert clock.resolve("a") is first
+    assert clock.resolve("b") is not first
+
+    clock.update(0.5, datetime(2026, 1, 1, 12, 0))
+    assert clock.resolve("a") is first
+
+    clock.update(0.0, datetime(2026, 1, 1, 21, 0))
+    clock.update(0.5, datetime(2026, 1, 1, 21, 0))
+    fading = clock.resolve("a")
+    assert fading.version != first.version
+    assert clock.resolve("a") is fading
+
+    clock.update(0.5, datetime(2026, 1, 1, 21, 0))
+    assert clock.resolve("a").version != fading.version
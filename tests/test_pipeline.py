@@ -0,0 +1,106 @@
+import threading
+import time
+
+import pygame
+import pytest
+
+from wideboy.display.base import Display
+from wideboy.display.pipeline import PipelinedDisplay
+
+
+class SlowDisplay(Display):
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.seen = []
+        self.threads = set()
+        self.stopped = False
+
+    def present(self, surface):
+        self.threads.add(threading.current_thread().name)
+        time.sleep(self.delay)
+        self.seen.append(tuple(surface.get_at((0, 0)))[:3])
+
+    def stop(self):
+        self.stopped = True
+
+
+def _frame(color):
+    surf = pygame.Surface((8, 4), pygame.SRCALPHA)
+    surf.fill(color)
+    return surf
+
+
+def test_frames_presented_in_order_on_worker_thread():
+    inner = SlowDisplay()
+    display = PipelinedDisplay(inner)
+    display.start()
+    colors = [(i, 2 * i, 3 * i) for i in range(1, 20)]
+    for color in colors:
+        display.present(_frame(color))
+    display.stop()
+    assert inner.seen == colors
+    assert inner.threads == {"display-present"}
+    assert inner.stopped
+
+
+def test_source_surface_reusable_after_present():
+    inner = SlowDisplay(delay=0.02)
+    display = PipelinedDisplay(inner)
+    display.start()
+    surf = _frame((10, 20, 30))
+    display.present(surf)
+    surf.fill((200, 0, 0))
+    display.stop()
+    assert inner.seen == [(10, 20, 30)]
+
+
+def test_back_pressure_when_output_is_slow():
+    inner = SlowDisplay(delay=0.02)
+    display = PipelinedDisplay(inner)
+    display.start()
+    for i in range(6):
+        display.present(_frame((i, i, i)))
+    display.stop()
+    assert len(inner.seen) == 6
+    assert display.waits > 0
+
+
+def test_present_without_start_is_synchronous():
+    inner = SlowDisplay()
+    display = PipelinedDisplay(inner)
+    display.present(_frame((1, 2, 3)))
+    assert inner.seen == [(1, 2, 3)]
+
+
+def test_mailbox_never_blocks_and_keeps_latest():
+    inner = SlowDisplay(delay=0.05)
+    display = PipelinedDisplay(inner, mode="mailbox")
+    display.start()
+    start = time.perf_counter()
+    for i in range(1, 11):
+        display.present(_frame((i, i, i)))
+    elapsed = time.perf_counter() - start
+    display.stop()
+    assert elapsed < 0.05
+    assert display.waits == 0
+    assert display.busy > 0
+    assert display.dropped > 0
+    assert inner.seen[-1] == (10, 10, 10)
+    assert display.frames + display.dropped == display.submitted == 10
+
+
+def test_unknown_mode_rejected():
+    with pytest.raises(ValueError):
+        PipelinedDisplay(SlowDisplay(), mode="fifo")
+
+
+def test_hardware_backend_pipelined_by_default():
+    from wideboy.__main__ import _create_display
+    from wideboy.config import Settings
+
+    settings = Settings()
+    display = _create_display(settings, "hardware")
+    assert isinstance(display, PipelinedDisplay)
+    assert display.mode == "mailbox"
+    settings.display.pipeline = False
+    assert not isinstance(_create_display(settings, "hardware"), PipelinedDisplay)
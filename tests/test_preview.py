@@ -0,0 +1,175 @@
+import contextlib
+import io
+import threading
+import time
+import urllib.request
+
+import pygame
+import pytest
+from PIL import Image
+
+from wideboy.config import Settings
+from wideboy.display.preview import BOUNDARY, PreviewDisplay
+
+
+def _frame(color, size=(8, 4)):
+    surf = pygame.Surface(size, pygame.SRCALPHA)
+    surf.fill(color)
+    return surf
+
+
+@contextlib.contextmanager
+def _static_loop(preview, surface):
+    stop = threading.Event()
+
+    def run():
+        while not stop.is_set():
+            if preview.wants_frame:
+                preview.present(surface)
+            time.sleep(0.005)
+
+    thread = threading.Thread(target=run, daemon=True)
+    thread.start()
+    try:
+        yield
+    finally:
+        stop.set()
+        thread.join()
+
+
+@pytest.fixture
+def preview(tmp_path):
+    settings = Settings(
+        preview={
+            "enabled": True,
+            "host": "127.0.0.1",
+            "port": 0,
+            "fps": 50,
+            "scale": 2,
+            "snapshot_dir": str(tmp_path / "snaps"),
+        }
+    )
+    display = PreviewDisplay(settings)
+    display.start()
+    yield display
+    display.stop()
+
+
+def _get(preview, path):
+    host, port = preview.address
+    return urllib.request.urlopen(f"http://{host}:{port}{path}", timeout=5)
+
+
+def test_present_does_not_encode_without_clients(preview):
+    for _ in range(5):
+        preview.present(_frame((10, 20, 30)))
+    time.sleep(0.05)
+    assert preview.encoded == 0
+
+
+def test_present_skips_copy_until_a_frame_is_wanted(preview):
+    preview.present(_frame((10, 20, 30)))
+    assert preview._frame is None
+    assert not preview.wants_frame
+    future = preview.snapshot()
+    assert preview.wants_frame
+    preview.present(_frame((40, 50, 60)))
+    assert not preview.wants_frame
+    assert Image.open(future.result(5)["path"]).getpixel((0, 0)) == (40, 50, 60)
+
+
+def test_snapshot_saved_by_worker(preview, tmp_path):
+    results = []
+    preview.on_snapshot = results.append
+    surface = _frame((10, 20, 30))
+    preview.present(surface)
+    with _static_loop(preview, surface):
+        result = preview.snapshot("front door").result(5)
+    path = tmp_path / "snaps" / "front door.png"
+    assert result["path"] == str(path)
+    assert results == [result]
+    image = Image.open(path)
+    assert image.size == (16, 8)
+    assert image.getpixel((15, 7)) == (10, 20, 30)
+
+
+def test_snapshot_before_first_frame_fails(preview):
+    with pytest.raises(RuntimeError):
+        preview.snapshot().result(5)
+
+
+def test_http_png_frame(preview):
+    surface = _frame((1, 2, 3))
+    preview.present(surface)
+    with _static_loop(preview, surface), _get(preview, "/frame.png") as response:
+        assert response.headers["Content-Type"] == "image/png"
+        image = Image.open(io.BytesIO(response.read()))
+    assert image.getpixel((0, 0)) == (1, 2, 3)
+
+
+def test_http_mjpeg_stream(preview):
+    surface = _frame((200, 0, 0))
+    preview.present(surface)
+    with _static_loop(preview, surface), _get(preview, "/stream.mjpg") as response:
+        assert BOUNDARY in response.headers["Content-Type"]
+        assert response.readline() == f"--{BOUNDARY}\r\n".encode()
+        assert response.readline() == b"Content-Type: image/jpeg\r\n"
+        length = int(response.readline().split(b":")[1])
+        response.readline()
+        image = Image.open(io.BytesIO(response.read(length)))
+    r, g, b = image.getpixel((4, 4))
+    assert r > 180 and g < 40 and b < 40
+    assert preview.encoded >= 1
+
+
+def test_http_not_found(preview):
+    with pytest.raises(urllib.error.HTTPError) as exc:
+        _get(preview, "/nope")
+    assert exc.value.code == 404
+
+
+def test_run_loop_presents_static_frame_for_pending_snapshot(tmp_path):
+    import asyncio
+    import os
+
+    from wideboy.__main__ import DisplayState, run_loop
+    from wideboy.backgrounds.base import Background
+    from wideboy.render.brightness import BrightnessManager
+
+    futures = []
+
+    class Solid(Background):
+        renders = 0
+
+        def render(self, surface):
+            surface.fill((0, 0, 255))
+            self.renders += 1
+            if self.renders == 3:
+                assert preview._frame is None
+                futures.append(preview.snapshot("static"))
+
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    pygame.init()
+    settings = Settings(preview={"enabled": True, "port": None, "snapshot_dir": str(tmp_path)})
+    preview = PreviewDisplay(settings)
+    preview.start()
+    state = DisplayState(None, {}, Solid(), [], BrightnessManager())
+    try:
+        asyncio.run(
+            run_loop(
+                pygame.Surface((8, 4), pygame.SRCALPHA),
+                preview,
+                state,
+                None,
+                None,
+                settings,
+                False,
+                asyncio.Event(),
+                max_frames=5,
+                throttle=False,
+            )
+        )
+        result = futures[0].result(5)
+    finally:
+        preview.stop()
+    assert Image.open(result["path"]).getpixel((0, 0)) == (0, 0, 255)
@@ -0,0 +1,65 @@
+import pytest
+
+from wideboy.perf.profiler import TOTAL, FrameProfiler, RollingStats
+
+
+def test_rolling_stats_percentiles():
+    stats = RollingStats(window=100)
+    for i in range(1, 101):
+        stats.add(i / 1000.0)
+    s = stats.summary()
+    assert s["count"] == 100
+    assert s["p50"] == pytest.approx(50.5, abs=0.01)
+    assert s["p95"] == pytest.approx(95.05, abs=0.01)
+    assert s["max"] == pytest.approx(100.0)
+
+
+def test_rolling_stats_window_wraps():
+    stats = RollingStats(window=10)
+    for _ in range(10):
+        stats.add(1.0)
+    for _ in range(10):
+        stats.add(0.002)
+    s = stats.summary()
+    assert s["count"] == 10
+    assert s["p99"] == pytest.approx(2.0)
+    assert s["max"] == pytest.approx(2.0)
+
+
+def test_rolling_stats_empty():
+    assert RollingStats(window=5).summary()["count"] == 0
+
+
+def test_profiler_records_stages_and_effects():
+    prof = FrameProfiler(report_interval=0)
+    for _ in range(3):
+        prof.begin_frame()
+        prof.stage("background_render")
+        prof.stage("present")
+        prof.end_frame("plasma")
+    summary = prof.summary()
+    assert summary["frames"] == 3
+    assert set(summary["stages"]) == {"background_render", "present", TOTAL}
+    assert summary["stages"][TOTAL]["count"] == 3
+    assert summary["effects"]["plasma"]["present"]["count"] == 3
+
+
+def test_profiler_accumulates_repeated_stage():
+    prof = FrameProfiler(report_interval=0)
+    prof.begin_frame()
+    prof.stage("widgets_render")
+    prof.stage("widgets_update")
+    prof.stage("widgets_render")
+    prof.end_frame()
+    assert prof.summary()["stages"]["widgets_render"]["count"] == 1
+
+
+def test_profiler_disabled_tracks_stage_only():
+    prof = FrameProfiler(enabled=False)
+    prof.begin_frame()
+    prof.stage("present")
+    assert prof.current_stage == "present"
+    prof.end_frame("plasma")
+    assert prof.current_stage is None
+    assert prof.frames == 1
+    assert prof.summary()["stages"] == {}
@@ -0,0 +1,70 @@
+import pygame
+import pytest
+
+from wideboy.config import Settings
+from wideboy.display.null import NullDisplay
+from wideboy.display.record import FrameRing, RecordDisplay
+
+
+def _frame(color, size=(6, 3)):
+    surf = pygame.Surface(size, pygame.SRCALPHA)
+    surf.fill(color)
+    return surf
+
+
+def test_ring_wraps_and_reads_oldest_first(tmp_path):
+    path = tmp_path / "frames.ring"
+    ring = FrameRing.create(path, 6, 3, slots=3)
+    for i in range(5):
+        ring.write(_frame((i, 2 * i, 3 * i)), 100.0 + i)
+    ring.flush()
+
+    reader = FrameRing.open(path)
+    assert reader.size == (6, 3)
+    assert reader.capacity == 3
+    assert reader.count == 5
+    frames = list(reader.frames())
+    assert [f for f, _, _ in frames] == [2, 3, 4]
+    assert [t for _, t, _ in frames] == [102.0, 103.0, 104.0]
+    assert frames[-1][2].shape == (3, 6, 3)
+    assert tuple(frames[-1][2][2, 5]) == (4, 8, 12)
+
+
+def test_pixels_stored_row_major(tmp_path):
+    ring = FrameRing.create(tmp_path / "r.ring", 6, 3, slots=2)
+    surf = _frame((0, 0, 0))
+    surf.set_at((5, 1), (7, 8, 9))
+    ring.write(surf, 0.0)
+    _, _, pixels = next(ring.frames())
+    assert tuple(pixels[1, 5]) == (7, 8, 9)
+
+
+def test_open_rejects_other_files(tmp_path):
+    path = tmp_path / "junk.ring"
+    path.write_bytes(b"\0" * 128)
+    with pytest.raises(ValueError):
+        FrameRing.open(path)
+
+
+def test_record_display(tmp_path):
+    settings = Settings(
+        display={"canvas": {"width": 6, "height": 3}},
+        record={"path": str(tmp_path / "rec" / "frames.ring"), "slots": 4},
+    )
+    display = RecordDisplay(settings)
+    display.start()
+    display.present(_frame((1, 2, 3)))
+    display.present(_frame((4, 5, 6)))
+    display.stop()
+    reader = FrameRing.open(tmp_path / "rec" / "frames.ring")
+    assert reader.count == 2
+    assert tuple(list(reader.frames())[-1][2][0, 0]) == (4, 5, 6)
+    assert reader.path.stat().st_size == 64 + 4 * (16 + 6 * 3 * 3)
+
+
+def test_backend_selection():
+    from wideboy.__main__ import _create_display
+
+    settings = Settings()
+    assert isinstance(_create_display(settings, "null"), NullDisplay)
+    assert isinstance(_create_display(settings, "record"), RecordDisplay)
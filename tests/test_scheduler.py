@@ -0,0 +1,95 @@
+import pytest
+
+from wideboy.core.scheduler import FrameScheduler
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+def _scheduler(policy, fps=10, **kwargs):
+    clock = FakeClock()
+    return FrameScheduler(fps, policy=policy, clock=clock, **kwargs), clock
+
+
+def test_unknown_policy_rejected():
+    with pytest.raises(ValueError):
+        FrameScheduler(30, policy="warp")
+
+
+def test_on_time_frames_sleep_to_absolute_deadline():
+    sched, clock = _scheduler("skip")
+    assert sched.begin_frame() == pytest.approx(0.1)
+    clock.now += 0.03
+    assert sched.end_frame() == pytest.approx(0.07)
+    clock.now = 100.1
+    assert sched.begin_frame() == pytest.approx(0.1)
+    clock.now += 0.05
+    assert sched.end_frame() == pytest.approx(0.05)
+    assert sched.late_frames == 0
+
+
+def test_no_drift_when_sleep_oversleeps():
+    sched, clock = _scheduler("skip")
+    sched.begin_frame()
+    clock.now += 0.02
+    sleep = sched.end_frame()
+    clock.now += sleep + 0.004
+    assert sched.begin_frame() == pytest.approx(0.104)
+    clock.now += 0.02
+    assert sched.end_frame() == pytest.approx(0.076)
+
+
+def test_skip_policy_jumps_to_next_slot():
+    sched, clock = _scheduler("skip", max_dt=1.0)
+    sched.begin_frame()
+    clock.now += 0.25
+    assert sched.end_frame() == pytest.approx(0.05)
+    assert sched.late_frames == 1
+    assert sched.skipped == 2
+    clock.now += 0.05
+    assert sched.begin_frame() == pytest.approx(0.3)
+
+
+def test_catch_up_policy_runs_immediately_on_grid():
+    sched, clock = _scheduler("catch_up")
+    sched.begin_frame()
+    clock.now += 0.15
+    assert sched.end_frame() == 0.0
+    sched.begin_frame()
+    clock.now += 0.01
+    assert sched.end_frame() == pytest.approx(0.04)
+    assert sched.skipped == 0
+
+
+def test_catch_up_resyncs_when_too_far_behind():
+    sched, clock = _scheduler("catch_up", max_catch_up=3)
+    sched.begin_frame()
+    clock.now += 1.0
+    assert sched.end_frame() > 0.0
+    assert sched.skipped > 0
+
+
+def test_stretch_policy_restarts_schedule():
+    sched, clock = _scheduler("stretch")
+    sched.begin_frame()
+    clock.now += 0.15
+    assert sched.end_frame() == 0.0
+    sched.begin_frame()
+    clock.now += 0.01
+    assert sched.end_frame() == pytest.approx(0.09)
+
+
+def test_dt_is_real_elapsed_and_clamped():
+    sched, clock = _scheduler("stretch", max_dt=0.5)
+    sched.begin_frame()
+    clock.now += 0.2
+    sched.end_frame()
+    assert sched.begin_frame() == pytest.approx(0.2)
+    clock.now += 3.0
+    sched.end_frame()
+    assert sched.begin_frame() == pytest.approx(0.5)
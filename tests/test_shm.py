@@ -0,0 +1,147 @@
+import os
+import subprocess
+import sys
+
+import numpy as np
+import pygame
+import pytest
+
+from wideboy.config import Settings
+from wideboy.display.shm import SharedFrame, SharedMemoryDisplay
+
+
+@pytest.fixture
+def name():
+    return f"wideboy-test-{os.getpid()}"
+
+
+def _run(script):
+    env = {**os.environ, "PYGAME_HIDE_SUPPORT_PROMPT": "1"}
+    return subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, env=env)
+
+
+def _frame(color, size=(6, 3)):
+    surf = pygame.Surface(size, pygame.SRCALPHA)
+    surf.fill(color)
+    return surf
+
+
+def test_write_and_read(name):
+    writer = SharedFrame.create(name, 6, 3)
+    try:
+        surf = _frame((1, 2, 3))
+        surf.set_at((5, 2), (7, 8, 9))
+        writer.write(surf, 123.5)
+        assert writer.size == (6, 3)
+        frame, timestamp, pixels = writer.read()
+        assert (frame, timestamp) == (1, 123.5)
+        assert tuple(pixels[2, 5]) == (7, 8, 9)
+        assert tuple(writer.pixels[0, 0]) == (1, 2, 3)
+        assert writer.sequence == 2
+    finally:
+        writer.close()
+
+
+def test_reader_waits_for_writer_mid_frame(name):
+    writer = SharedFrame.create(name, 6, 3)
+    try:
+        writer._header[0]["sequence"] = 1
+        with pytest.raises(TimeoutError):
+            writer.read(timeout=0.01)
+    finally:
+        writer.close()
+
+
+def test_open_rejects_other_segments(name):
+    writer = SharedFrame.create(name, 6, 3)
+    try:
+        writer.shm.buf[:8] = b"NOTAWBSH"
+        out = _run(f"from wideboy.display.shm import SharedFrame\nSharedFrame.open({name!r})\n")
+        assert "ValueError" in out.stderr
+    finally:
+        writer.close()
+
+
+def test_external_process_reads_frame(name):
+    settings = Settings(display={"canvas": {"width": 6, "height": 3}}, shm={"name": name})
+    display = SharedMemoryDisplay(settings)
+    display.start()
+    try:
+        display.present(_frame((10, 20, 30)))
+        script = (
+            "from wideboy.display.shm import SharedFrame\n"
+            f"f = SharedFrame.open({name!r})\n"
+            "n, _, px = f.read()\n"
+            "print(n, *px[1, 1])\n"
+            "f.close()\n"
+        )
+        out = _run(script)
+        assert out.stdout.split() == ["1", "10", "20", "30"]
+        assert out.stderr == ""
+        display.present(_frame((0, 0, 0)))
+        assert np.all(display.frame.pixels == 0)
+    finally:
+        display.stop()
+    with pytest.raises(FileNotFoundError):
+        SharedFrame.open(name)
+
+
+def test_heartbeat_advances_across_unchanged_frames(name):
+    settings = Settings(display={"canvas": {"width": 6, "height": 3}}, shm={"name": name})
+    display = SharedMemoryDisplay(settings)
+    display.start()
+    try:
+        display.present(_frame((10, 20, 30)))
+        sequence = display.frame.sequence
+        beat = display.frame.heartbeat
+        assert beat == display.frame.read()[1]
+        for _ in range(3):
+            display.idle()
+            assert display.frame.heartbeat >= beat
+            beat = display.frame.heartbeat
+        assert display.frame.read()[0] == 1
+        assert display.frame.sequence == sequence
+        assert display.frame.heartbeat > display.frame.read()[1]
+    finally:
+        display.stop()
+
+
+def test_run_loop_signals_skipped_frames():
+    import asyncio
+
+    from wideboy.__main__ import DisplayState, run_loop
+    from wideboy.backgrounds.base import Background
+    from wideboy.display.null import NullDisplay
+    from wideboy.render.brightness import BrightnessManager
+
+    class Solid(Background):
+        def render(self, surface):
+            surface.fill((0, 0, 255))
+
+    class IdleCounting(NullDisplay):
+        idles = 0
+
+        def idle(self):
+            self.idles += 1
+
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    pygame.init()
+    display = IdleCounting()
+    state = DisplayState(None, {}, Solid(), [], BrightnessManager())
+    screen = pygame.Surface((6, 3), pygame.SRCALPHA)
+    asyncio.run(
+        run_loop(
+            screen,
+            display,
+            state,
+            None,
+            None,
+            Settings(),
+            False,
+            asyncio.Event(),
+            max_frames=4,
+            throttle=False,
+        )
+    )
+    assert display.frames == 1
+    assert display.idles == 3
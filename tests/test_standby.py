@@ -0,0 +1,128 @@
+import asyncio
+import os
+import threading
+import time
+
+import pygame
+
+from wideboy.__main__ import DisplayState, run_loop
+from wideboy.backgrounds.base import Background
+from wideboy.config import Settings
+from wideboy.core.standby import Standby
+from wideboy.display.null import NullDisplay
+from wideboy.render.brightness import BrightnessManager
+
+
+class CountingBackground(Background):
+    def __init__(self):
+        super().__init__()
+        self.updates = 0
+
+    def update(self, dt):
+        self.updates += 1
+
+    def render(self, surface):
+        surface.fill((0, 0, 255))
+
+
+class ClearingDisplay(NullDisplay):
+    def __init__(self):
+        super().__init__()
+        self.clears = 0
+
+    def clear(self):
+        self.clears += 1
+
+
+def _setup(**standby):
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    pygame.init()
+    settings = Settings(standby=standby)
+    state = DisplayState(None, {}, CountingBackground(), [], BrightnessManager())
+    screen = pygame.Surface((16, 8), pygame.SRCALPHA)
+    return settings, state, screen
+
+
+def test_wait_times_out():
+    async def main():
+        standby = Standby(interval=0.05)
+        standby.bind()
+        start = time.monotonic()
+        await standby.wait()
+        return time.monotonic() - start
+
+    assert asyncio.run(main()) >= 0.04
+
+
+def test_wake_from_another_thread_is_immediate():
+    async def main():
+        standby = Standby(interval=5.0)
+        standby.bind()
+        threading.Timer(0.05, standby.wake).start()
+        start = time.monotonic()
+        await standby.wait()
+        return time.monotonic() - start
+
+    assert asyncio.run(main()) < 1.0
+
+
+def test_standby_presents_one_black_frame_and_pauses_updates():
+    settings, state, screen = _setup(interval=0.02, clear=True)
+    state.master_on = False
+    display = ClearingDisplay()
+
+    async def main():
+        stop = asyncio.Event()
+        asyncio.get_running_loop().call_later(0.2, stop.set)
+        await run_loop(screen, display, state, None, None, settings, False, stop)
+
+    asyncio.run(main())
+    assert display.frames == 1
+    assert display.clears == 1
+    assert state.background.updates == 0
+    assert tuple(screen.get_at((0, 0)))[:3] == (0, 0, 0)
+    assert not state.standby.active
+    assert state.standby.entered == 1
+
+
+def test_wake_resumes_rendering():
+    settings, state, screen = _setup(interval=10.0)
+    state.master_on = False
+    display = ClearingDisplay()
+
+    def switch_on():
+        state.master_on = True
+        state.standby.wake()
+
+    async def main():
+        stop = asyncio.Event()
+        threading.Timer(0.1, switch_on).start()
+        start = time.monotonic()
+        await run_loop(screen, display, state, None, None, settings, False, stop, max_frames=3)
+        return time.monotonic() - start
+
+    elapsed = asyncio.run(main())
+    assert elapsed < 5.0
+    assert state.background.updates == 3
+    assert display.clears == 0
+    assert display.frames == 2
+
+
+def test_profile_capture_runs_while_in_standby(tmp_path):
+    from wideboy.perf.capture import ProfileCapture
+
+    settings, state, screen = _setup(interval=0.01)
+    state.master_on = False
+    done = threading.Event()
+    state.profile_capture = ProfileCapture(tmp_path, on_complete=lambda result: done.set())
+    state.profile_capture.request(0.05)
+
+    async def main():
+        stop = asyncio.Event()
+        asyncio.get_running_loop().call_later(0.5, stop.set)
+        await run_loop(screen, ClearingDisplay(), state, None, None, settings, False, stop)
+
+    asyncio.run(main())
+    assert done.wait(2.0)
+    assert state.profile_capture.status == "idle"
+    assert state.background.updates == 0
@@ -0,0 +1,34 @@
+import asyncio
+from types import SimpleNamespace
+
+from wideboy.perf.synthetic import SyntheticHomeAssistant, SyntheticNotifier
+
+
+def test_synthetic_ha_covers_all_entities():
+    ids = ["binary_sensor.door", "sensor.temp", "input_datetime.flea", "light.lamp"]
+    ha = SyntheticHomeAssistant(ids)
+    snap = ha.snapshot
+    assert set(snap) == set(ids)
+    assert snap["binary_sensor.door"]["state"] in ("on", "off")
+    float(snap["sensor.temp"]["state"])
+    assert "timestamp" in snap["input_datetime.flea"]["attributes"]
+
+
+def test_synthetic_ha_changes_over_time():
+    ha = SyntheticHomeAssistant([f"sensor.s{i}" for i in range(4)], change_interval=1)
+    first = ha.snapshot
+    later = [ha.snapshot for _ in range(10)][-1]
+    assert first != later
+
+
+def test_synthetic_notifier_reposts_when_cleared():
+    state = SimpleNamespace(notification=None)
+    notifier = SyntheticNotifier(duration=5.0)
+    asyncio.run(notifier.drain_commands(state))
+    first = state.notification
+    assert first["expire_time"] - first["received_at"] == 5.0
+    asyncio.run(notifier.drain_commands(state))
+    assert state.notification is first
+    state.notification = None
+    asyncio.run(notifier.drain_commands(state))
+    assert state.notification["text"] != first["text"]
@@ -0,0 +1,105 @@
+import json
+import threading
+import time
+
+from wideboy.perf.profiler import FrameProfiler
+from wideboy.perf.trace import Tracer, get_tracer, set_tracer, span
+
+
+def test_span_is_noop_without_tracer():
+    set_tracer(None)
+    with span("anything", "test"):
+        pass
+    assert get_tracer() is None
+
+
+def test_tracer_records_spans_with_thread_names(tmp_path):
+    tracer = Tracer(tmp_path / "trace.json", duration=0)
+    set_tracer(tracer)
+    tracer.start()
+    try:
+        with span("main-span", "test", answer=42):
+            pass
+
+        def worker():
+            with span("worker-span", "test"):
+                pass
+
+        t = threading.Thread(target=worker, name="worker-thread")
+        t.start()
+        t.join()
+    finally:
+        set_tracer(None)
+
+    assert tracer.write() == tmp_path / "trace.json"
+    events = json.loads((tmp_path / "trace.json").read_text())["traceEvents"]
+    spans = {e["name"]: e for e in events if e["ph"] == "X"}
+    assert spans["main-span"]["args"] == {"answer": 42}
+    assert spans["main-span"]["dur"] >= 0
+    names = {e["args"]["name"] for e in events if e["name"] == "thread_name"}
+    assert {"MainThread", "worker-thread"} <= names
+    assert spans["worker-span"]["tid"] != spans["main-span"]["tid"]
+
+
+def test_tracer_stops_after_window(tmp_path):
+    tracer = Tracer(tmp_path / "trace.json", duration=0.01)
+    tracer.start()
+    with tracer.span("first"):
+        pass
+    time.sleep(0.02)
+    with tracer.span("late"):
+        pass
+    assert tracer.active is False
+    with tracer.span("ignored"):
+        pass
+    for _ in range(100):
+        if (tmp_path / "trace.json").exists():
+            break
+        time.sleep(0.01)
+    events = json.loads((tmp_path / "trace.json").read_text())["traceEvents"]
+    assert "ignored" not in {e["name"] for e in events}
+
+
+def test_tracer_bounded_events(tmp_path):
+    tracer = Tracer(tmp_path / "trace.json", duration=0, max_events=3)
+    tracer.start()
+    for i in range(10):
+        with tracer.span(f"s{i}"):
+            pass
+    spans = [e["name"] for e in tracer.to_dict()["traceEvents"] if e["ph"] == "X"]
+    assert spans == ["s7", "s8", "s9"]
+
+
+def test_profiler_emits_stage_and_frame_spans(tmp_path):
+    tracer = Tracer(tmp_path / "trace.json", duration=0)
+    tracer.start()
+    prof = FrameProfiler(enabled=False, tracer=tracer)
+    prof.begin_frame()
+    prof.stage("background_render")
+    prof.stage("present")
+    prof.end_frame("plasma")
+    events = [e for e in tracer.to_dict()["traceEvents"] if e["ph"] == "X"]
+    assert [e["name"] for e in events] == ["background_render", "present", "frame"]
+    assert events[-1]["args"]["effect"] == "plasma"
+
+
+def test_ha_lock_is_traced(tmp_path):
+    from wideboy.services.homeassistant import HomeAssistantService
+
+    service = HomeAssistantService("localhost", 8123, "token", ["light.desk"])
+    tracer = Tracer(tmp_path / "trace.json", duration=0)
+    set_tracer(tracer)
+    tracer.start()
+    try:
+        service._handle_ws_message(
+            {"type": "event", "event": {"a": {"light.desk": {"s": "on", "a": {}}}}}
+        )
+    finally:
+        set_tracer(None)
+
+    tracer.write()
+    events = json.loads((tmp_path / "trace.json").read_text())["traceEvents"]
+    locks = [e for e in events if e["ph"] == "X" and e["name"] == "ha.lock"]
+    assert len(locks) == 1
+    assert locks[0]["cat"] == "ha"
+    assert service.snapshot["light.desk"]["state"] == "on"
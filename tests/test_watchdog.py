@@ -0,0 +1,62 @@
+from types import SimpleNamespace
+
+from wideboy.perf.profiler import FrameProfiler
+from wideboy.perf.watchdog import FrameWatchdog
+
+
+def _make(tmp_path, **kwargs):
+    profiler = FrameProfiler(enabled=False)
+    state = SimpleNamespace(background=SimpleNamespace(active_name="life"))
+    watchdog = FrameWatchdog(profiler, state, dump_dir=tmp_path, **kwargs)
+    return profiler, watchdog
+
+
+def _frame(profiler, stage="background_render"):
+    profiler.begin_frame()
+    profiler.stage(stage)
+    profiler.end_frame()
+
+
+def test_no_dump_before_first_frame(tmp_path):
+    _, watchdog = _make(tmp_path, threshold=1.0)
+    assert watchdog.check(now=watchdog._last_progress + 10) is False
+
+
+def test_stall_dumps_stacks_with_stage_and_effect(tmp_path):
+    profiler, watchdog = _make(tmp_path, threshold=1.0)
+    _frame(profiler)
+    watchdog.check(now=100.0)
+    profiler.begin_frame()
+    profiler.stage("background_render")
+    assert watchdog.check(now=100.5) is False
+    assert watchdog.check(now=101.5) is True
+    dumps = list(tmp_path.glob("stall-*.txt"))
+    assert len(dumps) == 1
+    text = dumps[0].read_text()
+    assert "stage=background_render" in text
+    assert "effect=life" in text
+    assert "Current thread" in text
+
+
+def test_stall_reported_once_until_recovered(tmp_path):
+    profiler, watchdog = _make(tmp_path, threshold=1.0, min_interval=0)
+    _frame(profiler)
+    watchdog.check(now=100.0)
+    assert watchdog.check(now=102.0) is True
+    assert watchdog.check(now=103.0) is False
+    _frame(profiler)
+    watchdog.check(now=103.5)
+    assert watchdog.check(now=105.0) is True
+    assert watchdog.stalls == 2
+
+
+def test_dumps_rate_limited(tmp_path):
+    profiler, watchdog = _make(tmp_path, threshold=1.0, min_interval=60.0)
+    _frame(profiler)
+    watchdog.check(now=100.0)
+    watchdog.check(now=102.0)
+    _frame(profiler)
+    watchdog.check(now=103.0)
+    assert watchdog.check(now=105.0) is True
+    assert watchdog.stalls == 2
+    assert len(list(tmp_path.glob("stall-*.txt"))) == 1